@@ -0,0 +1,689 @@
+"""
+Benchmarks do Simplex Tabulado.
+
+Gera famílias reprodutíveis de problemas de programação linear, resolve cada
+uma com o SimplexTabulado, com o scipy (linprog), com a decomposição de
+Dantzig–Wolfe, com pontos interiores e com o simplex de redes (quando A é
+de incidência) e registra tempo, iterações (rodadas, na decomposição),
+pivôs por segundo e pico de memória. Os resultados são gravados em JSON para
+permitir a comparação entre execuções.
+
+A memória é o acréscimo ao pico de RSS (ru_maxrss) de um processo filho
+criado para cada medida. Assim entram também as alocações nativas, como as do
+HiGHS no linprog, que o tracemalloc não enxerga. A decomposição resolve os
+subproblemas em outros processos, cuja memória ficaria de fora; ela aparece
+como não medida.
+
+Com --escalabilidade, mede o pivotamento em blocos de linhas de uma tabela
+alta com 1, 2, 4, ... threads e exibe o ganho em relação a uma thread.
+
+Com --modelagem, mede o tempo de montagem de c, A, b com 10^5 ou mais termos:
+listas aninhadas preenchidas termo a termo, a camada de modelagem com uma
+restrição por linha e com blocos `matriz @ x` (tabuladomodelo).
+
+Com --base-inicial, compara os pivôs e o tempo do simplex a partir da base
+das folgas e da base crash, inclusive em famílias com restrições ≥ e =.
+
+Uso:
+    python tabuladobenchmark.py
+    python tabuladobenchmark.py --familias densa klee_minty --saida bench.json
+    python tabuladobenchmark.py --comparar bench_anterior.json
+    python tabuladobenchmark.py --escalabilidade --linhas 5000 --threads 1 2 4
+    python tabuladobenchmark.py --modelagem --termos 100000 1000000
+    python tabuladobenchmark.py --base-inicial --familias esparsa mista
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import sys
+import time
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows: sem getrusage, a memória não é medida
+    resource = None
+
+import numpy as np
+import scipy
+from scipy import sparse
+from scipy.optimize import linprog
+from tabulate import tabulate
+
+from tabuladocore import SimplexTabulado
+from tabuladodecomposicao import DantzigWolfe
+from tabuladomodelo import Modelo
+from tabuladopontointerior import PontoInterior
+from tabuladorede import SimplexRede, detectar_rede
+
+# Exemplo do main(): Maximizar Z = 40x1 + 30x2 + 20x3
+C_EXEMPLO = np.array([-40.0, -30.0, -20.0])
+A_EXEMPLO = np.array([
+    [2.0, 5.0, 10.0],
+    [2.0, 5.0, 1.0],
+    [4.0, 2.0, 2.0]
+])
+B_EXEMPLO = np.array([900.0, 400.0, 600.0])
+
+
+# ---------------------------------------------------------------------------
+# Geradores de famílias de problemas
+#
+# Todos retornam (c, A, b) no formato esperado pelo SimplexTabulado:
+# maximização com os coeficientes de c negativos e restrições do tipo ≤.
+# ---------------------------------------------------------------------------
+
+def gerar_densa(tamanho, semente=0):
+    """Problema denso aleatório com `tamanho` restrições e variáveis."""
+    rng = np.random.default_rng(semente)
+    A = rng.uniform(1.0, 10.0, size=(tamanho, tamanho))
+    b = A.sum(axis=1) * rng.uniform(0.2, 0.6, size=tamanho)
+    c = -rng.uniform(1.0, 20.0, size=tamanho)
+    return c, A, b
+
+
+def gerar_esparsa(tamanho, semente=0, densidade=0.1):
+    """Problema esparso aleatório (cerca de `densidade` de elementos não nulos)."""
+    rng = np.random.default_rng(semente)
+    mascara = rng.random((tamanho, tamanho)) < densidade
+    # Garantir ao menos um coeficiente positivo por coluna (problema limitado)
+    mascara[rng.integers(0, tamanho, size=tamanho), np.arange(tamanho)] = True
+    A = np.where(mascara, rng.uniform(1.0, 10.0, size=(tamanho, tamanho)), 0.0)
+    b = rng.uniform(10.0, 100.0, size=tamanho)
+    c = -rng.uniform(1.0, 20.0, size=tamanho)
+    return c, A, b
+
+
+def gerar_klee_minty(tamanho, semente=0):
+    """Cubo de Klee–Minty: pior caso da regra de Dantzig (2^n - 1 pivôs)."""
+    n = tamanho
+    expoentes = np.arange(n)
+    # Maximizar sum 2^(n-j) x_j
+    c = -(2.0 ** (n - 1 - expoentes))
+    # Restrição i: sum_{j<i} 2^(i-j+1) x_j + x_i ≤ 5^i
+    diferenca = expoentes[:, None] - expoentes[None, :]
+    A = np.where(diferenca > 0, 2.0 ** (diferenca + 1), 0.0)
+    A[expoentes, expoentes] = 1.0
+    b = 5.0 ** (expoentes + 1)
+    return c, A, b
+
+
+def gerar_transporte(tamanho, semente=0, ofertas=None, demandas=None):
+    """
+    Problema de transporte com `tamanho` origens e `tamanho` destinos.
+
+    Como o SimplexTabulado só aceita restrições ≤ com b ≥ 0, o problema é
+    formulado como maximização do lucro com ofertas e demandas como limites
+    superiores: sum_j x_ij ≤ s_i e sum_i x_ij ≤ d_j.
+    """
+    rng = np.random.default_rng(semente)
+    m = n = tamanho
+    if ofertas is None:
+        ofertas = rng.integers(10, 100, size=m).astype(float)
+    if demandas is None:
+        demandas = rng.integers(10, 100, size=n).astype(float)
+    lucros = rng.uniform(1.0, 20.0, size=(m, n))
+
+    # Variável x_ij na coluna i*n + j
+    A = np.zeros((m + n, m * n))
+    colunas = np.arange(m * n)
+    A[colunas // n, colunas] = 1.0
+    A[m + colunas % n, colunas] = 1.0
+    b = np.concatenate([ofertas, demandas])
+    c = -lucros.ravel()
+    return c, A, b
+
+
+def gerar_designacao(tamanho, semente=0):
+    """Problema de designação (transporte com ofertas e demandas unitárias)."""
+    unitario = np.ones(tamanho)
+    return gerar_transporte(tamanho, semente, ofertas=unitario, demandas=unitario)
+
+
+def gerar_exemplo_escalado(tamanho, semente=0):
+    """`tamanho` cópias independentes do exemplo do main() em blocos diagonais."""
+    A = np.kron(np.eye(tamanho), A_EXEMPLO)
+    b = np.tile(B_EXEMPLO, tamanho)
+    c = np.tile(C_EXEMPLO, tamanho)
+    return c, A, b
+
+
+def gerar_cobertura(tamanho, semente=0):
+    """
+    Problema de cobertura com `tamanho` variáveis e 4 * `tamanho` restrições.
+
+    Minimizar c·x com A x ≥ b é escrito como maximizar -c·x com -A x ≤ -b: a
+    base de folgas é dual viável e primal inviável, o caso do simplex dual.
+    """
+    rng = np.random.default_rng(semente)
+    A = rng.uniform(1.0, 10.0, size=(4 * tamanho, tamanho))
+    b = rng.uniform(10.0, 100.0, size=4 * tamanho)
+    c = rng.uniform(1.0, 20.0, size=tamanho)
+    return c, -A, -b
+
+
+def gerar_bloco_angular(tamanho, semente=0, tamanho_bloco=8, ligacoes=3):
+    """
+    Problema bloco-angular com `tamanho` blocos densos de `tamanho_bloco` x
+    `tamanho_bloco`, ligados por `ligacoes` restrições de capacidade comuns.
+    """
+    rng = np.random.default_rng(semente)
+    n = tamanho * tamanho_bloco
+    A_blocos = np.zeros((n, n))
+    for k in range(tamanho):
+        faixa = slice(k * tamanho_bloco, (k + 1) * tamanho_bloco)
+        A_blocos[faixa, faixa] = rng.uniform(1.0, 10.0, size=(tamanho_bloco, tamanho_bloco))
+    b_blocos = A_blocos.sum(axis=1) * rng.uniform(0.2, 0.6, size=n)
+
+    A_ligacao = rng.uniform(0.0, 5.0, size=(ligacoes, n))
+    b_ligacao = A_ligacao.sum(axis=1) * 0.1
+    c = -rng.uniform(1.0, 20.0, size=n)
+    return c, np.vstack([A_ligacao, A_blocos]), np.concatenate([b_ligacao, b_blocos])
+
+
+def gerar_mista(tamanho, semente=0, densidade=0.1):
+    """
+    Problema esparso com restrições ≤, ≥ e = (retorna também os sentidos).
+
+    Os lados direitos partem de um ponto x0 ≥ 0, então o problema é viável, e
+    cada coluna tem um coeficiente positivo numa linha ≤, então é limitado.
+    """
+    rng = np.random.default_rng(semente)
+    sentidos = rng.choice(['<=', '>=', '='], size=tamanho, p=[0.5, 0.3, 0.2])
+    sentidos[0] = '<='
+    mascara = rng.random((tamanho, tamanho)) < densidade
+    mascara[rng.choice(np.flatnonzero(sentidos == '<='), size=tamanho), np.arange(tamanho)] = True
+    A = np.where(mascara, rng.uniform(1.0, 10.0, size=(tamanho, tamanho)), 0.0)
+    atividade = A @ rng.uniform(0.0, 5.0, size=tamanho)
+    b = np.select([sentidos == '<=', sentidos == '>='], [1.2 * atividade + 1.0, 0.8 * atividade], atividade)
+    c = -rng.uniform(1.0, 20.0, size=tamanho)
+    return c, A, b, list(sentidos)
+
+
+def gerar_transporte_balanceado(tamanho, semente=0):
+    """
+    Transporte clássico: minimizar o custo com ofertas e demandas atendidas
+    exatamente (restrições =, uma delas redundante). Retorna também os sentidos.
+    """
+    rng = np.random.default_rng(semente)
+    c, A, _ = gerar_transporte(tamanho, semente)
+    ofertas = rng.integers(10, 100, size=tamanho).astype(float)
+    demandas = rng.integers(10, 100, size=tamanho).astype(float)
+    demandas *= ofertas.sum() / demandas.sum()
+    return -c, A, np.concatenate([ofertas, demandas]), ['='] * (2 * tamanho)
+
+
+# Família -> (gerador, tamanhos padrão)
+FAMILIAS = {
+    'densa': (gerar_densa, [10, 20, 40]),
+    'esparsa': (gerar_esparsa, [10, 20, 40]),
+    'klee_minty': (gerar_klee_minty, [4, 6, 8]),
+    'transporte': (gerar_transporte, [4, 8, 16, 32]),
+    'designacao': (gerar_designacao, [4, 8, 16, 32]),
+    'exemplo_escalado': (gerar_exemplo_escalado, [1, 5, 10]),
+    'cobertura': (gerar_cobertura, [5, 10, 20]),
+    'bloco_angular': (gerar_bloco_angular, [2, 4, 8]),
+}
+
+# Famílias com restrições ≥ e = (o gerador retorna c, A, b, sentidos); usadas com --base-inicial
+FAMILIAS_GERAIS = {
+    'mista': (gerar_mista, [20, 40, 80]),
+    'transporte_balanceado': (gerar_transporte_balanceado, [4, 8, 16]),
+}
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def resolver_tabulado(c, A, b):
+    """Resolve com o SimplexTabulado sem exibir tabelas. Retorna (iterações, z, status)."""
+    solucao = SimplexTabulado(c, A, b).resolver_silencioso()
+    z = solucao['z'] if solucao['status'] == 'otimo' else None
+    return solucao['iteracoes'], z, solucao['status']
+
+
+def resolver_linprog(c, A, b):
+    """Resolve com o scipy (HiGHS). Retorna (iterações, z, status)."""
+    res = linprog(c=c, A_ub=A, b_ub=b, method='highs')
+    z = -res.fun if res.status == 0 else None
+    status = {0: 'otimo', 2: 'inviavel', 3: 'ilimitado'}.get(res.status, 'erro')
+    return res.nit, z, status
+
+
+def resolver_decomposicao(c, A, b):
+    """
+    Resolve por Dantzig–Wolfe (subproblemas em paralelo). Retorna (rodadas, z, status).
+
+    Problemas sem estrutura bloco-angular (ou com b negativo) são marcados
+    como 'nao_aplicavel'.
+    """
+    try:
+        decomposicao = DantzigWolfe(c, A, b)
+    except ValueError:
+        return 0, None, 'nao_aplicavel'
+    resultado = decomposicao.resolver()
+    z = resultado['z'] if resultado['status'] == 'otimo' else None
+    return resultado['rodadas'], z, resultado['status']
+
+
+def resolver_pontointerior(c, A, b):
+    """Resolve por pontos interiores com cruzamento. Retorna (iterações, z, status)."""
+    resultado = PontoInterior(c, A, b).resolver()
+    z = resultado['z'] if resultado['status'] == 'otimo' else None
+    return resultado['iteracoes'], z, resultado['status']
+
+
+def resolver_rede(c, A, b):
+    """
+    Resolve pelo simplex de redes (detecção incluída no tempo). Retorna (pivôs, z, status).
+
+    Problemas cuja matriz A não é de incidência de rede são marcados como
+    'nao_aplicavel'.
+    """
+    sinais = detectar_rede(A)
+    if sinais is None:
+        return 0, None, 'nao_aplicavel'
+    solucao = SimplexRede(c, A, b, sinais).resolver()
+    z = solucao['z'] if solucao['status'] == 'otimo' else None
+    return solucao['iteracoes'], z, solucao['status']
+
+
+# Resolvedores que trabalham em outros processos: o RSS do filho não os representa
+MEMORIA_NAO_MEDIDA = ('decomposicao',)
+
+RESOLVEDORES = {
+    'tabulado': resolver_tabulado,
+    'linprog': resolver_linprog,
+    'decomposicao': resolver_decomposicao,
+    'pontointerior': resolver_pontointerior,
+    'rede': resolver_rede,
+}
+
+
+def _pico_rss():
+    """Pico de RSS do processo atual em bytes (ru_maxrss é em KiB no Linux, em bytes no macOS)."""
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+def _medir_memoria(resolvedor, c, A, b, fila):
+    """Processo filho: resolve uma vez e envia o acréscimo ao pico de RSS."""
+    antes = _pico_rss()
+    resolvedor(c, A, b)
+    fila.put(_pico_rss() - antes)
+
+
+def pico_memoria(resolvedor, c, A, b):
+    """
+    Acréscimo ao pico de RSS de uma resolução, medido num processo filho novo.
+
+    Returns:
+        bytes, ou None sem o módulo resource ou se o filho falhou
+    """
+    if resource is None:
+        return None
+    # fork herda c, A, b sem cópia e sem reimportar os módulos (como no portfólio)
+    metodos = multiprocessing.get_all_start_methods()
+    contexto = multiprocessing.get_context('fork' if 'fork' in metodos else 'spawn')
+    fila = contexto.Queue()
+    processo = contexto.Process(target=_medir_memoria, args=(resolvedor, c, A, b, fila))
+    processo.start()
+    processo.join()
+    try:
+        return fila.get(timeout=1.0)
+    except queue.Empty:
+        return None
+    finally:
+        fila.close()
+
+
+def medir(resolvedor, c, A, b, repeticoes=3, medir_memoria=True):
+    """Mede tempo (melhor de `repeticoes`), iterações e pico de memória (None se medir_memoria=False)."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        iteracoes, z, status = resolvedor(c, A, b)
+        tempos.append(time.perf_counter() - inicio)
+    tempo = min(tempos)
+
+    # A memória é medida numa execução separada, num processo filho
+    pico = pico_memoria(resolvedor, c, A, b) if medir_memoria else None
+
+    return {
+        'tempo_s': tempo,
+        'iteracoes': int(iteracoes),
+        'pivos_por_segundo': iteracoes / tempo if tempo > 0 else None,
+        'memoria_pico_bytes': pico,
+        'z': None if z is None else float(z),
+        'status': status,
+    }
+
+
+def executar_benchmark(familias=None, tamanhos=None, resolvedores=None, repeticoes=3, semente=0):
+    """Executa as famílias pedidas e retorna a lista de resultados."""
+    familias = familias or list(FAMILIAS)
+    resolvedores = resolvedores or list(RESOLVEDORES)
+    resultados = []
+
+    for familia in familias:
+        gerador, tamanhos_padrao = FAMILIAS[familia]
+        for tamanho in tamanhos or tamanhos_padrao:
+            c, A, b = gerador(tamanho, semente)
+            for nome in resolvedores:
+                medida = medir(RESOLVEDORES[nome], c, A, b, repeticoes,
+                               medir_memoria=nome not in MEMORIA_NAO_MEDIDA)
+                medida.update({
+                    'familia': familia,
+                    'tamanho': tamanho,
+                    'restricoes': A.shape[0],
+                    'variaveis': A.shape[1],
+                    'resolvedor': nome,
+                })
+                resultados.append(medida)
+    return resultados
+
+
+def benchmark_escalabilidade(linhas, colunas, lista_threads, pivos=5, repeticoes=3, semente=0):
+    """
+    Mede o pivotamento paralelo de uma tabela alta com cada número de threads.
+
+    Args:
+        linhas, colunas: dimensões de A (a tabela tem linhas + 1 linhas e
+            colunas + linhas + 1 colunas, por causa das folgas)
+        lista_threads: números de threads a medir
+        pivos: pivôs por medida
+        repeticoes: repetições por medida (usa o melhor tempo)
+
+    Returns:
+        lista de resultados com tempo por pivô, ganho e eficiência
+    """
+    rng = np.random.default_rng(semente)
+    A = rng.uniform(1, 10, size=(linhas, colunas))
+    simplex = SimplexTabulado(-np.ones(colunas), A, rng.uniform(10, 100, size=linhas))
+    tabela_inicial = simplex.tabela.copy()
+    base_inicial = simplex.base.copy()
+
+    resultados = []
+    for threads in lista_threads:
+        simplex.threads = threads
+        tempos = []
+        for _ in range(repeticoes):
+            simplex.tabela = tabela_inicial.copy()
+            simplex.definir_base(base_inicial)
+            inicio = time.perf_counter()
+            for k in range(pivos):
+                simplex.pivotar(k, k % colunas)
+            tempos.append(time.perf_counter() - inicio)
+        resultados.append({'threads': threads, 'tempo_pivo_s': min(tempos) / pivos})
+
+    referencia = resultados[0]['tempo_pivo_s'] * resultados[0]['threads']
+    for r in resultados:
+        r['ganho'] = referencia / r['tempo_pivo_s']
+        r['eficiencia'] = r['ganho'] / r['threads']
+    return resultados
+
+
+def exibir_escalabilidade(resultados, linhas, colunas):
+    print(f"Tabela {linhas + 1}x{colunas + linhas + 1} ({os.cpu_count()} CPUs)\n")
+    headers = ["Threads", "Tempo/pivô (ms)", "Ganho", "Eficiência"]
+    tabela = [[r['threads'], f"{r['tempo_pivo_s'] * 1e3:.2f}", f"{r['ganho']:.2f}x",
+               f"{r['eficiencia']:.0%}"] for r in resultados]
+    print(tabulate(tabela, headers=headers, tablefmt="grid", stralign="center"))
+
+
+def _montar_listas(custos, matriz, limites):
+    """Montagem à mão, como em obter_dados_usuario: listas aninhadas preenchidas termo a termo."""
+    m, n = matriz.shape
+    A = [[0.0] * n for _ in range(m)]
+    for i, j, valor in zip(matriz.row.tolist(), matriz.col.tolist(), matriz.data.tolist()):
+        A[i][j] = valor
+    c = [-valor for valor in custos.tolist()]
+    b = [valor for valor in limites.tolist()]
+    return np.array(c), np.array(A), np.array(b)
+
+
+def _montar_por_restricao(custos, matriz, limites):
+    """Camada de modelagem com uma restrição (Expressao) por linha."""
+    modelo = Modelo()
+    x = modelo.variaveis('x', matriz.shape[1])
+    modelo.maximizar(custos @ x)
+    for i in range(matriz.shape[0]):
+        inicio, fim = matriz.indptr[i], matriz.indptr[i + 1]
+        modelo.adicionar(matriz.data[inicio:fim] @ x[matriz.indices[inicio:fim]] <= limites[i])
+    return modelo.compilar(esparso=True)
+
+
+def _montar_bloco(custos, matriz, limites, esparso=True):
+    """Camada de modelagem com um único bloco matriz @ x."""
+    modelo = Modelo()
+    x = modelo.variaveis('x', matriz.shape[1])
+    modelo.maximizar(custos @ x)
+    modelo.adicionar(matriz @ x <= limites)
+    return modelo.compilar(esparso=esparso)
+
+
+MONTAGENS = {
+    'listas': lambda custos, matriz, limites: _montar_listas(custos, matriz.tocoo(), limites),
+    'modelo_por_linha': lambda custos, matriz, limites: _montar_por_restricao(custos, matriz.tocsr(), limites),
+    'modelo_bloco': _montar_bloco,
+    'modelo_bloco_denso': lambda custos, matriz, limites: _montar_bloco(custos, matriz, limites, esparso=False),
+}
+
+
+def benchmark_modelagem(lista_termos, repeticoes=3, semente=0, densidade=0.02):
+    """
+    Mede a montagem de c, A, b por listas Python e pela camada de modelagem.
+
+    Args:
+        lista_termos: números de termos não nulos de A (um problema quadrado por valor)
+        repeticoes: repetições por medida (usa o melhor tempo)
+        densidade: fração de não nulos de A
+
+    Returns:
+        lista de resultados com tempo e termos por segundo de cada montagem
+    """
+    rng = np.random.default_rng(semente)
+    resultados = []
+    for termos in lista_termos:
+        tamanho = int(np.ceil(np.sqrt(termos / densidade)))
+        matriz = sparse.random(tamanho, tamanho, density=termos / tamanho ** 2, format='csr',
+                               random_state=rng, data_rvs=lambda k: rng.uniform(1.0, 10.0, k))
+        custos = rng.uniform(1.0, 20.0, tamanho)
+        limites = rng.uniform(100.0, 1000.0, tamanho)
+        referencia = None
+        for nome, montar in MONTAGENS.items():
+            tempos = []
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                c, A, b = montar(custos, matriz, limites)
+                tempos.append(time.perf_counter() - inicio)
+            denso = A.toarray() if sparse.issparse(A) else A
+            if referencia is None:
+                referencia = (c, denso, b)
+            elif not all(np.array_equal(x, y) for x, y in zip(referencia, (c, denso, b))):
+                raise AssertionError(f"A montagem {nome} gerou arrays diferentes.")
+            resultados.append({'montagem': nome, 'termos': matriz.nnz, 'tamanho': tamanho,
+                               'tempo_s': min(tempos), 'termos_por_segundo': matriz.nnz / min(tempos)})
+    return resultados
+
+
+def exibir_modelagem(resultados):
+    headers = ["Termos", "m x n", "Montagem", "Tempo (ms)", "Termos/s", "Ganho sobre listas"]
+    listas = {r['termos']: r['tempo_s'] for r in resultados if r['montagem'] == 'listas'}
+    tabela = [[r['termos'], f"{r['tamanho']}x{r['tamanho']}", r['montagem'], f"{r['tempo_s'] * 1e3:.1f}",
+               f"{r['termos_por_segundo']:.2e}", f"{listas[r['termos']] / r['tempo_s']:.1f}x"]
+              for r in resultados]
+    print(tabulate(tabela, headers=headers, tablefmt="grid", stralign="center"))
+
+
+def benchmark_base_inicial(familias=None, tamanhos=None, repeticoes=3, semente=0):
+    """
+    Resolve cada problema a partir da base das folgas e da base crash.
+
+    Args:
+        familias: nomes de FAMILIAS ou FAMILIAS_GERAIS (padrão: esparsa,
+            transporte, cobertura e as famílias gerais)
+        tamanhos: tamanhos a usar em todas as famílias
+        repeticoes: repetições por medida (usa o melhor tempo)
+
+    Returns:
+        lista de resultados com pivôs, pivôs do crash, tempo e Z de cada base inicial
+    """
+    todas = {**FAMILIAS, **FAMILIAS_GERAIS}
+    familias = familias or ['esparsa', 'transporte', 'cobertura', *FAMILIAS_GERAIS]
+    resultados = []
+    for familia in familias:
+        gerador, tamanhos_padrao = todas[familia]
+        for tamanho in tamanhos or tamanhos_padrao:
+            c, A, b, *sentidos = gerador(tamanho, semente)
+            sentidos = sentidos[0] if sentidos else None
+            for base_inicial in ('folgas', 'crash'):
+                tempos = []
+                for _ in range(repeticoes):
+                    inicio = time.perf_counter()
+                    simplex = SimplexTabulado(c, A, b, sentidos=sentidos, base_inicial=base_inicial)
+                    solucao = simplex.resolver_silencioso()
+                    tempos.append(time.perf_counter() - inicio)
+                resultados.append({
+                    'familia': familia, 'tamanho': tamanho, 'restricoes': A.shape[0], 'variaveis': A.shape[1],
+                    'base_inicial': base_inicial, 'pivos': solucao['iteracoes'], 'pivos_crash': simplex.pivos_crash,
+                    'tempo_s': min(tempos), 'status': solucao['status'],
+                    'z': float(solucao['z']) if solucao['status'] == 'otimo' else None,
+                })
+    return resultados
+
+
+def exibir_base_inicial(resultados):
+    """Tabela com os pivôs e tempos das duas bases iniciais lado a lado."""
+    headers = ["Família", "Tamanho", "m x n", "Pivôs (folgas)", "Pivôs (crash)", "Colunas do crash",
+               "Pivôs poupados", "Tempo folgas (ms)", "Tempo crash (ms)", "Z"]
+    linhas = []
+    for folgas, crash in zip(resultados[::2], resultados[1::2]):
+        poupados = folgas['pivos'] - crash['pivos']
+        fracao = f" ({poupados / folgas['pivos']:.0%})" if folgas['pivos'] else ""
+        mesmo_z = (folgas['z'] is None and crash['z'] is None) or (
+            folgas['z'] is not None and crash['z'] is not None
+            and abs(folgas['z'] - crash['z']) <= 1e-6 * (1 + abs(folgas['z'])))
+        z = folgas['status'] if folgas['z'] is None else f"{folgas['z']:.2f}"
+        linhas.append([folgas['familia'], folgas['tamanho'], f"{folgas['restricoes']}x{folgas['variaveis']}",
+                       folgas['pivos'], crash['pivos'], crash['pivos_crash'], f"{poupados}{fracao}",
+                       f"{folgas['tempo_s'] * 1e3:.1f}", f"{crash['tempo_s'] * 1e3:.1f}",
+                       z if mesmo_z else f"{z} (crash: {crash['z']})"])
+    print(tabulate(linhas, headers=headers, tablefmt="grid", stralign="center"))
+
+
+def metadados(semente, repeticoes):
+    """Informações do ambiente para tornar as execuções comparáveis."""
+    return {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'plataforma': platform.platform(),
+        'semente': semente,
+        'repeticoes': repeticoes,
+    }
+
+
+def salvar_resultados(caminho, resultados, meta):
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump({'metadados': meta, 'resultados': resultados}, arquivo, indent=2, ensure_ascii=False)
+
+
+def carregar_resultados(caminho):
+    with open(caminho, encoding='utf-8') as arquivo:
+        return json.load(arquivo)['resultados']
+
+
+def exibir_resultados(resultados, anteriores=None):
+    """Exibe uma tabela resumo; com `anteriores`, inclui a razão de tempo."""
+    chave = lambda r: (r['familia'], r['tamanho'], r['resolvedor'])
+    referencia = {chave(r): r for r in anteriores or []}
+
+    headers = ["Família", "Tamanho", "m x n", "Resolvedor", "Tempo (ms)",
+               "Iterações", "Pivôs/s", "Pico RSS (KiB)", "Z"]
+    if anteriores is not None:
+        headers.append("Tempo/anterior")
+
+    linhas = []
+    for r in resultados:
+        pivos = r['pivos_por_segundo']
+        linha = [
+            r['familia'], r['tamanho'], f"{r['restricoes']}x{r['variaveis']}", r['resolvedor'],
+            f"{r['tempo_s'] * 1e3:.2f}", r['iteracoes'],
+            "--" if pivos is None else f"{pivos:.0f}",
+            "--" if r['memoria_pico_bytes'] is None else f"{r['memoria_pico_bytes'] / 1024:.1f}",
+            r['status'] if r['z'] is None else f"{r['z']:.2f}",
+        ]
+        if anteriores is not None:
+            anterior = referencia.get(chave(r))
+            linha.append(f"{r['tempo_s'] / anterior['tempo_s']:.2f}x" if anterior else "--")
+        linhas.append(linha)
+
+    print(tabulate(linhas, headers=headers, tablefmt="grid", stralign="center"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks do Simplex Tabulado")
+    parser.add_argument('--familias', nargs='+', choices=list(FAMILIAS) + list(FAMILIAS_GERAIS),
+                        help="famílias a executar (padrão: todas; as gerais só com --base-inicial)")
+    parser.add_argument('--tamanhos', nargs='+', type=int, help="tamanhos a usar em todas as famílias")
+    parser.add_argument('--resolvedores', nargs='+', choices=list(RESOLVEDORES), help="resolvedores a comparar")
+    parser.add_argument('--repeticoes', type=int, default=3, help="repetições por medida (usa o melhor tempo)")
+    parser.add_argument('--semente', type=int, default=0, help="semente dos geradores aleatórios")
+    parser.add_argument('--saida', default='bench_resultados.json', help="arquivo JSON de saída")
+    parser.add_argument('--comparar', help="JSON de uma execução anterior para comparação")
+    parser.add_argument('--escalabilidade', action='store_true', help="mede o pivotamento paralelo por número de threads")
+    parser.add_argument('--linhas', type=int, default=3000, help="restrições da tabela do teste de escalabilidade")
+    parser.add_argument('--colunas', type=int, default=20, help="variáveis da tabela do teste de escalabilidade")
+    parser.add_argument('--threads', nargs='+', type=int, help="threads a medir (padrão: 1, 2, 4, ... até o número de CPUs)")
+    parser.add_argument('--modelagem', action='store_true', help="mede a montagem de c, A, b (tabuladomodelo)")
+    parser.add_argument('--termos', nargs='+', type=int, default=[100000, 1000000],
+                        help="termos não nulos de A no teste de modelagem")
+    parser.add_argument('--base-inicial', action='store_true',
+                        help="compara os pivôs a partir da base das folgas e da base crash")
+    args = parser.parse_args()
+
+    # Os resolvedores comparados aceitam apenas restrições ≤: as famílias gerais só entram em --base-inicial
+    gerais = [familia for familia in args.familias or [] if familia in FAMILIAS_GERAIS]
+    if gerais and not args.base_inicial:
+        parser.error(f"famílias com restrições ≥ e = ({', '.join(gerais)}) só podem ser usadas com --base-inicial")
+
+    if args.base_inicial:
+        print("\n==== BASE INICIAL: FOLGAS x CRASH ====\n")
+        exibir_base_inicial(benchmark_base_inicial(args.familias, args.tamanhos, args.repeticoes, args.semente))
+        return
+
+    if args.modelagem:
+        print("\n==== MONTAGEM DO MODELO ====\n")
+        exibir_modelagem(benchmark_modelagem(args.termos, args.repeticoes, args.semente))
+        return
+
+    if args.escalabilidade:
+        print("\n==== ESCALABILIDADE DO PIVOTAMENTO ====\n")
+        cpus = os.cpu_count() or 1
+        lista_threads = args.threads or [2 ** k for k in range(cpus.bit_length()) if 2 ** k <= cpus]
+        if cpus not in lista_threads and not args.threads:
+            lista_threads.append(cpus)
+        resultados = benchmark_escalabilidade(args.linhas, args.colunas, lista_threads,
+                                              repeticoes=args.repeticoes, semente=args.semente)
+        exibir_escalabilidade(resultados, args.linhas, args.colunas)
+        return
+
+    print("\n==== BENCHMARK - SIMPLEX TABULADO ====\n")
+    resultados = executar_benchmark(args.familias, args.tamanhos, args.resolvedores,
+                                    args.repeticoes, args.semente)
+
+    anteriores = carregar_resultados(args.comparar) if args.comparar else None
+    exibir_resultados(resultados, anteriores)
+
+    salvar_resultados(args.saida, resultados, metadados(args.semente, args.repeticoes))
+    print(f"\nResultados salvos em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Cache de soluções do Simplex Tabulado.
+
+As entradas são endereçadas pelo conteúdo: a chave é o SHA-256 dos arrays
+c, A e b canonizados (float64 contíguo, -0.0 normalizado para 0.0, com as
+dimensões) e das opções de resolução. Há um nível em memória, limitado e
+com descarte LRU, e um nível opcional em disco, que sobrevive entre
+execuções e é compartilhado entre processos. O nível em memória é limitado
+pelo número de entradas e pelos bytes dos arrays guardados (a interface web
+guarda a tabela de cada passo).
+
+No disco cada entrada é um .npz: os arrays vão como arrays, e o restante
+(textos, números, listas e dicionários) vai como JSON dentro do mesmo
+arquivo. A leitura usa allow_pickle=False, então um arquivo colocado no
+diretório do cache não consegue executar código.
+
+Cada entrada guarda o estado final do simplex (tabela, base, status e
+iterações), de modo que um acerto restaura um SimplexTabulado resolvido,
+com solução, sensibilidade e reotimização disponíveis. Quem usa o cache pode
+acrescentar dados à entrada (a interface web guarda os passos exibidos).
+
+Uso:
+    cache = CacheSolucoes(capacidade=256, limite_bytes=256 * 2**20, diretorio='.cache_simplex')
+    simplex = cache.resolver(c, A, b)
+    print(cache.estatisticas())
+"""
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from tabuladocore import SimplexTabulado
+
+# Diretório do cache compartilhado por terminal, interface web e serviço
+DIRETORIO_PADRAO = os.path.join(os.path.expanduser('~'), '.cache', 'simplex_tabulado')
+
+EXTENSAO = '.npz'
+
+# Marca, no JSON de uma entrada em disco, o lugar de um array guardado à parte
+MARCA_ARRAY = '__array__'
+
+
+def chave_problema(c, A, b, **opcoes):
+    """
+    Calcula a chave de conteúdo de um problema.
+
+    Args:
+        c, A, b: problema no formato do SimplexTabulado
+        opcoes: opções que mudam a resolução (por exemplo, algoritmo='dual')
+
+    Returns:
+        SHA-256 em hexadecimal
+    """
+    resumo = hashlib.sha256()
+    for array in (c, A, b):
+        # + 0.0 transforma -0.0 em 0.0, que têm bytes diferentes
+        canonico = np.ascontiguousarray(np.asarray(array, dtype=np.float64)) + 0.0
+        resumo.update(str(canonico.shape).encode())
+        resumo.update(canonico.tobytes())
+    resumo.update(json.dumps(opcoes, sort_keys=True).encode())
+    return resumo.hexdigest()
+
+
+def entrada_de(simplex):
+    """Estado final de um SimplexTabulado resolvido, no formato das entradas do cache."""
+    solucao = simplex.obter_solucao()
+    return {
+        'solucao': solucao,
+        'tabela': simplex.tabela.copy(),
+        'base': simplex.base.copy(),
+        'algoritmo_atual': simplex.algoritmo_atual,
+    }
+
+
+def restaurar(entrada, c, A, b, algoritmo='auto', classe=SimplexTabulado):
+    """Cria um SimplexTabulado (ou subclasse `classe`) no estado final guardado na entrada."""
+    simplex = classe(c, A, b, algoritmo=algoritmo)
+    simplex.tabela = entrada['tabela'].copy()
+    # Inviável pela Fase I: a tabela guardada mantém as colunas artificiais
+    simplex.num_total_vars = simplex.tabela.shape[1] - 1
+    simplex.definir_base(entrada['base'])
+    simplex.status = entrada['solucao']['status']
+    simplex.iteracao = entrada['solucao']['iteracoes']
+    simplex.algoritmo_atual = entrada['algoritmo_atual']
+    return simplex
+
+
+def _separar(valor, arrays):
+    """Troca os arrays de `valor` por marcas (guardando-os em `arrays`) e retorna a parte JSON."""
+    if isinstance(valor, np.ndarray) and valor.dtype != object:
+        nome = f"a{len(arrays)}"
+        arrays[nome] = valor
+        return {MARCA_ARRAY: nome}
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, dict):
+        return {str(chave): _separar(item, arrays) for chave, item in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_separar(item, arrays) for item in valor]
+    return valor
+
+
+def _juntar(valor, arrays):
+    """Inverso de _separar: recoloca os arrays nas marcas."""
+    if isinstance(valor, dict):
+        if set(valor) == {MARCA_ARRAY}:
+            return arrays[valor[MARCA_ARRAY]]
+        return {chave: _juntar(item, arrays) for chave, item in valor.items()}
+    if isinstance(valor, list):
+        return [_juntar(item, arrays) for item in valor]
+    return valor
+
+
+def bytes_da_entrada(entrada):
+    """Bytes dos arrays de uma entrada (o que pesa na memória)."""
+    arrays = {}
+    _separar(entrada, arrays)
+    return sum(array.nbytes for array in arrays.values())
+
+
+class CacheSolucoes:
+    def __init__(self, capacidade=256, diretorio=None, limite_bytes=256 * 2**20):
+        """
+        Cria o cache.
+
+        Args:
+            capacidade: número máximo de entradas em memória (LRU)
+            diretorio: diretório do nível em disco (None: apenas memória)
+            limite_bytes: bytes de arrays em memória; as entradas menos usadas
+                são descartadas acima disso, e uma entrada maior que o limite
+                fica só no disco
+        """
+        self.capacidade = capacidade
+        self.limite_bytes = limite_bytes
+        self.diretorio = diretorio
+        if diretorio is not None:
+            os.makedirs(diretorio, exist_ok=True)
+        self.memoria = OrderedDict()
+        self.tamanhos = {}
+        self.bytes_memoria = 0
+        # A interface web compartilha o cache entre sessões (threads)
+        self._trava = threading.Lock()
+        self.contadores = {'acertos_memoria': 0, 'acertos_disco': 0, 'falhas': 0, 'descartes': 0}
+
+    def _caminho(self, chave):
+        return os.path.join(self.diretorio, f"{chave}{EXTENSAO}")
+
+    def _remover_memoria(self, chave):
+        if chave in self.memoria:
+            del self.memoria[chave]
+            self.bytes_memoria -= self.tamanhos.pop(chave)
+
+    def _guardar_memoria(self, chave, entrada):
+        self._remover_memoria(chave)
+        tamanho = bytes_da_entrada(entrada)
+        if tamanho > self.limite_bytes:
+            return
+        self.memoria[chave] = entrada
+        self.tamanhos[chave] = tamanho
+        self.bytes_memoria += tamanho
+        while len(self.memoria) > self.capacidade or self.bytes_memoria > self.limite_bytes:
+            self._remover_memoria(next(iter(self.memoria)))
+            self.contadores['descartes'] += 1
+
+    def _ler_disco(self, chave):
+        """Lê a entrada do disco (sem pickle); levanta FileNotFoundError se não existe."""
+        with np.load(self._caminho(chave), allow_pickle=False) as dados:
+            arrays = {nome: dados[nome] for nome in dados.files if nome != 'json'}
+            return _juntar(json.loads(str(dados['json'])), arrays)
+
+    def _escrever_disco(self, chave, entrada):
+        """Grava a entrada no disco de forma atômica (arquivo temporário + os.replace)."""
+        arrays = {}
+        parte_json = json.dumps(_separar(entrada, arrays))
+        descritor, temporario = tempfile.mkstemp(dir=self.diretorio, suffix='.tmp')
+        try:
+            with os.fdopen(descritor, 'wb') as arquivo:
+                np.savez(arquivo, json=np.array(parte_json), **arrays)
+            os.replace(temporario, self._caminho(chave))
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temporario)
+            raise
+
+    def obter(self, chave):
+        """Retorna a entrada da chave (memória, depois disco) ou None."""
+        with self._trava:
+            if chave in self.memoria:
+                self.memoria.move_to_end(chave)
+                self.contadores['acertos_memoria'] += 1
+                return self.memoria[chave]
+
+            if self.diretorio is not None:
+                try:
+                    entrada = self._ler_disco(chave)
+                except FileNotFoundError:
+                    pass
+                except Exception:
+                    # Arquivo corrompido: descartar e tratar como falha (outro
+                    # processo pode tê-lo removido antes)
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(self._caminho(chave))
+                else:
+                    self.contadores['acertos_disco'] += 1
+                    self._guardar_memoria(chave, entrada)
+                    return entrada
+
+            self.contadores['falhas'] += 1
+            return None
+
+    def guardar(self, chave, entrada):
+        """Guarda a entrada na memória e, se configurado, no disco (escrita atômica)."""
+        with self._trava:
+            self._guardar_memoria(chave, entrada)
+        if self.diretorio is not None:
+            self._escrever_disco(chave, entrada)
+
+    def invalidar(self, chave=None):
+        """Remove a entrada da chave, ou todas as entradas se chave for None."""
+        with self._trava:
+            chaves = list(self.memoria) if chave is None else [chave]
+            for item in chaves:
+                self._remover_memoria(item)
+            if self.diretorio is None:
+                return
+            if chave is None:
+                chaves = [nome[:-len(EXTENSAO)] for nome in os.listdir(self.diretorio) if nome.endswith(EXTENSAO)]
+            for item in chaves:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(self._caminho(item))
+
+    def resolver(self, c, A, b, algoritmo='auto'):
+        """
+        Retorna um SimplexTabulado resolvido, restaurado do cache quando possível.
+
+        Com algoritmo='dual' e uma base inicial que não é dual viável, levanta
+        ValueError como o SimplexTabulado e nada é guardado.
+        """
+        chave = chave_problema(c, A, b, algoritmo=algoritmo)
+        entrada = self.obter(chave)
+        if entrada is not None:
+            return restaurar(entrada, c, A, b, algoritmo)
+
+        simplex = SimplexTabulado(c, A, b, algoritmo=algoritmo)
+        simplex.resolver_silencioso()
+        self.guardar(chave, entrada_de(simplex))
+        return simplex
+
+    def estatisticas(self):
+        """Retorna acertos por nível, falhas, descartes, ocupação da memória e taxa de acerto."""
+        consultas = sum(self.contadores[nome] for nome in ('acertos_memoria', 'acertos_disco', 'falhas'))
+        acertos = self.contadores['acertos_memoria'] + self.contadores['acertos_disco']
+        return {
+            **self.contadores,
+            'entradas_memoria': len(self.memoria),
+            'capacidade': self.capacidade,
+            'bytes_memoria': self.bytes_memoria,
+            'limite_bytes': self.limite_bytes,
+            'taxa_acerto': acertos / consultas if consultas else None,
+        }
+
+
+_CACHE_COMPARTILHADO = None
+
+
+def cache_compartilhado(diretorio=DIRETORIO_PADRAO):
+    """Cache com nível em disco compartilhado por terminal, interface web e serviço."""
+    global _CACHE_COMPARTILHADO
+    if _CACHE_COMPARTILHADO is None:
+        _CACHE_COMPARTILHADO = CacheSolucoes(diretorio=diretorio)
+    return _CACHE_COMPARTILHADO
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cache de soluções do Simplex Tabulado")
+    parser.add_argument('--diretorio', default=DIRETORIO_PADRAO, help="diretório do cache em disco")
+    parser.add_argument('--limpar', action='store_true', help="remove todas as entradas")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.diretorio):
+        print(f"Cache vazio ({args.diretorio} não existe).")
+        return
+    cache = CacheSolucoes(diretorio=args.diretorio)
+    entradas = [nome for nome in os.listdir(args.diretorio) if nome.endswith(EXTENSAO)]
+    if args.limpar:
+        cache.invalidar()
+        print(f"{len(entradas)} entradas removidas de {args.diretorio}")
+    else:
+        tamanho = sum(os.path.getsize(os.path.join(args.diretorio, nome)) for nome in entradas)
+        print(f"{len(entradas)} entradas em {args.diretorio} ({tamanho / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+Checkpoints de resoluções longas do Simplex Tabulado.
+
+Um Checkpoint anexado ao SimplexTabulado grava periodicamente a base e o
+número de iterações (e, opcionalmente, a tabela) num arquivo .npz. A
+escrita é atômica: o arquivo é gravado ao lado do destino e renomeado com
+os.replace, então uma interrupção durante a gravação nunca deixa um
+checkpoint corrompido. Uma interrupção da resolução (Ctrl-C) ou uma parada
+por limite (tempo_limite, max_iteracoes) também grava a base. Durante a
+Fase I nada é gravado: a base ainda contém variáveis artificiais, que não
+existem no problema original.
+
+Para retomar, retomar() reconstrói a tabela a partir de c, A, b originais e
+da base gravada (B^-1 [A I | b], ver SimplexTabulado.reconstruir_tabela) e
+devolve o simplex pronto para continuar de onde parou.
+
+Uso:
+    checkpoint = Checkpoint('resolucao.npz', intervalo_iteracoes=500)
+    simplex = SimplexTabulado(c, A, b, checkpoint=checkpoint)
+    simplex.resolver_silencioso()
+
+    # Depois de uma interrupção:
+    simplex = retomar('resolucao.npz', c, A, b, checkpoint=checkpoint)
+    simplex.resolver_silencioso()
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from tabuladocache import chave_problema
+from tabuladocore import SimplexTabulado
+
+# Tipos de passo que encerram a resolução
+PASSOS_FINAIS = ('final', 'ilimitado', 'inviavel')
+
+
+def chave_checkpoint(simplex):
+    """
+    Chave do problema de um SimplexTabulado, gravada no checkpoint.
+
+    Os sentidos das restrições fazem parte da chave quando há alguma ≥ ou =
+    (só com ≤ a chave é a mesma de chave_problema(c, A, b)).
+    """
+    if np.all(simplex.sentidos == '<='):
+        return chave_problema(simplex.c, simplex.A, simplex.b)
+    return chave_problema(simplex.c, simplex.A, simplex.b, sentidos=simplex.sentidos.tolist())
+
+
+def salvar_checkpoint(caminho, simplex, chave, incluir_tabela=False):
+    """
+    Grava o estado do simplex em `caminho` (.npz) de forma atômica.
+
+    Args:
+        caminho: arquivo de destino
+        simplex: SimplexTabulado em resolução
+        chave: chave do problema (chave_checkpoint), conferida ao retomar
+        incluir_tabela: se True, grava também a tabela (retomada sem reconstrução)
+    """
+    dados = {
+        'chave': np.array(chave),
+        'base': np.asarray(simplex.base),
+        'iteracao': np.array(simplex.iteracao),
+        'algoritmo': np.array(simplex.algoritmo_atual or ''),
+    }
+    if incluir_tabela:
+        dados['tabela'] = simplex.tabela
+
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+    descritor, temporario = tempfile.mkstemp(dir=diretorio, suffix='.tmp')
+    try:
+        with os.fdopen(descritor, 'wb') as arquivo:
+            np.savez(arquivo, **dados)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, caminho)
+    except BaseException:
+        os.remove(temporario)
+        raise
+
+
+def carregar_checkpoint(caminho):
+    """Lê um checkpoint e retorna um dicionário com 'chave', 'base', 'iteracao', 'algoritmo' e 'tabela' (ou None)."""
+    with np.load(caminho, allow_pickle=False) as dados:
+        return {
+            'chave': str(dados['chave']),
+            'base': dados['base'],
+            'iteracao': int(dados['iteracao']),
+            'algoritmo': str(dados['algoritmo']) or None,
+            'tabela': dados['tabela'] if 'tabela' in dados else None,
+        }
+
+
+def retomar(caminho, c, A, b, **opcoes):
+    """
+    Recria o SimplexTabulado no ponto gravado em um checkpoint.
+
+    A tabela gravada é usada se existir; senão é reconstruída a partir de
+    c, A, b e da base. A chave gravada precisa corresponder ao problema,
+    incluindo os sentidos das restrições; senão levanta ValueError.
+
+    Args:
+        caminho: arquivo do checkpoint
+        c, A, b: problema original
+        opcoes: demais argumentos do SimplexTabulado (sentidos, algoritmo, checkpoint, ...)
+
+    Returns:
+        SimplexTabulado pronto para continuar com resolver() ou passos()
+    """
+    estado = carregar_checkpoint(caminho)
+    simplex = SimplexTabulado(c, A, b, **opcoes)
+    if estado['chave'] != chave_checkpoint(simplex):
+        raise ValueError(f"O checkpoint {caminho} não corresponde a este problema.")
+
+    if estado['tabela'] is not None and estado['tabela'].shape == simplex.tabela.shape:
+        simplex.tabela = estado['tabela'].copy()
+        simplex.definir_base(estado['base'])
+    else:
+        simplex.reconstruir_tabela(estado['base'])
+        # Ruído da fatoração: zerar valores desprezíveis para não perder a viabilidade
+        escala = 1.0 + np.max(np.abs(simplex.tabela))
+        simplex.tabela[np.abs(simplex.tabela) < 1e-12 * escala] = 0.0
+    simplex.iteracao = estado['iteracao']
+    simplex.algoritmo_atual = estado['algoritmo']
+    return simplex
+
+
+class Checkpoint:
+    def __init__(self, caminho, intervalo_iteracoes=None, intervalo_segundos=60.0,
+                 incluir_tabela=False, remover_ao_terminar=True):
+        """
+        Configura os checkpoints de uma resolução.
+
+        Args:
+            caminho: arquivo .npz do checkpoint
+            intervalo_iteracoes: grava a cada tantas iterações (None: não usa)
+            intervalo_segundos: grava quando passa esse tempo desde a última
+                gravação (None: não usa)
+            incluir_tabela: grava também a tabela (arquivo maior, retomada sem
+                reconstrução)
+            remover_ao_terminar: remove o arquivo quando a resolução termina
+        """
+        self.caminho = caminho
+        self.intervalo_iteracoes = intervalo_iteracoes
+        self.intervalo_segundos = intervalo_segundos
+        self.incluir_tabela = incluir_tabela
+        self.remover_ao_terminar = remover_ao_terminar
+        self.gravacoes = 0
+
+    def anexar(self, simplex):
+        """Substitui simplex.passos por uma versão que grava checkpoints entre os pivôs."""
+        chave = chave_checkpoint(simplex)
+        passos = simplex.passos
+
+        def passos_com_checkpoint():
+            ultima_iteracao = simplex.iteracao
+            ultimo_tempo = time.monotonic()
+            tabela_consistente = True
+            try:
+                for passo in passos():
+                    tabela_consistente = True
+                    if passo['tipo'] == 'limite':
+                        # Parada por limite: gravar para continuar depois
+                        if not simplex.em_fase1():
+                            salvar_checkpoint(self.caminho, simplex, chave, self.incluir_tabela)
+                            self.gravacoes += 1
+                        yield passo
+                        return
+                    if passo['tipo'] in PASSOS_FINAIS:
+                        if self.remover_ao_terminar and os.path.exists(self.caminho):
+                            os.remove(self.caminho)
+                        yield passo
+                        return
+                    yield passo
+                    if passo['tipo'] != 'pivotamento':
+                        # O próximo next() aplica o pivô: a tabela muda aos poucos
+                        tabela_consistente = False
+                        continue
+
+                    por_iteracoes = (self.intervalo_iteracoes is not None
+                                     and simplex.iteracao - ultima_iteracao >= self.intervalo_iteracoes)
+                    por_tempo = (self.intervalo_segundos is not None
+                                 and time.monotonic() - ultimo_tempo >= self.intervalo_segundos)
+                    if (por_iteracoes or por_tempo) and not simplex.em_fase1():
+                        salvar_checkpoint(self.caminho, simplex, chave, self.incluir_tabela)
+                        self.gravacoes += 1
+                        ultima_iteracao = simplex.iteracao
+                        ultimo_tempo = time.monotonic()
+            except (KeyboardInterrupt, GeneratorExit):
+                # Interrupção no meio de um pivô: a base ainda é a anterior e é
+                # consistente, mas a tabela pode estar parcialmente atualizada
+                if simplex.status is None and not simplex.em_fase1():
+                    salvar_checkpoint(self.caminho, simplex, chave,
+                                      self.incluir_tabela and tabela_consistente)
+                    self.gravacoes += 1
+                raise
+
+        simplex.passos = passos_com_checkpoint
+        return simplex
+
+
+def gerar_problema(tamanho, semente=0):
+    """Problema denso aleatório de maximização com `tamanho` variáveis e restrições."""
+    rng = np.random.default_rng(semente)
+    A = rng.uniform(1.0, 10.0, size=(tamanho, tamanho))
+    b = rng.uniform(100.0, 1000.0, size=tamanho)
+    c = -rng.uniform(1.0, 20.0, size=tamanho)
+    return c, A, b
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolução com checkpoints (interrompa com Ctrl-C e rode de novo)")
+    parser.add_argument('--arquivo', default='simplex_checkpoint.npz', help="arquivo do checkpoint")
+    parser.add_argument('--tamanho', type=int, default=400, help="variáveis e restrições do problema aleatório")
+    parser.add_argument('--semente', type=int, default=0, help="semente do problema aleatório")
+    parser.add_argument('--intervalo', type=int, default=20, help="iterações entre checkpoints")
+    parser.add_argument('--tabela', action='store_true', help="grava também a tabela")
+    args = parser.parse_args()
+
+    print("\n==== SIMPLEX TABULADO COM CHECKPOINTS ====\n")
+    c, A, b = gerar_problema(args.tamanho, args.semente)
+    checkpoint = Checkpoint(args.arquivo, intervalo_iteracoes=args.intervalo, incluir_tabela=args.tabela)
+
+    if os.path.exists(args.arquivo):
+        simplex = retomar(args.arquivo, c, A, b, checkpoint=checkpoint)
+        print(f"Retomando de {args.arquivo} na iteração {simplex.iteracao}")
+    else:
+        simplex = SimplexTabulado(c, A, b, checkpoint=checkpoint)
+        print(f"Nova resolução ({args.tamanho} x {args.tamanho}); checkpoints em {args.arquivo}")
+
+    inicio = time.perf_counter()
+    try:
+        solucao = simplex.resolver_silencioso()
+    except KeyboardInterrupt:
+        print(f"\nInterrompido na iteração {simplex.iteracao}; estado gravado em {args.arquivo}")
+        return
+
+    print(f"Status: {solucao['status']}")
+    print(f"Z = {solucao['z']:.4f} em {solucao['iteracoes']} iterações "
+          f"({time.perf_counter() - inicio:.2f} s, {checkpoint.gravacoes} checkpoints)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Geração de colunas sobre o Simplex Tabulado.
+
+Resolve um problema mestre restrito com poucas colunas, lê as variáveis duais
+da tabela final e chama uma função de precificação fornecida pelo usuário.
+As colunas que melhoram o objetivo são adicionadas à tabela atual, que é
+reotimizada a partir da base corrente em vez de ser reconstruída.
+
+A função de precificação recebe o vetor de duais y (um por restrição) e
+retorna uma lista de pares (custo, coluna), com o custo no mesmo formato de c
+(negativo para maximização). Uma coluna melhora o mestre quando
+custo + y·coluna < 0. Cada tupla pode trazer elementos extras (por exemplo, a
+solução que gerou a coluna); as tuplas aceitas ficam em `colunas_adicionadas`,
+na ordem das variáveis do mestre.
+
+Uso:
+    geracao = GeracaoColunas(c, A, b, precificacao)
+    resultado = geracao.resolver()
+    print(geracao.relatorio())
+"""
+import time
+
+import numpy as np
+from tabulate import tabulate
+
+from tabuladocore import SimplexTabulado
+
+
+class GeracaoColunas:
+    def __init__(self, c, A, b, precificacao, max_rodadas=100, tolerancia=1e-9):
+        """
+        Prepara o problema mestre restrito.
+
+        Args:
+            c, A, b: mestre restrito inicial no formato do SimplexTabulado
+            precificacao: função precificacao(duais) -> lista de (custo, coluna)
+            max_rodadas: número máximo de rodadas de precificação
+            tolerancia: custo reduzido mínimo para aceitar uma coluna
+        """
+        self.c, self.A, self.b = c, A, b
+        self.precificacao = precificacao
+        self.max_rodadas = max_rodadas
+        self.tolerancia = tolerancia
+        self.simplex = None
+        self.rodadas = []
+        self.colunas_adicionadas = []
+
+    def resolver(self):
+        """
+        Alterna entre reotimizar o mestre e precificar novas colunas.
+
+        Returns:
+            dicionário com 'status' ('otimo', 'ilimitado', 'inviavel' ou
+            'limite_rodadas'), 'z', 'x' (uma entrada por coluna, na ordem em
+            que foram adicionadas), 'colunas_geradas' e 'rodadas'
+        """
+        self.simplex = simplex = SimplexTabulado(self.c, self.A, self.b)
+        self.rodadas = []
+        self.colunas_adicionadas = []
+        status = 'limite_rodadas'
+
+        for rodada in range(1, self.max_rodadas + 1):
+            inicio = time.perf_counter()
+            # A tabela é reaproveitada entre as rodadas: 'auto' escolhe o primal
+            # quando as novas colunas só quebram a viabilidade dual
+            simplex.resolver_silencioso()
+            tempo_mestre = time.perf_counter() - inicio
+            if simplex.status != 'otimo':
+                status = simplex.status
+                break
+
+            duais = simplex.precos_sombra()
+            inicio = time.perf_counter()
+            candidatas = self.precificacao(duais)
+            tempo_precificacao = time.perf_counter() - inicio
+
+            melhoram = [candidata for candidata in candidatas
+                        if candidata[0] + duais @ np.asarray(candidata[1], dtype=float) < -self.tolerancia]
+            for candidata in melhoram:
+                simplex.adicionar_variavel(candidata[0], candidata[1])
+            self.colunas_adicionadas.extend(melhoram)
+
+            self.rodadas.append({
+                'rodada': rodada,
+                'z': simplex.tabela[-1, -1],
+                'iteracoes_mestre': simplex.iteracao,
+                'colunas_adicionadas': len(melhoram),
+                'tempo_mestre_s': tempo_mestre,
+                'tempo_precificacao_s': tempo_precificacao,
+            })
+            if not melhoram:
+                status = 'otimo'
+                break
+
+        solucao = simplex.obter_solucao()
+        return {
+            'status': status,
+            'z': solucao['z'],
+            'x': solucao['x'],
+            'colunas_geradas': sum(r['colunas_adicionadas'] for r in self.rodadas),
+            'rodadas': len(self.rodadas),
+        }
+
+    def relatorio(self):
+        """Retorna o relatório de colunas geradas e tempo por rodada em texto."""
+        linhas = [[r['rodada'], f"{r['z']:.4f}", r['colunas_adicionadas'],
+                   f"{r['tempo_mestre_s'] * 1e3:.2f}", f"{r['tempo_precificacao_s'] * 1e3:.2f}"]
+                  for r in self.rodadas]
+        texto = tabulate(linhas, headers=["Rodada", "Z do mestre", "Colunas adicionadas",
+                                          "Mestre (ms)", "Precificação (ms)"],
+                         tablefmt="grid", stralign="center")
+        total = sum(r['colunas_adicionadas'] for r in self.rodadas)
+        return texto + f"\n\nColunas geradas: {total} em {len(self.rodadas)} rodadas"
+
+
+def precificacao_corte(larguras, largura_bobina):
+    """
+    Cria a precificação do problema de corte de bobinas (mochila ilimitada).
+
+    O mestre minimiza o número de bobinas com padrões p (A p ≥ demanda),
+    escrito como maximização de -sum x com -A x ≤ -demanda. Um padrão novo
+    melhora o mestre quando y·p > 1.
+    """
+    larguras = np.asarray(larguras, dtype=int)
+
+    def precificacao(duais):
+        # Programação dinâmica: melhor valor dual para cada capacidade
+        valor = np.zeros(largura_bobina + 1)
+        escolha = np.full(largura_bobina + 1, -1)
+        for capacidade in range(1, largura_bobina + 1):
+            valor[capacidade] = valor[capacidade - 1]
+            for item, largura in enumerate(larguras):
+                if largura <= capacidade and valor[capacidade - largura] + duais[item] > valor[capacidade]:
+                    valor[capacidade] = valor[capacidade - largura] + duais[item]
+                    escolha[capacidade] = item
+
+        # Reconstruir o padrão
+        padrao = np.zeros(len(larguras))
+        capacidade = largura_bobina
+        while capacidade > 0:
+            if escolha[capacidade] == -1:
+                capacidade -= 1
+                continue
+            padrao[escolha[capacidade]] += 1
+            capacidade -= larguras[escolha[capacidade]]
+        return [(1.0, -padrao)]
+
+    return precificacao
+
+
+def main():
+    print("\n==== GERAÇÃO DE COLUNAS - CORTE DE BOBINAS ====\n")
+
+    largura_bobina = 100
+    larguras = [45, 36, 31, 14]
+    demandas = np.array([97, 610, 395, 211], dtype=float)
+
+    # Padrões iniciais homogêneos: apenas um tipo de item por bobina
+    padroes = np.diag([largura_bobina // w for w in larguras]).astype(float)
+    c = np.ones(len(larguras))  # Minimizar o número de bobinas
+    geracao = GeracaoColunas(c, -padroes, -demandas, precificacao_corte(larguras, largura_bobina))
+    resultado = geracao.resolver()
+
+    print(geracao.relatorio())
+    print(f"\nStatus: {resultado['status']}")
+    print(f"Bobinas (relaxação linear) = {-resultado['z']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,53 @@
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+from scipy.linalg import solve_triangular
 from scipy.optimize import linprog
 from tabulate import tabulate  # Será usado para formatar tabelas
 
+# Pivotamento paralelo: elementos mínimos por thread para compensar o custo de
+# despachar um bloco (abaixo disso o pivotamento serial é mais rápido)
+ELEMENTOS_POR_THREAD = 64 * 1024
+
+# Sentidos de restrição aceitos e a forma usada internamente
+SENTIDOS = {'<=': '<=', '≤': '<=', '>=': '>=', '≥': '>=', '=': '=', '==': '='}
+
+# Pools de threads reutilizados entre pivotamentos, por número de threads
+_POOLS_PIVO = {}
+
+
+def _pool_pivo(threads):
+    if threads not in _POOLS_PIVO:
+        _POOLS_PIVO[threads] = ThreadPoolExecutor(threads, thread_name_prefix='pivo')
+    return _POOLS_PIVO[threads]
+
+
+# Um processo filho (fork) não herda as threads dos pools
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_POOLS_PIVO.clear)
+
+
+def configurar_paralelismo(linhas, colunas, threads=None):
+    """
+    Escolhe o número de threads e o tamanho dos blocos de linhas do pivotamento.
+    
+    Args:
+        linhas, colunas: dimensões da tabela
+        threads: número de threads desejado (padrão: pelo tamanho da tabela,
+            limitado ao número de CPUs)
+    
+    Returns:
+        (threads, linhas_por_bloco); threads == 1 significa pivotamento serial
+    """
+    if threads is None:
+        threads = min(os.cpu_count() or 1, linhas * colunas // ELEMENTOS_POR_THREAD)
+    threads = max(1, min(threads, linhas))
+    return threads, math.ceil(linhas / threads)
+
+
 def obter_dados_usuario():
     """Função para obter os dados do problema de programação linear do usuário."""
     try:
@@ -39,8 +85,11 @@ def obter_dados_usuario():
         print("Erro: Por favor, insira valores numéricos válidos.")
         return obter_dados_usuario()
 
-def exibir_problema_completo(c, A, b):
+def exibir_problema_completo(c, A, b, sentidos=None):
     """Exibe todas as funções e restrições do problema para verificação."""
+    simbolos = {'<=': '≤', '>=': '≥', '=': '='}
+    if sentidos is None:
+        sentidos = ['<='] * len(b)
     print("\n===== PROBLEMA DE PROGRAMAÇÃO LINEAR =====")
     print("Função Objetivo:")
     coefs_positivos = [-coef for coef in c]
@@ -52,20 +101,22 @@ def exibir_problema_completo(c, A, b):
     print(f"Z = {funcao_z}")
     
     print("\nRestrições:")
-    for i, (restricao, rhs) in enumerate(zip(A, b)):
+    for i, (restricao, rhs, sentido) in enumerate(zip(A, b, sentidos)):
         termos = []
         for j, coef in enumerate(restricao):
             if coef != 0:
                 termos.append(f"{coef:.0f}x{j+1}")
         eq_restricao = " + ".join(termos)
-        print(f"R{i+1}: {eq_restricao} ≤ {rhs:.0f}")
+        print(f"R{i+1}: {eq_restricao} {simbolos[SENTIDOS[sentido]]} {rhs:.0f}")
     
     print("\nNão-negatividade:")
     vars_x = [f"x{i+1}" for i in range(len(c))]
     print(", ".join(vars_x) + " ≥ 0")
 
 class SimplexTabulado:
-    def __init__(self, c, A, b):
+    def __init__(self, c, A, b, instrumentacao=None, algoritmo='auto', threads=1, checkpoint=None,
+                 tempo_limite=None, max_iteracoes=None, objetivo_alvo=None, sentidos=None,
+                 base_inicial='folgas', monitor_deriva=None):
         """
         Inicializa o problema de programação linear.
         
@@ -73,41 +124,195 @@ class SimplexTabulado:
             c: coeficientes da função objetivo (negativos para maximização)
             A: matriz de coeficientes das restrições
             b: vetor de limites das restrições
+            instrumentacao: Instrumentacao opcional (tabuladoinstrumentacao) que
+                mede o tempo de cada fase; sem ela nenhum custo extra é adicionado
+            algoritmo: 'primal', 'dual' ou 'auto' (escolhe pela viabilidade da
+                base inicial: primal se b ≥ 0, dual se a linha Z não tem negativos,
+                senão primal a partir da Fase I)
+            threads: threads do pivotamento por blocos de linhas: 1 (serial),
+                um número fixo ou 'auto' (escolhido pelo tamanho da tabela)
+            checkpoint: Checkpoint opcional (tabuladocheckpoint) que grava a base
+                periodicamente para retomar resoluções interrompidas
+            tempo_limite: segundos de resolução; ao esgotar, para com status 'limite_tempo'
+            max_iteracoes: pivôs no total; ao atingir, para com status 'limite_iteracoes'
+            objetivo_alvo: Z de maximização suficiente; no primal para com status
+                'objetivo_alvo' quando Z ≥ alvo, no dual com 'objetivo_inatingivel'
+                quando o limitante Z cai abaixo do alvo
+            sentidos: sentido de cada restrição, '<=' (padrão), '>=' ou '='
+                (também '≤', '≥' e '=='); quando a base das folgas não é viável,
+                o primal começa pela Fase I
+            base_inicial: 'folgas' ou 'crash' (base triangular com variáveis de
+                decisão, mais perto de um bom vértice; os pivôs que ela poupa
+                ficam em self.pivos_crash)
+            monitor_deriva: MonitorDeriva opcional (tabuladoderiva) que mede o
+                resíduo primal a cada tantas iterações e reconstrói a tabela a
+                partir de c, A, b quando a deriva numérica passa do limiar
+        
+        Levanta ValueError para sentidos ou base_inicial desconhecidos.
+        
+        Arrays NumPy float64 são usados sem cópia; a tabela nunca os modifica.
         """
-        self.c_original = [-coef for coef in c]  # Converter de volta para positivo
-        self.c = c.copy()
-        self.A = [row.copy() for row in A]
-        self.b = b.copy()
-        self.num_vars = len(c)
-        self.num_restricoes = len(b)
+        self.c = np.asarray(c, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.A = np.asarray(A, dtype=float).reshape(self.b.size, self.c.size)
+        self.c_original = -self.c  # Converter de volta para positivo
+        self.num_vars = self.c.size
+        self.num_restricoes = self.b.size
+        self.algoritmo = algoritmo
+        self.threads = threads
+        self.tolerancia = 1e-9
+        self.tempo_limite = tempo_limite
+        self.max_iteracoes = max_iteracoes
+        self.objetivo_alvo = objetivo_alvo
+        self._prazo = None
+        
+        # Restrições ≥ entram na tabela multiplicadas por -1 (sinal -1 em self.sinais);
+        # A e b continuam como foram dados
+        if sentidos is None:
+            sentidos = ['<='] * self.num_restricoes
+        if len(sentidos) != self.num_restricoes:
+            raise ValueError(f"Esperados {self.num_restricoes} sentidos, recebidos {len(sentidos)}.")
+        desconhecidos = [sentido for sentido in sentidos if sentido not in SENTIDOS]
+        if desconhecidos:
+            raise ValueError(f"Sentido de restrição desconhecido: {desconhecidos[0]!r} (use '<=', '>=' ou '=').")
+        if base_inicial not in ('folgas', 'crash'):
+            raise ValueError(f"Base inicial desconhecida: {base_inicial!r} (use 'folgas' ou 'crash').")
+        self.sentidos = np.array([SENTIDOS[sentido] for sentido in sentidos], dtype=object)
+        self.sinais = np.where(self.sentidos == '>=', -1.0, 1.0)
+        self.base_inicial = base_inicial
         
         # Preparar tabela inicial do simplex
         self.preparar_tabela_inicial()
         
+        # Instrumentação opcional: envolve os métodos apenas desta instância
+        if instrumentacao is not None:
+            instrumentacao.anexar(self)
+        if checkpoint is not None:
+            checkpoint.anexar(self)
+        if monitor_deriva is not None:
+            monitor_deriva.anexar(self)
+        
     def preparar_tabela_inicial(self):
         """Prepara a tabela inicial do simplex."""
         # Criar tabela com variáveis de folga
-        self.num_total_vars = self.num_vars + self.num_restricoes
-        self.tabela = np.zeros((self.num_restricoes + 1, self.num_total_vars + 1))
+        n, m = self.num_vars, self.num_restricoes
+        self.num_total_vars = n + m
+        self.tabela = np.zeros((m + 1, self.num_total_vars + 1))
         
-        # Preencher as restrições
-        for i in range(self.num_restricoes):
-            for j in range(self.num_vars):
-                self.tabela[i, j] = self.A[i][j]
+        # Preencher por blocos: restrições, folgas (identidade), lado direito e função objetivo
+        self.tabela[:m, :n] = self.A * self.sinais[:, np.newaxis]
+        self.tabela[np.arange(m), n + np.arange(m)] = 1.0
+        self.tabela[:m, -1] = self.b * self.sinais
+        self.tabela[-1, :n] = self.c
+        
+        # Colunas fixas em zero nunca entram na base: folgas das restrições de igualdade
+        self.fixas = np.zeros(self.num_total_vars, dtype=bool)
+        self.fixas[n:] = self.sentidos == '='
+        
+        # Inicializar base (variáveis básicas) - começa com as variáveis de folga
+        self.definir_base(np.arange(n, n + m))
+        
+        # Estado da resolução
+        self.iteracao = 0
+        self.status = None
+        self.algoritmo_atual = None
+        self.pivos_crash = 0
+        if self.base_inicial == 'crash':
+            self._aplicar_crash()
+    
+    def _aplicar_crash(self):
+        """
+        Troca folgas da base inicial por variáveis de decisão (base triangular).
+        
+        As colunas são percorridas da mais atraente (menor custo por norma) para
+        a menos atraente, e uma coluna só é aceita se não tem coeficientes nas
+        linhas já escolhidas, o que mantém a base triangular. A coluna cobre uma
+        restrição de igualdade ou violada quando o valor que a satisfaz não
+        torna inviável nenhuma linha viável; senão, se tem custo atraente, entra
+        pela razão mínima das linhas viáveis, como num pivô primal.
+        
+        A tabela é escrita na nova base de uma vez (um sistema triangular e um
+        produto de matrizes), em vez de um pivô por coluna escolhida.
+        """
+        n, m = self.num_vars, self.num_restricoes
+        tol = self.tolerancia
+        A = self.tabela[:m, :n]
+        custos = self.tabela[-1, :n]
+        residuo = self.tabela[:m, -1].copy()
+        igualdade = self.fixas[n:]
+        nao_nulos_A = np.abs(A) > tol
+        escolhidas = np.zeros(m, dtype=bool)
+        # Colunas vazias ou com coeficiente numa linha já escolhida (quebrariam a forma triangular)
+        bloqueadas = ~nao_nulos_A.any(axis=0)
+        normas = np.linalg.norm(A, axis=0)
+        ordem = np.argsort(custos / np.where(normas > 0, normas, 1.0), kind='stable')
+        
+        linhas, colunas = [], []
+        for j in ordem:
+            if bloqueadas[j]:
+                continue
+            coluna = A[:, j]
+            nao_nulos = nao_nulos_A[:, j]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                razoes = residuo / coluna
+            limitam = nao_nulos & ~igualdade & (residuo >= -tol) & (coluna > 0)
+            teto = razoes[limitam].min(initial=np.inf)
             
-            # Adicionar variáveis de folga (matriz identidade)
-            self.tabela[i, self.num_vars + i] = 1.0
+            cobre = nao_nulos & (igualdade | (residuo < -tol)) & (razoes >= 0) & (razoes <= teto)
+            if cobre.any():
+                candidatas = np.flatnonzero(cobre)
+                linha = candidatas[np.argmax(np.abs(coluna[candidatas]))]
+            elif custos[j] < -tol and tol < teto < np.inf:
+                linha = np.flatnonzero(limitam & (razoes == teto))[0]
+            else:
+                continue
             
-            # Adicionar lado direito das restrições
-            self.tabela[i, -1] = self.b[i]
+            residuo -= razoes[linha] * coluna
+            escolhidas[linha] = True
+            bloqueadas |= nao_nulos_A[linha]
+            linhas.append(linha)
+            colunas.append(j)
+            if escolhidas.all():
+                break
         
-        # Preencher função objetivo (última linha)
-        for j in range(self.num_vars):
-            self.tabela[-1, j] = self.c[j]
+        self.pivos_crash = len(linhas)
+        if not linhas:
+            return
         
-        # Inicializar base (variáveis básicas) - começa com as variáveis de folga
-        self.base = [self.num_vars + i for i in range(self.num_restricoes)]
+        # Na ordem de escolha, B restrita às linhas escolhidas é triangular inferior
+        linhas, colunas = np.array(linhas), np.array(colunas)
+        novas = solve_triangular(self.tabela[np.ix_(linhas, colunas)], self.tabela[linhas], lower=True)
+        fatores = self.tabela[:, colunas].copy()
+        fatores[linhas] = 0.0
+        self.tabela -= fatores @ novas
+        self.tabela[linhas] = novas
+        base = self.base.copy()
+        base[linhas] = colunas
+        self.definir_base(base)
+        
+    def definir_base(self, base):
+        """
+        Define a base (colunas básicas, uma por linha) e o mapa inverso.
         
+        self.base[i] é a coluna básica da linha i e self.posicao_base[j] é a
+        linha em que a coluna j é básica (-1 se não básica).
+        """
+        self.base = np.array(base, dtype=np.intp)
+        self.posicao_base = np.full(self.num_total_vars, -1, dtype=np.intp)
+        self.posicao_base[self.base] = np.arange(self.base.size)
+    
+    def nome_variavel(self, idx):
+        """Retorna o nome da variável da coluna idx (X para decisão, F para folga, A para artificial)."""
+        if idx < self.num_vars:
+            return f'X{idx+1}'
+        if idx < self.num_vars + self.num_restricoes:
+            return f'F{idx-self.num_vars+1}'
+        return f'A{idx-self.num_vars-self.num_restricoes+1}'
+    
+    def em_fase1(self):
+        """True enquanto a tabela tem as colunas artificiais da Fase I."""
+        return self.num_total_vars > self.num_vars + self.num_restricoes
+    
     def exibir_tabela(self, iteracao=None, col_pivo=None, row_pivo=None):
         """Exibe a tabela atual do simplex."""
         if iteracao is not None:
@@ -116,38 +321,33 @@ class SimplexTabulado:
             print("\n===== Tabela Inicial =====")
         
         # Criar cabeçalhos para as colunas
-        colunas = ["Z"] + [f'X{i+1}' for i in range(self.num_vars)] + \
-                  [f'F{i+1}' for i in range(self.num_restricoes)] + \
-                  ['Constante']
+        colunas = ["Z"] + [self.nome_variavel(j) for j in range(self.num_total_vars)] + ['Constante']
                   
         # Adicionar cabeçalho extra para divisão quando mostrando pivô
         headers = ["Variaveis", "N de linha"] + colunas
-        if col_pivo is not None:
+        mostrar_divisao = col_pivo is not None and self.algoritmo_atual != 'dual'
+        if mostrar_divisao:
             headers.append("Divisão")
             
         tabela_dados = []
         
         # Adicionar linha Z (função objetivo)
         row_z = ["Z", "1", "1"] + \
-                [f"{self.tabela[-1, j]:.2f}" for j in range(self.num_vars + self.num_restricoes)] + \
+                [f"{self.tabela[-1, j]:.2f}" for j in range(self.num_total_vars)] + \
                 [f"{self.tabela[-1, -1]:.2f}"]
         tabela_dados.append(row_z)
         
         # Adicionar linhas das restrições
         for i in range(self.num_restricoes):
             # Variável básica para esta linha
-            vb_idx = self.base[i]
-            if vb_idx < self.num_vars:
-                vb = f'X{vb_idx+1}'
-            else:
-                vb = f'F{vb_idx-self.num_vars+1}'
+            vb = self.nome_variavel(self.base[i])
             
             row_data = [vb, f"{i+2}", "0"] + \
                       [f"{self.tabela[i, j]:.2f}" for j in range(self.num_total_vars)] + \
                       [f"{self.tabela[i, -1]:.2f}"]
                       
-            # Adicionar coluna de divisão se estivermos mostrando um pivô
-            if col_pivo is not None:
+            # Adicionar coluna de divisão se estivermos mostrando um pivô do primal
+            if mostrar_divisao:
                 if self.tabela[i, col_pivo] > 0:
                     ratio = self.tabela[i, -1] / self.tabela[i, col_pivo]
                     row_data.append(f"{ratio:.2f}")
@@ -162,30 +362,18 @@ class SimplexTabulado:
         # Se tivermos elementos pivô, exibi-los
         if col_pivo is not None and row_pivo is not None:
             print(f"\nElemento pivô: ({row_pivo+1}, {col_pivo+1}) = {self.tabela[row_pivo, col_pivo]:.2f}")
-            if col_pivo < self.num_vars:
-                var_entrada = f"X{col_pivo+1}"
-            else:
-                var_entrada = f"F{col_pivo-self.num_vars+1}"
-                
-            if self.base[row_pivo] < self.num_vars:
-                var_saida = f"X{self.base[row_pivo]+1}"
-            else:
-                var_saida = f"F{self.base[row_pivo]-self.num_vars+1}"
-                
-            print(f"Variável que entra na base: {var_entrada}")
-            print(f"Variável que sai da base: {var_saida}")
+            print(f"Variável que entra na base: {self.nome_variavel(col_pivo)}")
+            print(f"Variável que sai da base: {self.nome_variavel(self.base[row_pivo])}")
         
     def encontrar_coluna_pivo(self):
         """Encontra a coluna do elemento pivô (variável de entrada)."""
         # O menor coeficiente negativo na linha Z indica a variável de entrada
-        min_val = 0
-        min_col = -1
-        for j in range(self.num_total_vars):
-            if self.tabela[-1, j] < min_val:
-                min_val = self.tabela[-1, j]
-                min_col = j
-        
-        return min_col
+        # (colunas fixas não entram; resíduos de arredondamento não contam)
+        custos = np.where(self.fixas, 0.0, self.tabela[-1, :-1])
+        col_pivo = int(np.argmin(custos))
+        if custos[col_pivo] >= -self.tolerancia:
+            return -1
+        return col_pivo
     
     def encontrar_linha_pivo(self, col_pivo):
         """Encontra a linha do elemento pivô (variável de saída)."""
@@ -194,7 +382,7 @@ class SimplexTabulado:
         min_row = -1
         
         for i in range(self.num_restricoes):
-            if self.tabela[i, col_pivo] > 0:
+            if self.tabela[i, col_pivo] > self.tolerancia:
                 ratio = self.tabela[i, -1] / self.tabela[i, col_pivo]
                 if ratio < min_ratio:
                     min_ratio = ratio
@@ -202,18 +390,208 @@ class SimplexTabulado:
         
         return min_row
     
+    def encontrar_linha_pivo_dual(self):
+        """Encontra a linha do pivô no simplex dual (variável de saída)."""
+        # A linha com o lado direito mais negativo indica a variável de saída
+        rhs = self.tabela[:-1, -1]
+        row_pivo = int(np.argmin(rhs))
+        if rhs[row_pivo] >= -self.tolerancia:
+            return -1
+        return row_pivo
+    
+    def encontrar_coluna_pivo_dual(self, row_pivo):
+        """Encontra a coluna do pivô no simplex dual (variável de entrada)."""
+        # Razão dual: entre os coeficientes negativos da linha do pivô, a menor
+        # razão |Z_j / a_rj| preserva a viabilidade dual da linha Z
+        linha = self.tabela[row_pivo, :-1]
+        candidatas = np.flatnonzero((linha < -self.tolerancia) & ~self.fixas)
+        if candidatas.size == 0:
+            return -1
+        razoes = self.tabela[-1, candidatas] / -linha[candidatas]
+        return int(candidatas[np.argmin(razoes)])
+    
+    def escolher_algoritmo(self):
+        """
+        Escolhe o algoritmo pela viabilidade da base atual ('primal' ou 'dual').
+        
+        Uma base que não é primal nem dual viável, ou que ainda não atende às
+        restrições de igualdade, fica com o primal, que começa pela Fase I.
+        """
+        if self.algoritmo != 'auto':
+            return self.algoritmo
+        violadas = self.linhas_violadas()
+        if not violadas.any():
+            return 'primal'
+        if self.dual_viavel() and not np.any(violadas & self.fixas[self.base]):
+            return 'dual'
+        return 'primal'
+    
+    def linhas_violadas(self):
+        """
+        Linhas em que a solução básica não é viável.
+        
+        Uma linha é violada se o lado direito é negativo ou se a variável básica
+        é fixa e não está em zero ou ainda muda com as colunas livres (o pivô
+        primal poderia tirá-la de zero).
+        """
+        tol = self.tolerancia
+        violadas = self.tabela[:-1, -1] < -tol
+        linhas_fixas = np.flatnonzero(self.fixas[self.base])
+        if linhas_fixas.size:
+            livres = self.tabela[np.ix_(linhas_fixas, np.flatnonzero(~self.fixas))]
+            violadas[linhas_fixas] |= ((np.abs(self.tabela[linhas_fixas, -1]) > tol)
+                                       | (np.abs(livres).max(axis=1, initial=0.0) > tol))
+        return violadas
+    
+    def dual_viavel(self):
+        """True se a linha Z não tem negativos nas colunas que podem entrar na base."""
+        return bool(np.all(self.tabela[-1, :-1][~self.fixas] >= -self.tolerancia))
+    
+    def adicionar_restricao(self, coeficientes, limite):
+        """
+        Adiciona a restrição coeficientes·x ≤ limite à tabela atual, sem reconstruí-la.
+        
+        A nova linha é escrita na base atual (eliminando as colunas básicas) e
+        ganha uma folga própria, que entra na base. A linha Z não muda, então
+        uma tabela ótima continua dual viável e pode ser reotimizada pelo
+        simplex dual (algoritmo 'auto' ou 'dual').
+        
+        Args:
+            coeficientes: coeficientes das variáveis de decisão na restrição
+            limite: lado direito da restrição
+        """
+        coeficientes = np.asarray(coeficientes, dtype=float)
+        m = self.num_restricoes
+        
+        # Nova coluna de folga logo antes da coluna Constante
+        self.tabela = np.insert(self.tabela, self.num_total_vars, 0.0, axis=1)
+        
+        # Nova linha nas variáveis originais, depois escrita na base atual
+        linha = np.zeros(self.num_total_vars + 2)
+        linha[:self.num_vars] = coeficientes
+        linha[self.num_total_vars] = 1.0
+        linha[-1] = limite
+        linha -= linha[self.base] @ self.tabela[:m]
+        self.tabela = np.insert(self.tabela, m, linha, axis=0)
+        
+        # Atualizar dimensões, base e dados originais
+        self.num_restricoes += 1
+        self.num_total_vars += 1
+        self.definir_base(np.append(self.base, self.num_total_vars - 1))
+        self.A = np.vstack([self.A, coeficientes])
+        self.b = np.append(self.b, limite)
+        self.sentidos = np.append(self.sentidos, '<=')
+        self.sinais = np.append(self.sinais, 1.0)
+        self.fixas = np.append(self.fixas, False)
+        self.status = None
+    
+    def adicionar_variavel(self, custo, coluna):
+        """
+        Adiciona uma variável de decisão à tabela atual, sem reconstruí-la.
+        
+        A coluna é escrita na base atual (B^-1 a, com B^-1 lida das colunas de
+        folga) e entra como última variável de decisão; as folgas são deslocadas
+        uma posição. A base não muda, então uma tabela ótima continua primal
+        viável e pode ser reotimizada pelo simplex primal.
+        
+        Args:
+            custo: coeficiente da variável na função objetivo (negativo para maximização)
+            coluna: coeficientes da variável em cada restrição
+        """
+        coluna = np.asarray(coluna, dtype=float)
+        n, m = self.num_vars, self.num_restricoes
+        
+        # Coluna na base atual e custo reduzido: c_j + y·a (y na linha Z das folgas)
+        normalizada = coluna * self.sinais
+        nova = np.empty(m + 1)
+        nova[:-1] = self.tabela[:-1, n:n + m] @ normalizada
+        nova[-1] = custo + self.tabela[-1, n:n + m] @ normalizada
+        self.tabela = np.insert(self.tabela, n, nova, axis=1)
+        self.fixas = np.insert(self.fixas, n, False)
+        
+        # Deslocar os índices das folgas na base
+        self.num_vars += 1
+        self.num_total_vars += 1
+        self.definir_base(np.where(self.base >= n, self.base + 1, self.base))
+        self.c = np.append(self.c, custo)
+        self.c_original = -self.c
+        self.A = np.column_stack([self.A, coluna])
+        self.status = None
+    
+    def reconstruir_tabela(self, base):
+        """
+        Reconstrói a tabela para uma base dada, sem pivotamentos.
+        
+        As linhas das restrições passam a ser B^-1 [A I | b] e a linha Z é
+        escrita na nova base. Útil para começar de uma base obtida fora do
+        simplex (por exemplo, o cruzamento do método de pontos interiores).
+        
+        Args:
+            base: índices das colunas básicas (uma por restrição)
+        """
+        base = np.asarray(base, dtype=np.intp)
+        n, m = self.num_vars, self.num_restricoes
+        if base.size != m:
+            raise ValueError(f"A base deve ter {m} colunas, recebeu {base.size}.")
+        
+        # Tabela inicial [A I | b] e custos [c 0]
+        completa = np.zeros((m, self.num_total_vars + 1))
+        completa[:, :n] = self.A * self.sinais[:, np.newaxis]
+        completa[:, n:n + m] = np.eye(m)
+        completa[:, -1] = self.b * self.sinais
+        custos = np.zeros(self.num_total_vars + 1)
+        custos[:n] = self.c
+        
+        linhas = np.linalg.solve(completa[:, base], completa)
+        self.tabela = np.vstack([linhas, custos - custos[base] @ linhas])
+        self.definir_base(base)
+        self.status = None
+    
     def pivotar(self, row_pivo, col_pivo):
         """Realiza a operação de pivotamento."""
+        # Normalizar a linha do pivô
+        elemento_pivo = self.tabela[row_pivo, col_pivo]
+        linha_pivo = self.tabela[row_pivo] / elemento_pivo
+        
+        # Fatores de eliminação de cada linha (zero na própria linha do pivô)
+        fatores = self.tabela[:, col_pivo].copy()
+        fatores[row_pivo] = 0.0
+        
+        # Atualizar as outras linhas, em blocos paralelos se a tabela for grande
+        threads = None if self.threads == 'auto' else self.threads
+        threads, linhas_por_bloco = configurar_paralelismo(*self.tabela.shape, threads=threads)
+        if threads == 1:
+            self._atualizar_linhas(0, self.tabela.shape[0], fatores, linha_pivo)
+        else:
+            # O NumPy libera o GIL nas operações de cada bloco
+            blocos = [_pool_pivo(threads).submit(self._atualizar_linhas, inicio, inicio + linhas_por_bloco,
+                                                 fatores, linha_pivo)
+                      for inicio in range(0, self.tabela.shape[0], linhas_por_bloco)]
+            for bloco in blocos:
+                bloco.result()
+        self.tabela[row_pivo] = linha_pivo
+        
+        # Atualizar a base e o mapa inverso
+        self.posicao_base[self.base[row_pivo]] = -1
+        self.posicao_base[col_pivo] = row_pivo
+        self.base[row_pivo] = col_pivo
+    
+    def _atualizar_linhas(self, inicio, fim, fatores, linha_pivo):
+        """Subtrai fator × linha do pivô das linhas inicio:fim da tabela."""
+        bloco = self.tabela[inicio:fim]
+        bloco -= fatores[inicio:fim, np.newaxis] * linha_pivo
+    
+    def exibir_pivotamento(self, row_pivo, col_pivo):
+        """Exibe as operações que pivotar() vai realizar (chamar antes do pivotamento)."""
         print("\n===== Operação de Pivotamento =====")
         
         # Normalizar a linha do pivô
         elemento_pivo = self.tabela[row_pivo, col_pivo]
         print(f"1. Normalizar linha {row_pivo+1} dividindo por {elemento_pivo:.2f}")
         
-        self.tabela[row_pivo] = self.tabela[row_pivo] / elemento_pivo
-        
         # Exibir linha normalizada
-        print(f"Linha {row_pivo+1} normalizada: {', '.join([f'{val:.2f}' for val in self.tabela[row_pivo]])}")
+        linha_normalizada = self.tabela[row_pivo] / elemento_pivo
+        print(f"Linha {row_pivo+1} normalizada: {', '.join([f'{val:.2f}' for val in linha_normalizada])}")
         
         # Atualizar as outras linhas
         print("\n2. Eliminar a variável das outras linhas:")
@@ -223,79 +601,397 @@ class SimplexTabulado:
                 fator = self.tabela[i, col_pivo]
                 if fator != 0:
                     print(f"   Linha {i+1}: Subtrair {fator:.2f} vezes a linha {row_pivo+1}")
-                    self.tabela[i] = self.tabela[i] - fator * self.tabela[row_pivo]
+    
+    def passos(self):
+        """
+        Gera os passos do método simplex sob demanda, sem exibir nada.
         
-        # Atualizar a base
-        self.base[row_pivo] = col_pivo
+        Cada passo é um dicionário com 'tipo', 'iteracao', 'col_pivo' e 'row_pivo'.
+        Tipos:
+            'pivotamento_pendente': pivô escolhido; a tabela ainda não foi alterada
+            'pivotamento': pivô aplicado à tabela
+            'final': solução ótima encontrada
+            'ilimitado': o problema é ilimitado na coluna 'col_pivo' (primal)
+            'inviavel': o problema é inviável pela linha 'row_pivo' (dual ou Fase I)
+            'fase1': a Fase I encontrou uma base viável; a tabela volta à
+                função objetivo original e o primal continua
+            'limite': um limite da resolução foi atingido; o motivo está em
+                'motivo' e em self.status
+        
+        O trabalho de cada passo só é feito quando o próximo passo é pedido.
+        """
+        if self.tempo_limite is not None:
+            self._prazo = time.monotonic() + self.tempo_limite
+        self.algoritmo_atual = self.escolher_algoritmo()
+        if self.algoritmo_atual == 'dual':
+            if not self.dual_viavel() or np.any(self.linhas_violadas() & self.fixas[self.base]):
+                raise ValueError("O simplex dual exige uma base dual viável (linha Z sem negativos) "
+                                 "e com as restrições de igualdade atendidas.")
+            yield from self._passos_dual()
+        else:
+            if self.linhas_violadas().any():
+                yield from self._passos_fase1()
+                if self.status is not None:
+                    return
+            yield from self._passos_primal()
     
-    def resolver(self):
-        """Resolve o problema usando o método simplex."""
-        iteracao = 0
-        self.exibir_tabela()
+    def _passos_fase1(self):
+        """
+        Passos da Fase I: leva uma base inviável a uma base primal viável.
+        
+        Cada linha violada ganha uma variável artificial (A1, A2, ... antes da
+        Constante) que entra na base, e o primal minimiza a soma das
+        artificiais; as que saem da base ficam fixas. Com soma positiva no
+        ótimo o problema é inviável. Com soma zero, as artificiais restantes
+        saem da base por pivôs degenerados, as colunas artificiais são
+        removidas e a linha Z da função objetivo original é reescrita na base.
+        """
+        n, m = self.num_vars, self.num_restricoes
+        self._inserir_artificiais(np.flatnonzero(self.linhas_violadas()))
+        for passo in self._passos_primal():
+            if passo['tipo'] == 'final':
+                break
+            if passo['tipo'] == 'pivotamento':
+                self.fixas[n + m:] = self.posicao_base[n + m:] < 0
+            yield passo
+        else:
+            # Parada por limite (a Fase I nunca é ilimitada)
+            return
+        self.status = None
+        
+        # Tolerância proporcional ao tamanho do problema: a soma acumula o erro de cada linha
+        artificiais = np.where(self.base >= n + m, self.tabela[:-1, -1], 0.0)
+        escala = 1.0 + np.abs(self.b).max(initial=0.0)
+        if artificiais.sum() > self.tolerancia * escala * m:
+            self.status = 'inviavel'
+            yield {'tipo': 'inviavel', 'iteracao': self.iteracao, 'col_pivo': None,
+                   'row_pivo': int(np.argmax(artificiais))}
+            return
+        
+        self._remover_artificiais()
+        yield {'tipo': 'fase1', 'iteracao': self.iteracao, 'col_pivo': None, 'row_pivo': None}
+    
+    def _inserir_artificiais(self, linhas):
+        """Acrescenta uma artificial básica por linha dada e a linha Z da Fase I."""
+        total = self.num_total_vars
+        k = linhas.size
         
+        # Linhas com lado direito negativo trocam de sinal para a artificial começar ≥ 0
+        self.tabela[linhas] = self.tabela[linhas] * np.where(self.tabela[linhas, -1] < 0, -1.0, 1.0)[:, np.newaxis] + 0.0
+        artificiais = np.zeros((self.tabela.shape[0], k))
+        artificiais[linhas, np.arange(k)] = 1.0
+        self.tabela = np.hstack([self.tabela[:, :total], artificiais, self.tabela[:, total:]])
+        self.num_total_vars += k
+        self.fixas = np.append(self.fixas, np.zeros(k, dtype=bool))
+        base = self.base.copy()
+        base[linhas] = total + np.arange(k)
+        self.definir_base(base)
+        
+        # Maximizar -(soma das artificiais), escrita na base
+        self.tabela[-1] = 0.0
+        self.tabela[-1, total:total + k] = 1.0
+        self.tabela[-1] -= self.tabela[linhas].sum(axis=0)
+    
+    def _remover_artificiais(self):
+        """Tira as artificiais (em zero) da base, remove suas colunas e restaura a linha Z."""
+        n, m = self.num_vars, self.num_restricoes
+        total = n + m
+        livres = ~self.fixas[:total]
+        for row_pivo in np.flatnonzero(self.base >= total):
+            # Pivô degenerado no maior coeficiente, de preferência numa coluna livre;
+            # sem coluna livre a linha é redundante e uma coluna fixa fica na base
+            linha = np.abs(self.tabela[row_pivo, :total])
+            col_pivo = int(np.argmax(np.where(livres, linha, 0.0)))
+            if linha[col_pivo] <= self.tolerancia:
+                col_pivo = int(np.argmax(linha))
+            self.pivotar(row_pivo, col_pivo)
+            self.iteracao += 1
+        
+        self.tabela = np.delete(self.tabela, np.s_[total:self.num_total_vars], axis=1)
+        self.num_total_vars = total
+        self.fixas = self.fixas[:total]
+        self.definir_base(self.base)
+        custos = np.zeros(total + 1)
+        custos[:n] = self.c
+        self.tabela[-1] = custos - custos[self.base] @ self.tabela[:-1]
+    
+    def _passos_primal(self):
+        """Passos do simplex primal (a partir de uma base primal viável)."""
         while True:
             # Encontrar variável de entrada (coluna do pivô)
             col_pivo = self.encontrar_coluna_pivo()
             
             # Verificar condição de otimalidade
             if col_pivo == -1:
-                print("\n===== Solução Ótima Encontrada =====")
-                break
+                self.status = 'otimo'
+                yield {'tipo': 'final', 'iteracao': self.iteracao, 'col_pivo': None, 'row_pivo': None}
+                return
             
             # Encontrar variável de saída (linha do pivô)
             row_pivo = self.encontrar_linha_pivo(col_pivo)
             
             # Verificar se o problema é ilimitado
             if row_pivo == -1:
+                self.status = 'ilimitado'
+                yield {'tipo': 'ilimitado', 'iteracao': self.iteracao, 'col_pivo': col_pivo, 'row_pivo': None}
+                return
+            
+            motivo = self.limite_atingido()
+            if motivo is not None:
+                yield self._parar(motivo)
+                return
+            
+            yield from self._aplicar_pivo(row_pivo, col_pivo)
+    
+    def _passos_dual(self):
+        """Passos do simplex dual (a partir de uma base dual viável)."""
+        while True:
+            # Encontrar variável de saída (linha com lado direito negativo)
+            row_pivo = self.encontrar_linha_pivo_dual()
+            
+            # Sem lados direitos negativos a base é primal viável, logo ótima
+            if row_pivo == -1:
+                self.status = 'otimo'
+                yield {'tipo': 'final', 'iteracao': self.iteracao, 'col_pivo': None, 'row_pivo': None}
+                return
+            
+            # Encontrar variável de entrada (razão dual)
+            col_pivo = self.encontrar_coluna_pivo_dual(row_pivo)
+            
+            # Linha sem coeficientes negativos: a restrição não pode ser satisfeita
+            if col_pivo == -1:
+                self.status = 'inviavel'
+                yield {'tipo': 'inviavel', 'iteracao': self.iteracao, 'col_pivo': None, 'row_pivo': row_pivo}
+                return
+            
+            motivo = self.limite_atingido()
+            if motivo is not None:
+                yield self._parar(motivo)
+                return
+            
+            yield from self._aplicar_pivo(row_pivo, col_pivo)
+    
+    def limite_atingido(self):
+        """
+        Verifica os limites da resolução antes de um pivô.
+        
+        Returns:
+            'limite_iteracoes', 'limite_tempo', 'objetivo_alvo',
+            'objetivo_inatingivel' ou None
+        """
+        if self.max_iteracoes is not None and self.iteracao >= self.max_iteracoes:
+            return 'limite_iteracoes'
+        if self._prazo is not None and time.monotonic() >= self._prazo:
+            return 'limite_tempo'
+        if self.objetivo_alvo is not None and not self.em_fase1():
+            # No primal Z é o valor de uma solução viável; no dual, um limitante superior
+            if self.algoritmo_atual == 'primal' and self.tabela[-1, -1] >= self.objetivo_alvo:
+                return 'objetivo_alvo'
+            if self.algoritmo_atual == 'dual' and self.tabela[-1, -1] < self.objetivo_alvo:
+                return 'objetivo_inatingivel'
+        return None
+    
+    def _parar(self, motivo):
+        """Encerra a resolução por um limite e retorna o passo 'limite'."""
+        self.status = motivo
+        return {'tipo': 'limite', 'iteracao': self.iteracao, 'col_pivo': None, 'row_pivo': None,
+                'motivo': motivo}
+    
+    def _aplicar_pivo(self, row_pivo, col_pivo):
+        """Passos de seleção e aplicação de um pivô, comuns ao primal e ao dual."""
+        yield {'tipo': 'pivotamento_pendente', 'iteracao': self.iteracao + 1,
+               'col_pivo': col_pivo, 'row_pivo': row_pivo}
+        
+        # Realizar operação de pivotamento
+        self.pivotar(row_pivo, col_pivo)
+        self.iteracao += 1
+        
+        yield {'tipo': 'pivotamento', 'iteracao': self.iteracao, 'col_pivo': col_pivo, 'row_pivo': row_pivo}
+    
+    def resolver(self):
+        """Resolve o problema usando o método simplex."""
+        self.exibir_tabela()
+        
+        for passo in self.passos():
+            if passo['tipo'] == 'pivotamento_pendente':
+                # Exibir informações sobre o pivô e as operações
+                self.exibir_tabela(passo['iteracao'], passo['col_pivo'], passo['row_pivo'])
+                self.exibir_pivotamento(passo['row_pivo'], passo['col_pivo'])
+            
+            elif passo['tipo'] == 'pivotamento':
+                # Exibir a tabela resultante
+                print(f"\nTabela após pivotamento (Iteração {passo['iteracao']}):")
+                self.exibir_tabela()
+            
+            elif passo['tipo'] == 'fase1':
+                print(f"\n===== Fase I concluída: base viável após {passo['iteracao']} iterações =====")
+                self.exibir_tabela()
+            
+            elif passo['tipo'] == 'ilimitado':
                 print("\nO problema é ilimitado! Não há solução ótima finita.")
                 return
             
-            # Exibir informações sobre o pivô
-            self.exibir_tabela(iteracao+1, col_pivo, row_pivo)
+            elif passo['tipo'] == 'inviavel':
+                print(f"\nO problema é inviável! A restrição da linha {passo['row_pivo']+1} não pode ser satisfeita.")
+                return
             
-            # Realizar operação de pivotamento
-            self.pivotar(row_pivo, col_pivo)
+            elif passo['tipo'] == 'limite':
+                print(f"\nResolução interrompida ({passo['motivo']}) na iteração {passo['iteracao']}.")
+                limitante = self.obter_solucao()['limitante']
+                if limitante is not None:
+                    print(f"Limitante superior de Z: {limitante:.4f}")
             
-            # Incrementar iteração e exibir a tabela resultante
-            iteracao += 1
-            print(f"\nTabela após pivotamento (Iteração {iteracao}):")
-            self.exibir_tabela()
+            elif passo['tipo'] == 'final':
+                print("\n===== Solução Ótima Encontrada =====")
         
         # Extrair e exibir a solução
         self.mostrar_solucao()
     
-    def mostrar_solucao(self):
-        """Exibe a solução final."""
-        # Valor ótimo (negativo da célula z na coluna RHS para maximização)
-        z_otimo = -self.tabela[-1, -1]
+    def resolver_silencioso(self):
+        """Resolve o problema sem exibir nada e retorna obter_solucao()."""
+        for _ in self.passos():
+            pass
+        return self.obter_solucao()
+    
+    def obter_solucao(self):
+        """
+        Retorna a solução básica atual.
         
-        # Valores das variáveis de decisão
-        valores_x = [0] * self.num_vars
+        Returns:
+            dicionário com 'status' (None, 'otimo', 'ilimitado', 'inviavel' ou o
+            motivo de parada por limite), 'z' (valor da função objetivo de
+            maximização), 'x' (variáveis de decisão), 'folgas', 'iteracoes',
+            'viavel' (a solução básica atende às restrições) e 'limitante'
+            (limitante superior de Z, se a linha Z não tem negativos; senão None)
+        """
+        n, m = self.num_vars, self.num_restricoes
+        valores = np.zeros(self.num_total_vars)
+        valores[self.base] = self.tabela[:-1, -1]
         
-        for i, var_base in enumerate(self.base):
-            if var_base < self.num_vars:
-                valores_x[var_base] = self.tabela[i, -1]
+        # Na Fase I a linha Z é a da soma das artificiais: Z é calculado de x
+        if self.em_fase1():
+            z, viavel, dual_viavel = -self.c @ valores[:n], False, False
+        else:
+            z, viavel, dual_viavel = self.tabela[-1, -1], not self.linhas_violadas().any(), self.dual_viavel()
         
-        # Valores das variáveis de folga
-        valores_folga = []
-        for i in range(self.num_restricoes):
-            idx = self.num_vars + i
-            if idx in self.base:
-                pos = self.base.index(idx)
-                valores_folga.append(self.tabela[pos, -1])
-            else:
-                valores_folga.append(0)
+        return {
+            'status': self.status,
+            'z': z,
+            'x': valores[:n],
+            'folgas': valores[n:n + m],
+            'iteracoes': self.iteracao,
+            'viavel': viavel,
+            'limitante': float(self.tabela[-1, -1]) if dual_viavel else None
+        }
+    
+    def mostrar_solucao(self):
+        """Exibe a solução final."""
+        solucao = self.obter_solucao()
         
         # Exibir resultados
         print("\n===== Resultado Final =====")
-        print("Função Objetivo (Z) =", z_otimo)
+        print("Função Objetivo (Z) =", solucao['z'])
         print("\nVariáveis de Decisão:")
-        for i, val in enumerate(valores_x):
+        for i, val in enumerate(solucao['x']):
             print(f"x{i+1} = {val:.2f}")
         
         print("\nVariáveis de Folga:")
-        for i, val in enumerate(valores_folga):
+        for i, val in enumerate(solucao['folgas']):
             print(f"f{i+1} = {val:.2f}")
+    
+    def precos_sombra(self):
+        """Retorna os preços sombra (variáveis duais) lidos da linha Z nas colunas de folga."""
+        # Linhas ≥ estão com o sinal trocado na tabela: o preço é em relação ao b original
+        return self.tabela[-1, self.num_vars:self.num_vars + self.num_restricoes] * self.sinais
+    
+    def analise_sensibilidade(self):
+        """
+        Calcula a análise de sensibilidade a partir da tabela ótima, sem re-resolver.
+        
+        As colunas de folga da tabela final contêm B^-1, e a linha Z contém os
+        custos reduzidos; todos os intervalos são calculados de forma vetorizada.
+        
+        Returns:
+            dicionário com:
+                'precos_sombra': variação de Z por unidade de cada b_i
+                'custos_reduzidos': custos reduzidos das variáveis de decisão
+                'custos': intervalos dos coeficientes de maximização c_j
+                    ('atual', 'aumento', 'reducao', 'minimo', 'maximo')
+                'rhs': intervalos dos lados direitos b_i (mesmas chaves)
+            'aumento' e 'reducao' são as variações permitidas antes de a base
+            ótima mudar (np.inf quando não há limite).
+        """
+        if self.status != 'otimo':
+            raise ValueError("A análise de sensibilidade exige uma solução ótima (resolva o problema antes).")
+        
+        n, m = self.num_vars, self.num_restricoes
+        tol = self.tolerancia
+        base = self.base
+        linha_z = self.tabela[-1, :-1]
+        rhs = self.tabela[:-1, -1]
+        inversa_base = self.tabela[:-1, n:n + m]
+        
+        # Lados direitos: x_B + delta * B^-1 e_i ≥ 0 para cada b_i (uma coluna por b_i)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            razoes = rhs[:, None] / inversa_base
+        aumento_b = np.where(inversa_base < -tol, -razoes, np.inf).min(axis=0)
+        reducao_b = np.where(inversa_base > tol, razoes, np.inf).min(axis=0)
+        # Em linhas ≥ (sinal trocado na tabela) aumentar b_i reduz o lado direito da tabela
+        aumento_b, reducao_b = (np.where(self.sinais > 0, aumento_b, reducao_b),
+                                np.where(self.sinais > 0, reducao_b, aumento_b))
+        
+        # Custos de variáveis não básicas: podem cair à vontade e subir até o custo reduzido
+        custos_reduzidos = linha_z[:n].copy()
+        aumento_c = custos_reduzidos.copy()
+        reducao_c = np.full(n, np.inf)
+        
+        # Custos de variáveis básicas: variar c_j em delta soma delta * a_rk ao custo
+        # reduzido de cada não básica k, que precisa continuar ≥ 0
+        linhas_decisao = np.flatnonzero(base < n)
+        if linhas_decisao.size:
+            variaveis = base[linhas_decisao]
+            alfa = self.tabela[linhas_decisao, :-1]
+            nao_basica = (self.posicao_base < 0) & ~self.fixas
+            with np.errstate(divide='ignore', invalid='ignore'):
+                razoes = linha_z / np.abs(alfa)
+            aumento_c[variaveis] = np.where(nao_basica & (alfa < -tol), razoes, np.inf).min(axis=1)
+            reducao_c[variaveis] = np.where(nao_basica & (alfa > tol), razoes, np.inf).min(axis=1)
+        
+        c_atual = -self.c
+        b_atual = self.b.copy()
+        return {
+            'precos_sombra': self.precos_sombra(),
+            'custos_reduzidos': custos_reduzidos,
+            'custos': {'atual': c_atual, 'aumento': aumento_c, 'reducao': reducao_c,
+                       'minimo': c_atual - reducao_c, 'maximo': c_atual + aumento_c},
+            'rhs': {'atual': b_atual, 'aumento': aumento_b, 'reducao': reducao_b,
+                    'minimo': b_atual - reducao_b, 'maximo': b_atual + aumento_b},
+        }
+    
+    def exibir_sensibilidade(self):
+        """Exibe a análise de sensibilidade da solução ótima."""
+        analise = self.analise_sensibilidade()
+        solucao = self.obter_solucao()
+        formatar = lambda val: "∞" if np.isinf(val) else f"{val:.2f}"
+        
+        print("\n===== Análise de Sensibilidade =====")
+        print("\nCoeficientes da Função Objetivo:")
+        custos = analise['custos']
+        linhas = [[f"x{j+1}", f"{solucao['x'][j]:.2f}", f"{analise['custos_reduzidos'][j]:.2f}",
+                   f"{custos['atual'][j]:.2f}", formatar(custos['aumento'][j]), formatar(custos['reducao'][j])]
+                  for j in range(self.num_vars)]
+        print(tabulate(linhas, headers=["Variável", "Valor", "Custo Reduzido", "Coeficiente",
+                                        "Aumento Permitido", "Redução Permitida"],
+                       tablefmt="grid", stralign="center"))
+        
+        print("\nLados Direitos das Restrições:")
+        rhs = analise['rhs']
+        linhas = [[f"R{i+1}", f"{solucao['folgas'][i]:.2f}", f"{analise['precos_sombra'][i]:.2f}",
+                   f"{rhs['atual'][i]:.2f}", formatar(rhs['aumento'][i]), formatar(rhs['reducao'][i])]
+                  for i in range(self.num_restricoes)]
+        print(tabulate(linhas, headers=["Restrição", "Folga", "Preço Sombra", "Lado Direito",
+                                        "Aumento Permitido", "Redução Permitida"],
+                       tablefmt="grid", stralign="center"))
 
 def main():
     print("\n==== SIMPLEX TABULADO - MÉTODO PASSO A PASSO ====\n")
@@ -331,6 +1027,10 @@ def main():
     simplex = SimplexTabulado(c, A, b)
     simplex.resolver()
     
+    # Análise de sensibilidade a partir da tabela ótima
+    if simplex.status == 'otimo':
+        simplex.exibir_sensibilidade()
+    
     # Opcional: comparar com a solução da biblioteca scipy
     print("\n===== Verificação usando scipy =====")
     res = linprog(c=c, A_ub=A, b_ub=b, method='highs')
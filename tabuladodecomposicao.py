@@ -0,0 +1,256 @@
+"""
+Decomposição de Dantzig–Wolfe para problemas bloco-angulares.
+
+Problemas com um submodelo por bloco, ligados por poucas restrições comuns,
+são resolvidos por geração de colunas: o mestre combina propostas de cada
+bloco (restrições de ligação + uma restrição de convexidade por bloco) e os
+subproblemas dos blocos, independentes entre si, são resolvidos em paralelo
+num pool de processos.
+
+A estrutura pode ser informada (índices das restrições de ligação) ou
+detectada a partir da matriz A.
+
+Como o SimplexTabulado só aceita restrições ≤, exige-se b ≥ 0: assim x = 0 é
+viável em cada bloco e a convexidade pode ser escrita como sum λ ≤ 1.
+
+Uso:
+    decomposicao = DantzigWolfe(c, A, b, processos=4)
+    resultado = decomposicao.resolver()
+    print(decomposicao.relatorio())
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from tabuladocore import SimplexTabulado
+from tabuladocolunas import GeracaoColunas
+
+
+def componentes_blocos(A, linhas_ligacao):
+    """
+    Agrupa as restrições e variáveis fora das linhas de ligação em blocos independentes.
+
+    Returns:
+        (blocos, diretas): blocos é uma lista de (linhas, colunas); diretas são as
+        variáveis que só aparecem nas linhas de ligação
+    """
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    linhas_bloco = np.setdiff1d(np.arange(m), linhas_ligacao)
+
+    # Grafo bipartido restrição-variável com os elementos não nulos dos blocos
+    i, j = np.nonzero(A[linhas_bloco])
+    grafo = coo_matrix((np.ones(i.size), (i, linhas_bloco.size + j)),
+                       shape=(linhas_bloco.size + n, linhas_bloco.size + n))
+    _, rotulos = connected_components(grafo, directed=False)
+    rotulos_linhas = rotulos[:linhas_bloco.size]
+    rotulos_colunas = rotulos[linhas_bloco.size:]
+
+    blocos = []
+    for rotulo in np.unique(rotulos_linhas):
+        colunas = np.flatnonzero(rotulos_colunas == rotulo)
+        if colunas.size:
+            blocos.append((linhas_bloco[rotulos_linhas == rotulo], colunas))
+    em_blocos = np.concatenate([colunas for _, colunas in blocos]) if blocos else np.array([], dtype=int)
+    diretas = np.setdiff1d(np.arange(n), em_blocos)
+    return blocos, diretas
+
+
+def detectar_blocos(A, max_ligacao=None):
+    """
+    Detecta as restrições de ligação de A.
+
+    Remove as restrições mais densas, uma a uma, até que as demais se separem
+    em pelo menos dois blocos independentes.
+
+    Args:
+        A: matriz de restrições
+        max_ligacao: número máximo de restrições de ligação (padrão: metade das linhas)
+
+    Returns:
+        índices das restrições de ligação (vazio se nenhum particionamento for achado)
+    """
+    A = np.asarray(A, dtype=float)
+    m = A.shape[0]
+    max_ligacao = m // 2 if max_ligacao is None else max_ligacao
+    ordem = np.argsort(-np.count_nonzero(A, axis=1), kind='stable')
+
+    for k in range(max_ligacao + 1):
+        linhas_ligacao = np.sort(ordem[:k])
+        blocos, _ = componentes_blocos(A, linhas_ligacao)
+        if len(blocos) >= 2:
+            return linhas_ligacao
+    return np.array([], dtype=int)
+
+
+# Blocos de cada processo do pool, enviados uma única vez pelo inicializador
+_BLOCOS = None
+
+
+def _iniciar_processo(blocos):
+    global _BLOCOS
+    _BLOCOS = blocos
+
+
+def resolver_subproblema(k, custos, blocos=None):
+    """Resolve o subproblema do bloco k com os custos dados. Retorna (status, x)."""
+    A_bloco, b_bloco = (blocos or _BLOCOS)[k]
+    solucao = SimplexTabulado(custos, A_bloco, b_bloco).resolver_silencioso()
+    return solucao['status'], solucao['x']
+
+
+class DantzigWolfe:
+    def __init__(self, c, A, b, linhas_ligacao=None, processos=None, max_rodadas=200, tolerancia=1e-9):
+        """
+        Prepara a decomposição.
+
+        Args:
+            c, A, b: problema no formato do SimplexTabulado (maximização, c negativo)
+            linhas_ligacao: índices das restrições de ligação (padrão: detectar)
+            processos: processos do pool para os subproblemas (1 resolve no
+                próprio processo; padrão: número de CPUs, limitado ao de blocos)
+            max_rodadas: número máximo de rodadas de geração de colunas
+            tolerancia: custo reduzido mínimo para aceitar uma proposta
+        """
+        self.c = np.asarray(c, dtype=float)
+        self.A = np.asarray(A, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        if np.any(self.b < 0):
+            raise ValueError("A decomposição exige b ≥ 0 (x = 0 viável em cada bloco).")
+
+        if linhas_ligacao is None:
+            linhas_ligacao = detectar_blocos(self.A)
+        self.linhas_ligacao = np.asarray(linhas_ligacao, dtype=int)
+        self.blocos, self.diretas = componentes_blocos(self.A, self.linhas_ligacao)
+        if not self.blocos:
+            raise ValueError("Nenhum bloco encontrado fora das restrições de ligação.")
+
+        self.processos = min(processos or os.cpu_count() or 1, len(self.blocos))
+        self.max_rodadas = max_rodadas
+        self.tolerancia = tolerancia
+        self.geracao = None
+        self.tempo = 0.0
+
+        # Dados de cada bloco: ligação L_k, restrições próprias (A_k, b_k) e custos c_k
+        L = self.A[self.linhas_ligacao]
+        self.ligacao = [L[:, colunas] for _, colunas in self.blocos]
+        self.dados_blocos = [(self.A[np.ix_(linhas, colunas)], self.b[linhas]) for linhas, colunas in self.blocos]
+        self.custos_blocos = [self.c[colunas] for _, colunas in self.blocos]
+
+    def _mestre_inicial(self):
+        """Mestre com as variáveis diretas; as propostas dos blocos entram por geração de colunas."""
+        K = len(self.blocos)
+        A_ligacao = self.A[np.ix_(self.linhas_ligacao, self.diretas)]
+        A_mestre = np.vstack([A_ligacao, np.zeros((K, self.diretas.size))])
+        b_mestre = np.concatenate([self.b[self.linhas_ligacao], np.ones(K)])
+        return self.c[self.diretas], A_mestre, b_mestre
+
+    def _precificacao(self, executor):
+        num_ligacao = self.linhas_ligacao.size
+        K = len(self.blocos)
+
+        def precificacao(duais):
+            pi, mu = duais[:num_ligacao], duais[num_ligacao:]
+            # Subproblema k: max (c_k - pi L_k) x com A_k x ≤ b_k (c no formato negativo)
+            custos = [self.custos_blocos[k] + pi @ self.ligacao[k] for k in range(K)]
+            if executor is None:
+                resultados = [resolver_subproblema(k, custos[k], self.dados_blocos) for k in range(K)]
+            else:
+                resultados = list(executor.map(resolver_subproblema, range(K), custos))
+
+            candidatas = []
+            for k, (status, x) in enumerate(resultados):
+                if status == 'ilimitado':
+                    raise RuntimeError(f"O subproblema do bloco {k+1} é ilimitado; raios extremos não são suportados.")
+                coluna = np.concatenate([self.ligacao[k] @ x, np.eye(K)[k]])
+                candidatas.append((self.custos_blocos[k] @ x, coluna, k, x))
+            return candidatas
+
+        return precificacao
+
+    def resolver(self):
+        """
+        Executa a decomposição.
+
+        Returns:
+            dicionário com 'status', 'z', 'x' (no espaço original), 'rodadas',
+            'colunas_geradas', 'blocos' e 'tempo_s'
+        """
+        inicio = time.perf_counter()
+        executor = None
+        if self.processos > 1:
+            executor = ProcessPoolExecutor(self.processos, initializer=_iniciar_processo,
+                                           initargs=(self.dados_blocos,))
+        try:
+            c_mestre, A_mestre, b_mestre = self._mestre_inicial()
+            self.geracao = GeracaoColunas(c_mestre, A_mestre, b_mestre, self._precificacao(executor),
+                                          max_rodadas=self.max_rodadas, tolerancia=self.tolerancia)
+            resultado = self.geracao.resolver()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self.tempo = time.perf_counter() - inicio
+
+        # Recompor x: variáveis diretas + combinação das propostas de cada bloco
+        x = np.zeros(self.c.size)
+        lambdas = resultado['x']
+        x[self.diretas] = lambdas[:self.diretas.size]
+        for peso, (_, _, k, proposta) in zip(lambdas[self.diretas.size:], self.geracao.colunas_adicionadas):
+            x[self.blocos[k][1]] += peso * proposta
+
+        return {
+            'status': resultado['status'],
+            'z': resultado['z'],
+            'x': x,
+            'rodadas': resultado['rodadas'],
+            'colunas_geradas': resultado['colunas_geradas'],
+            'blocos': len(self.blocos),
+            'tempo_s': self.tempo,
+        }
+
+    def relatorio(self):
+        """Retorna a estrutura detectada e o relatório das rodadas em texto."""
+        tamanhos = ", ".join(f"{linhas.size}x{colunas.size}" for linhas, colunas in self.blocos)
+        texto = (f"Restrições de ligação: {self.linhas_ligacao.size}\n"
+                 f"Blocos: {len(self.blocos)} ({tamanhos})\n"
+                 f"Variáveis só nas ligações: {self.diretas.size}\n"
+                 f"Processos: {self.processos}\n\n")
+        if self.geracao is not None:
+            texto += self.geracao.relatorio() + f"\nTempo total: {self.tempo:.3f} s"
+        return texto
+
+
+def main():
+    print("\n==== DECOMPOSIÇÃO DE DANTZIG-WOLFE ====\n")
+
+    # Duas fábricas com o produto do exemplo do tabuladocore, cada uma com suas
+    # próprias restrições, ligadas por um limite comum de matéria-prima
+    fabrica = np.array([
+        [2, 5, 10],
+        [2, 5, 1],
+        [4, 2, 2]
+    ], dtype=float)
+    A_blocos = np.kron(np.eye(2), fabrica)
+    b_blocos = np.array([900, 400, 600, 700, 500, 400], dtype=float)
+    materia_prima = np.array([[3, 2, 4, 3, 2, 4]], dtype=float)
+
+    c = np.array([-40, -30, -20, -42, -28, -21], dtype=float)  # Negativo para maximização
+    A = np.vstack([materia_prima, A_blocos])
+    b = np.concatenate([[800], b_blocos])
+
+    decomposicao = DantzigWolfe(c, A, b)
+    resultado = decomposicao.resolver()
+
+    print(decomposicao.relatorio())
+    print(f"\nStatus: {resultado['status']}")
+    print(f"Z = {resultado['z']:.2f}")
+    for i, val in enumerate(resultado['x']):
+        print(f"x{i+1} = {val:.2f}")
+
+
+if __name__ == "__main__":
+    main()
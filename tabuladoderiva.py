@@ -0,0 +1,220 @@
+"""
+Monitoramento da deriva numérica do Simplex Tabulado.
+
+Cada pivotamento parte da tabela deixada pelos anteriores, então os erros de
+arredondamento se acumulam: em resoluções longas a coluna Constante pode
+ficar levemente negativa e a escolha dos pivôs se torna errática. Um
+MonitorDeriva anexado ao SimplexTabulado verifica a cada `intervalo`
+iterações o resíduo primal da solução básica, A x + s - b (relativo ao
+tamanho de cada linha), e o resíduo da função objetivo. Quando um deles passa
+do limiar, ou quando o primal encontra a coluna Constante negativa, a tabela
+é reinvertida: reconstruída a partir de c, A, b originais e da base atual
+com uma fatoração nova (SimplexTabulado.reconstruir_tabela).
+
+Cada verificação entra no histórico (e, opcionalmente, numa linha JSON de um
+arquivo de registro), o que permite ajustar o intervalo e o limiar.
+
+Uso:
+    monitor = MonitorDeriva(intervalo=50)
+    simplex = SimplexTabulado(c, A, b, monitor_deriva=monitor)
+    simplex.resolver_silencioso()
+    print(monitor.relatorio())
+
+    python tabuladoderiva.py --tamanho 200 --intervalo 25 --registro deriva.jsonl
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+from tabulate import tabulate
+
+from tabuladocore import SimplexTabulado
+
+# Iterações entre verificações
+INTERVALO_PADRAO = 50
+
+# Resíduo relativo acima do qual a tabela é reinvertida
+LIMIAR_PADRAO = 1e-9
+
+
+def residuos(simplex):
+    """
+    Mede a deriva da tabela atual em relação ao problema original.
+
+    Returns:
+        dicionário com 'primal' (maior |A x + s - b| de uma linha, dividido por
+        1 + |b_i| + |A_i| |x|), 'objetivo' (|Z - (-c·x)| / (1 + |c| |x|)) e
+        'rhs_minimo' (menor valor da coluna Constante)
+    """
+    n, m = simplex.num_vars, simplex.num_restricoes
+    valores = np.zeros(simplex.num_total_vars)
+    valores[simplex.base] = simplex.tabela[:-1, -1]
+    x, folgas = valores[:n], valores[n:n + m]
+
+    # Linhas ≥ estão com o sinal trocado na tabela (e nas folgas)
+    atividade = simplex.A @ x
+    residuo = (atividade - simplex.b) * simplex.sinais + folgas
+    escala = 1.0 + np.abs(simplex.b) + np.abs(simplex.A) @ np.abs(x)
+    z = -simplex.c @ x
+    return {
+        'primal': float(np.max(np.abs(residuo) / escala, initial=0.0)),
+        'objetivo': float(abs(simplex.tabela[-1, -1] - z) / (1.0 + np.abs(simplex.c) @ np.abs(x))),
+        'rhs_minimo': float(simplex.tabela[:-1, -1].min(initial=0.0)),
+    }
+
+
+class MonitorDeriva:
+    def __init__(self, intervalo=INTERVALO_PADRAO, limiar=LIMIAR_PADRAO, registro=None):
+        """
+        Configura o monitoramento.
+
+        Args:
+            intervalo: iterações entre verificações
+            limiar: resíduo relativo (primal ou da função objetivo) que dispara
+                a reinversão
+            registro: arquivo .jsonl onde cada verificação é acrescentada
+                (None: apenas o histórico em memória)
+        """
+        self.intervalo = intervalo
+        self.limiar = limiar
+        self.registro = registro
+        self.historico = []
+        self.reinversoes = 0
+        self.tempo_reinversao = 0.0
+
+    def anexar(self, simplex):
+        """Substitui simplex.passos por uma versão que verifica a deriva entre os pivôs."""
+        passos = simplex.passos
+
+        def passos_monitorados():
+            ultima_iteracao = simplex.iteracao
+            for passo in passos():
+                # Na Fase I a tabela tem colunas artificiais e não pode ser reconstruída
+                if (passo['tipo'] == 'pivotamento' and not simplex.em_fase1()
+                        and simplex.iteracao - ultima_iteracao >= self.intervalo):
+                    self.verificar(simplex)
+                    ultima_iteracao = simplex.iteracao
+                yield passo
+
+        simplex.passos = passos_monitorados
+        return simplex
+
+    def verificar(self, simplex):
+        """
+        Mede os resíduos e reinverte a tabela se eles passaram do limiar.
+
+        Returns:
+            registro da verificação (também acrescentado ao histórico)
+        """
+        medida = residuos(simplex)
+        rhs_negativo = simplex.algoritmo_atual == 'primal' and medida['rhs_minimo'] < -simplex.tolerancia
+        reinverter = max(medida['primal'], medida['objetivo']) > self.limiar or rhs_negativo
+
+        item = {
+            'iteracao': simplex.iteracao,
+            'residuo_primal': medida['primal'],
+            'residuo_objetivo': medida['objetivo'],
+            'rhs_minimo': medida['rhs_minimo'],
+            'reinvertida': reinverter,
+            'residuo_apos': None,
+        }
+        if reinverter:
+            inicio = time.perf_counter()
+            status = simplex.status
+            simplex.reconstruir_tabela(simplex.base)
+            simplex.status = status
+            self.tempo_reinversao += time.perf_counter() - inicio
+            self.reinversoes += 1
+            apos = residuos(simplex)
+            item['residuo_apos'] = max(apos['primal'], apos['objetivo'])
+
+        self.historico.append(item)
+        if self.registro is not None:
+            self._registrar(item)
+        return item
+
+    def _registrar(self, item):
+        """Acrescenta a verificação ao registro (uma linha JSON)."""
+        diretorio = os.path.dirname(os.path.abspath(self.registro))
+        os.makedirs(diretorio, exist_ok=True)
+        with open(self.registro, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(json.dumps(item) + '\n')
+
+    def relatorio(self):
+        """Texto com o resumo das verificações e das reinversões."""
+        primal = [item['residuo_primal'] for item in self.historico]
+        objetivo = [item['residuo_objetivo'] for item in self.historico]
+        linhas = [
+            ["Intervalo (iterações)", self.intervalo],
+            ["Limiar", f"{self.limiar:.1e}"],
+            ["Verificações", len(self.historico)],
+            ["Reinversões", self.reinversoes],
+            ["Tempo de reinversão (s)", f"{self.tempo_reinversao:.3f}"],
+            ["Maior resíduo primal", f"{max(primal):.2e}" if primal else "--"],
+            ["Maior resíduo da função objetivo", f"{max(objetivo):.2e}" if objetivo else "--"],
+        ]
+        return tabulate(linhas, tablefmt="grid")
+
+    def exibir_historico(self):
+        """Exibe uma linha por verificação."""
+        linhas = [[item['iteracao'], f"{item['residuo_primal']:.2e}", f"{item['residuo_objetivo']:.2e}",
+                   f"{item['rhs_minimo']:.2e}", "sim" if item['reinvertida'] else "não",
+                   "--" if item['residuo_apos'] is None else f"{item['residuo_apos']:.2e}"]
+                  for item in self.historico]
+        print(tabulate(linhas, headers=["Iteração", "Resíduo primal", "Resíduo Z", "Menor Constante",
+                                        "Reinvertida", "Resíduo após"],
+                       tablefmt="grid", stralign="center"))
+
+
+def gerar_problema(tamanho, semente=0, escala=3):
+    """
+    Problema denso com colunas em escalas de 10^-escala a 10^escala.
+
+    As escalas muito diferentes fazem o erro de arredondamento de cada pivô
+    pesar mais, o que deixa a deriva visível em algumas centenas de pivôs.
+    """
+    rng = np.random.default_rng(semente)
+    fatores = 10.0 ** rng.uniform(-escala, escala, size=tamanho)
+    A = rng.uniform(1.0, 10.0, size=(tamanho, tamanho)) * fatores
+    b = A.sum(axis=1) * rng.uniform(0.2, 0.6, size=tamanho)
+    c = -rng.uniform(1.0, 20.0, size=tamanho) * fatores
+    return c, A, b
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monitoramento da deriva numérica do Simplex Tabulado")
+    parser.add_argument('--tamanho', type=int, default=200, help="variáveis e restrições do problema aleatório")
+    parser.add_argument('--semente', type=int, default=0, help="semente do problema aleatório")
+    parser.add_argument('--escala', type=float, default=3.0, help="expoente máximo da escala das colunas")
+    parser.add_argument('--intervalo', type=int, default=INTERVALO_PADRAO, help="iterações entre verificações")
+    parser.add_argument('--limiar', type=float, default=LIMIAR_PADRAO, help="resíduo relativo que dispara a reinversão")
+    parser.add_argument('--registro', help="arquivo .jsonl para o histórico das verificações")
+    args = parser.parse_args()
+
+    print("\n==== DERIVA NUMÉRICA E REINVERSÃO ====\n")
+    c, A, b = gerar_problema(args.tamanho, args.semente, args.escala)
+
+    inicio = time.perf_counter()
+    referencia = SimplexTabulado(c, A, b).resolver_silencioso()
+    tempo_referencia = time.perf_counter() - inicio
+
+    monitor = MonitorDeriva(args.intervalo, args.limiar, args.registro)
+    simplex = SimplexTabulado(c, A, b, monitor_deriva=monitor)
+    inicio = time.perf_counter()
+    solucao = simplex.resolver_silencioso()
+    tempo = time.perf_counter() - inicio
+
+    monitor.exibir_historico()
+    print(monitor.relatorio())
+    print(f"\nSem monitor: {referencia['status']}, Z = {referencia['z']:.6f}, "
+          f"{referencia['iteracoes']} iterações, {tempo_referencia:.2f} s")
+    print(f"Com monitor: {solucao['status']}, Z = {solucao['z']:.6f}, "
+          f"{solucao['iteracoes']} iterações, {tempo:.2f} s")
+    final = residuos(simplex)
+    print(f"Resíduo final: primal {final['primal']:.2e}, função objetivo {final['objetivo']:.2e}")
+
+
+if __name__ == "__main__":
+    main()
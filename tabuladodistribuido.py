@@ -0,0 +1,450 @@
+"""
+Resolução distribuída do Simplex Tabulado: coordenador e trabalhadores via TCP.
+
+O coordenador guarda a fila de problemas e a entrega, um por vez, aos
+trabalhadores que se conectam (no mesmo host ou em outros). Cada
+trabalhador resolve com o SimplexTabulado e devolve o resultado. Se um
+trabalhador cai, a conexão fecha ou o problema passa do tempo máximo, o
+problema volta para a fila (até `tentativas` vezes). Ao final o coordenador
+informa a vazão total e por trabalhador.
+
+Protocolo binário: cada mensagem é um cabeçalho struct '!BI' (tipo,
+tamanho do conteúdo) seguido do conteúdo. Os arrays vão como float64
+little-endian brutos, sem serialização intermediária.
+    PRONTO     trabalhador -> coordenador  nome do trabalhador (UTF-8)
+    TAREFA     coordenador -> trabalhador  '!QBII' (id, algoritmo, m, n) + c + A + b
+    RESULTADO  trabalhador -> coordenador  '!QBId' (id, status, iterações, z) + x + folgas
+    ERRO       trabalhador -> coordenador  '!Q' (id) + mensagem (UTF-8)
+    FIM        coordenador -> trabalhador  sem conteúdo: não há mais problemas
+
+Uso:
+    python tabuladodistribuido.py coordenador --porta 9300 --problemas 500
+    python tabuladodistribuido.py trabalhador --host 10.0.0.5 --porta 9300
+    python tabuladodistribuido.py local --trabalhadores 4 --problemas 500
+
+    resultados, coordenador = executar_local(problemas, trabalhadores=4)
+    print(coordenador.relatorio())
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import struct
+import time
+from collections import deque
+
+import numpy as np
+from tabulate import tabulate
+
+from tabuladocore import SimplexTabulado
+
+PRONTO, TAREFA, RESULTADO, ERRO, FIM = range(1, 6)
+
+CABECALHO = struct.Struct('!BI')
+META_TAREFA = struct.Struct('!QBII')
+META_RESULTADO = struct.Struct('!QBId')
+META_ERRO = struct.Struct('!Q')
+
+# Códigos transmitidos no lugar dos textos
+ALGORITMOS = ('auto', 'primal', 'dual')
+STATUS = ('otimo', 'ilimitado', 'inviavel')
+
+FLOAT = np.dtype('<f8')
+
+# Maior mensagem de erro aceita de um trabalhador (bytes de texto)
+TAMANHO_MAXIMO_ERRO = 1 << 16
+
+
+def codificar_tarefa(identificador, c, A, b, algoritmo='auto'):
+    """Monta o conteúdo de uma mensagem TAREFA (lista de partes, sem concatenar os arrays)."""
+    c = np.ascontiguousarray(c, dtype=FLOAT)
+    b = np.ascontiguousarray(b, dtype=FLOAT)
+    A = np.ascontiguousarray(A, dtype=FLOAT).reshape(b.size, c.size)
+    meta = META_TAREFA.pack(identificador, ALGORITMOS.index(algoritmo), b.size, c.size)
+    return [meta, memoryview(c).cast('B'), memoryview(A).cast('B'), memoryview(b).cast('B')]
+
+
+def decodificar_tarefa(conteudo):
+    """Retorna (id, c, A, b, algoritmo) de uma mensagem TAREFA (os arrays apontam para `conteudo`)."""
+    identificador, algoritmo, m, n = META_TAREFA.unpack_from(conteudo)
+    deslocamento = META_TAREFA.size
+    c = np.frombuffer(conteudo, FLOAT, n, deslocamento)
+    A = np.frombuffer(conteudo, FLOAT, m * n, deslocamento + 8 * n).reshape(m, n)
+    b = np.frombuffer(conteudo, FLOAT, m, deslocamento + 8 * (n + m * n))
+    return identificador, c, A, b, ALGORITMOS[algoritmo]
+
+
+def codificar_resultado(identificador, solucao):
+    """Monta o conteúdo de uma mensagem RESULTADO a partir de obter_solucao()."""
+    meta = META_RESULTADO.pack(identificador, STATUS.index(solucao['status']),
+                               solucao['iteracoes'], solucao['z'])
+    return [meta, np.ascontiguousarray(solucao['x'], dtype=FLOAT).tobytes(),
+            np.ascontiguousarray(solucao['folgas'], dtype=FLOAT).tobytes()]
+
+
+def decodificar_resultado(conteudo, n, m):
+    """Retorna (id, solução) de uma mensagem RESULTADO de um problema m x n."""
+    identificador, status, iteracoes, z = META_RESULTADO.unpack_from(conteudo)
+    deslocamento = META_RESULTADO.size
+    return identificador, {
+        'status': STATUS[status],
+        'z': z,
+        'x': np.frombuffer(conteudo, FLOAT, n, deslocamento).copy(),
+        'folgas': np.frombuffer(conteudo, FLOAT, m, deslocamento + 8 * n).copy(),
+        'iteracoes': iteracoes,
+    }
+
+
+def _mensagem(tipo, partes=()):
+    """Cabeçalho seguido das partes do conteúdo."""
+    tamanho = sum(memoryview(parte).nbytes for parte in partes)
+    return [CABECALHO.pack(tipo, tamanho), *partes]
+
+
+# ---------------------------------------------------------------------------
+# Trabalhador (sockets bloqueantes)
+# ---------------------------------------------------------------------------
+
+def _receber_exato(conexao, tamanho):
+    dados = bytearray(tamanho)
+    vista = memoryview(dados)
+    recebidos = 0
+    while recebidos < tamanho:
+        lidos = conexao.recv_into(vista[recebidos:])
+        if lidos == 0:
+            raise ConnectionError("O coordenador fechou a conexão.")
+        recebidos += lidos
+    return dados
+
+
+class Trabalhador:
+    def __init__(self, host='127.0.0.1', porta=9300, nome=None, espera_conexao=10.0):
+        """
+        Configura o trabalhador.
+
+        Args:
+            host, porta: endereço do coordenador
+            nome: identificação nos relatórios (padrão: host:pid)
+            espera_conexao: segundos tentando conectar enquanto o coordenador não sobe
+        """
+        self.host = host
+        self.porta = porta
+        self.nome = nome or f"{socket.gethostname()}:{os.getpid()}"
+        self.espera_conexao = espera_conexao
+        self.resolvidos = 0
+
+    def _conectar(self):
+        prazo = time.monotonic() + self.espera_conexao
+        while True:
+            try:
+                return socket.create_connection((self.host, self.porta))
+            except ConnectionRefusedError:
+                if time.monotonic() >= prazo:
+                    raise
+                time.sleep(0.1)
+
+    def _enviar(self, conexao, tipo, partes=()):
+        # Resultados são pequenos perto do problema: uma cópia não pesa
+        conexao.sendall(b''.join(_mensagem(tipo, partes)))
+
+    def executar(self):
+        """Pede e resolve problemas até o coordenador enviar FIM. Retorna quantos resolveu."""
+        with self._conectar() as conexao:
+            conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._enviar(conexao, PRONTO, [self.nome.encode()])
+            while True:
+                tipo, tamanho = CABECALHO.unpack(_receber_exato(conexao, CABECALHO.size))
+                if tipo == FIM:
+                    return self.resolvidos
+                conteudo = _receber_exato(conexao, tamanho)
+                identificador, c, A, b, algoritmo = decodificar_tarefa(conteudo)
+                try:
+                    solucao = SimplexTabulado(c, A, b, algoritmo=algoritmo).resolver_silencioso()
+                except ValueError as erro:
+                    # Algoritmo incompatível com a base inicial: falha do problema, não do trabalhador
+                    self._enviar(conexao, ERRO, [META_ERRO.pack(identificador), str(erro).encode()])
+                    continue
+                self._enviar(conexao, RESULTADO, codificar_resultado(identificador, solucao))
+                self.resolvidos += 1
+
+
+# ---------------------------------------------------------------------------
+# Coordenador (asyncio)
+# ---------------------------------------------------------------------------
+
+class Coordenador:
+    def __init__(self, problemas, host='127.0.0.1', porta=9300, tentativas=3, tempo_tarefa=None):
+        """
+        Configura o coordenador.
+
+        Args:
+            problemas: lista de dicionários {'c', 'A', 'b'} e, opcionalmente, 'algoritmo'
+            host, porta: endereço de escuta ('0.0.0.0' para trabalhadores de outros
+                hosts; porta 0 escolhe uma porta livre)
+            tentativas: entregas de um problema antes de desistir dele (status 'falha')
+            tempo_tarefa: segundos de espera por um resultado antes de considerar o
+                trabalhador perdido (None: sem limite)
+        """
+        self.problemas = problemas
+        self.host = host
+        self.porta = porta
+        self.tentativas = tentativas
+        self.tempo_tarefa = tempo_tarefa
+
+        self.resultados = [None] * len(problemas)
+        self.pendentes = deque(range(len(problemas)))
+        self.entregas = [0] * len(problemas)
+        self.concluidos = 0
+        self.trabalhadores = {}
+        self.contadores = {'reenfileirados': 0, 'falhas': 0, 'erros': 0, 'conexoes': 0}
+        self.inicio = None
+        self.duracao = None
+        self._mensagens = [None] * len(problemas)
+        self._disponivel = None
+        self._conexoes = set()
+
+    def _mensagem_tarefa(self, indice):
+        # Codificada uma vez; reenvios usam as mesmas partes
+        if self._mensagens[indice] is None:
+            problema = self.problemas[indice]
+            self._mensagens[indice] = _mensagem(TAREFA, codificar_tarefa(
+                indice, problema['c'], problema['A'], problema['b'], problema.get('algoritmo', 'auto')))
+        return self._mensagens[indice]
+
+    def _concluir(self, indice, resultado):
+        self.resultados[indice] = resultado
+        self._mensagens[indice] = None
+        self.concluidos += 1
+
+    def _reenfileirar(self, indice, motivo):
+        """Devolve à fila o problema de um trabalhador perdido (ou desiste dele)."""
+        if self.entregas[indice] >= self.tentativas:
+            self.contadores['falhas'] += 1
+            self._concluir(indice, {'status': 'falha', 'erro': motivo, 'tentativas': self.entregas[indice]})
+        else:
+            self.contadores['reenfileirados'] += 1
+            self.pendentes.appendleft(indice)
+
+    async def _proximo(self):
+        """Próximo problema da fila; espera reenfileiramentos; None quando todos terminaram."""
+        async with self._disponivel:
+            while not self.pendentes and self.concluidos < len(self.problemas):
+                await self._disponivel.wait()
+            return self.pendentes.popleft() if self.pendentes else None
+
+    async def _avisar(self):
+        async with self._disponivel:
+            self._disponivel.notify_all()
+
+    async def _atender(self, leitor, escritor):
+        """Conversa com um trabalhador: entrega um problema por vez até acabar a fila."""
+        self._conexoes.add(asyncio.current_task())
+        self.contadores['conexoes'] += 1
+        escritor.transport.get_extra_info('socket').setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        indice = None
+        estatisticas = None
+        try:
+            tipo, tamanho = CABECALHO.unpack(await leitor.readexactly(CABECALHO.size))
+            if tipo != PRONTO:
+                return
+            nome = (await leitor.readexactly(tamanho)).decode(errors='replace')
+            estatisticas = self.trabalhadores.setdefault(nome, {'resolvidos': 0, 'segundos': 0.0, 'perdidos': 0})
+
+            while True:
+                indice = await self._proximo()
+                if indice is None:
+                    escritor.writelines(_mensagem(FIM))
+                    await escritor.drain()
+                    return
+                self.entregas[indice] += 1
+                inicio = time.perf_counter()
+                escritor.writelines(self._mensagem_tarefa(indice))
+                await escritor.drain()
+
+                tipo, tamanho = CABECALHO.unpack(
+                    await asyncio.wait_for(leitor.readexactly(CABECALHO.size), self.tempo_tarefa))
+                problema = self.problemas[indice]
+                n, m = len(problema['c']), len(problema['b'])
+                # Tamanho conferido antes da leitura: uma resposta truncada ou corrompida
+                # derruba a conexão e o problema volta para a fila
+                if tipo == RESULTADO and tamanho != META_RESULTADO.size + FLOAT.itemsize * (n + m):
+                    raise ValueError(f"RESULTADO com {tamanho} bytes para um problema {m} x {n}")
+                if tipo == ERRO and not META_ERRO.size <= tamanho <= META_ERRO.size + TAMANHO_MAXIMO_ERRO:
+                    raise ValueError(f"ERRO com {tamanho} bytes")
+                conteudo = await leitor.readexactly(tamanho)
+                if tipo == RESULTADO:
+                    _, solucao = decodificar_resultado(conteudo, n, m)
+                    solucao.update({'trabalhador': nome, 'tentativas': self.entregas[indice]})
+                    self._concluir(indice, solucao)
+                elif tipo == ERRO:
+                    self.contadores['erros'] += 1
+                    self._concluir(indice, {'status': 'erro', 'erro': conteudo[META_ERRO.size:].decode(errors='replace'),
+                                            'trabalhador': nome, 'tentativas': self.entregas[indice]})
+                else:
+                    raise ConnectionError(f"Mensagem inesperada do trabalhador {nome}: tipo {tipo}")
+                estatisticas['resolvidos'] += 1
+                estatisticas['segundos'] += time.perf_counter() - inicio
+                indice = None
+                await self._avisar()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, struct.error,
+                ValueError, IndexError) as erro:
+            if indice is not None:
+                if estatisticas is not None:
+                    estatisticas['perdidos'] += 1
+                self._reenfileirar(indice, f"{type(erro).__name__}: {erro}")
+                await self._avisar()
+        finally:
+            escritor.close()
+            self._conexoes.discard(asyncio.current_task())
+
+    async def executar(self, ao_iniciar=None):
+        """
+        Atende trabalhadores até resolver todos os problemas.
+
+        Args:
+            ao_iniciar: função chamada com a porta de escuta assim que o socket
+                está aberto (por exemplo, para iniciar trabalhadores locais)
+
+        Returns:
+            lista de resultados na ordem dos problemas ('status', 'z', 'x',
+            'folgas', 'iteracoes', 'trabalhador' e 'tentativas'; 'falha' ou
+            'erro' com 'erro' quando o problema não pôde ser resolvido)
+        """
+        self._disponivel = asyncio.Condition()
+        servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        self.porta = servidor.sockets[0].getsockname()[1]
+        self.inicio = time.perf_counter()
+        if ao_iniciar is not None:
+            ao_iniciar(self.porta)
+        try:
+            async with self._disponivel:
+                await self._disponivel.wait_for(lambda: self.concluidos == len(self.problemas))
+            self.duracao = time.perf_counter() - self.inicio
+            # Trabalhadores conectados recebem FIM em _proximo
+            await self._avisar()
+            if self._conexoes:
+                await asyncio.wait(self._conexoes, timeout=5.0)
+        finally:
+            servidor.close()
+            await servidor.wait_closed()
+        return self.resultados
+
+    def vazao(self):
+        """Retorna problemas concluídos, segundos, problemas/s e estatísticas por trabalhador."""
+        duracao = self.duracao if self.duracao is not None else time.perf_counter() - (self.inicio or 0.0)
+        return {
+            'problemas': self.concluidos,
+            'segundos': duracao,
+            'problemas_por_segundo': self.concluidos / duracao if duracao > 0 else None,
+            **self.contadores,
+            'trabalhadores': self.trabalhadores,
+        }
+
+    def relatorio(self):
+        """Retorna a vazão total e por trabalhador em texto."""
+        vazao = self.vazao()
+        linhas = [[nome, dados['resolvidos'], f"{dados['segundos']:.2f}", dados['perdidos']]
+                  for nome, dados in sorted(self.trabalhadores.items())]
+        texto = tabulate(linhas, headers=["Trabalhador", "Problemas", "Segundos ocupado", "Perdidos"],
+                         tablefmt="grid", stralign="center")
+        texto += (f"\n\n{vazao['problemas']} problemas em {vazao['segundos']:.2f} s "
+                  f"({vazao['problemas_por_segundo'] or 0:.1f} problemas/s); "
+                  f"{vazao['reenfileirados']} reenfileirados, {vazao['falhas']} falhas, {vazao['erros']} erros")
+        return texto
+
+
+# ---------------------------------------------------------------------------
+# Execução local e linha de comando
+# ---------------------------------------------------------------------------
+
+def _executar_trabalhador(host, porta, nome):
+    Trabalhador(host, porta, nome=nome).executar()
+
+
+def executar_local(problemas, trabalhadores=None, tentativas=3, tempo_tarefa=None):
+    """
+    Resolve os problemas com um coordenador e trabalhadores em processos deste host.
+
+    Args:
+        problemas: lista de dicionários {'c', 'A', 'b'} (ver Coordenador)
+        trabalhadores: número de processos trabalhadores (padrão: número de CPUs)
+
+    Returns:
+        (resultados, coordenador); coordenador.relatorio() traz a vazão
+    """
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    coordenador = Coordenador(problemas, porta=0, tentativas=tentativas, tempo_tarefa=tempo_tarefa)
+    processos = []
+
+    def iniciar_trabalhadores(porta):
+        # Criados antes de qualquer conexão ser aceita: o fork não herda sockets de trabalhadores
+        metodos = multiprocessing.get_all_start_methods()
+        contexto = multiprocessing.get_context('fork' if 'fork' in metodos else 'spawn')
+        for numero in range(trabalhadores):
+            processo = contexto.Process(target=_executar_trabalhador,
+                                        args=('127.0.0.1', porta, f"local-{numero + 1}"), daemon=True)
+            processo.start()
+            processos.append(processo)
+
+    try:
+        resultados = asyncio.run(coordenador.executar(ao_iniciar=iniciar_trabalhadores))
+    finally:
+        for processo in processos:
+            processo.join(timeout=5.0)
+            if processo.is_alive():
+                processo.terminate()
+    return resultados, coordenador
+
+
+def gerar_problemas(quantidade, tamanho, semente=0):
+    """Cenários aleatórios de maximização (tamanho x tamanho) com limites perturbados."""
+    rng = np.random.default_rng(semente)
+    A = rng.uniform(1.0, 10.0, size=(tamanho, tamanho))
+    c = -rng.uniform(1.0, 20.0, size=tamanho)
+    b = rng.uniform(100.0, 1000.0, size=tamanho)
+    return [{'c': c, 'A': A, 'b': b * rng.uniform(0.5, 1.5, size=tamanho)} for _ in range(quantidade)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolução distribuída do Simplex Tabulado via TCP")
+    subcomandos = parser.add_subparsers(dest='modo', required=True)
+
+    coordenador = subcomandos.add_parser('coordenador', help="distribui problemas aleatórios")
+    coordenador.add_argument('--host', default='0.0.0.0', help="endereço de escuta")
+    coordenador.add_argument('--porta', type=int, default=9300)
+    coordenador.add_argument('--tempo-tarefa', type=float, default=None,
+                             help="segundos até considerar um trabalhador perdido")
+
+    trabalhador = subcomandos.add_parser('trabalhador', help="resolve problemas de um coordenador")
+    trabalhador.add_argument('--host', default='127.0.0.1', help="endereço do coordenador")
+    trabalhador.add_argument('--porta', type=int, default=9300)
+    trabalhador.add_argument('--nome', default=None)
+
+    local = subcomandos.add_parser('local', help="coordenador e trabalhadores neste host")
+    local.add_argument('--trabalhadores', type=int, default=None)
+
+    for subcomando in (coordenador, local):
+        subcomando.add_argument('--problemas', type=int, default=200, help="número de problemas")
+        subcomando.add_argument('--tamanho', type=int, default=40, help="variáveis e restrições de cada problema")
+        subcomando.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.modo == 'trabalhador':
+        resolvidos = Trabalhador(args.host, args.porta, nome=args.nome).executar()
+        print(f"{resolvidos} problemas resolvidos")
+        return
+
+    print("\n==== SIMPLEX TABULADO DISTRIBUÍDO ====\n")
+    problemas = gerar_problemas(args.problemas, args.tamanho, args.semente)
+    if args.modo == 'local':
+        _, coordenador = executar_local(problemas, args.trabalhadores)
+    else:
+        coordenador = Coordenador(problemas, args.host, args.porta, tempo_tarefa=args.tempo_tarefa)
+        asyncio.run(coordenador.executar(
+            ao_iniciar=lambda porta: print(f"Coordenador em {args.host}:{porta}; aguardando trabalhadores")))
+    print(coordenador.relatorio())
+
+
+if __name__ == "__main__":
+    main()
@@ -3,27 +3,27 @@ import streamlit as st
 import pandas as pd
 from scipy.optimize import linprog
 import time
+import io
 from tabuladocore import SimplexTabulado, exibir_problema_completo  # Importar classes do arquivo original
+from tabuladocache import cache_compartilhado, chave_problema, entrada_de, restaurar
 
 # Configuração da página Streamlit
 st.set_page_config(page_title="Simplex Tabulado - Método Passo a Passo", layout="wide")
 st.title("Simplex Tabulado - Método Passo a Passo")
 
+@st.cache_resource
+def obter_cache():
+    """Cache de soluções compartilhado entre sessões e reexecuções do Streamlit"""
+    return cache_compartilhado()
+
 # Função para criar um dataframe estilizado da tabela simplex com destaque para o pivô
 def criar_tabela_estilizada(simplex, col_pivo=None, row_pivo=None):
     # Preparar dados para o DataFrame
-    colunas = [f'X{i+1}' for i in range(simplex.num_vars)] + \
-              [f'F{i+1}' for i in range(simplex.num_restricoes)] + \
-              ['Constante']
+    # Nomes lidos da tabela: na Fase I ela também tem as colunas artificiais
+    colunas = [simplex.nome_variavel(j) for j in range(simplex.tabela.shape[1] - 1)] + ['Constante']
     
     # Obter as variáveis básicas atuais da tabela
-    var_basicas = []
-    for i in range(simplex.num_restricoes):
-        vb_idx = simplex.base[i]
-        if vb_idx < simplex.num_vars:
-            var_basicas.append(f'X{vb_idx+1}')  # Variável de decisão na base
-        else:
-            var_basicas.append(f'F{vb_idx-simplex.num_vars+1}')  # Variável de folga na base
+    var_basicas = [simplex.nome_variavel(simplex.base[i]) for i in range(simplex.num_restricoes)]
     
     # Criar dados para o DataFrame - Linha Z à parte e linhas das restrições
     linha_z = simplex.tabela[-1, :].copy()  # Linha Z com os valores negativos
@@ -46,8 +46,8 @@ def criar_tabela_estilizada(simplex, col_pivo=None, row_pivo=None):
     coluna_z = [1] + [0] * simplex.num_restricoes
     df.insert(0, "Z", coluna_z)
     
-    # Adicionar coluna de divisão se necessário
-    if col_pivo is not None:
+    # Adicionar coluna de divisão se necessário (apenas no simplex primal)
+    if col_pivo is not None and simplex.algoritmo_atual != 'dual':
         razoes = []
         razoes.append(None)  # Sem razão para linha Z
         for i in range(simplex.num_restricoes):
@@ -102,13 +102,8 @@ def criar_tabela_estilizada(simplex, col_pivo=None, row_pivo=None):
 
 def executar_simplex_interativo():
     # Inicializar o estado da sessão se ainda não existir
-    if 'simplex' not in st.session_state:
-        simplex = st.session_state['simplex'] 
-        st.session_state['iteracao'] = 0
-        st.session_state['finalizado'] = False
-        st.session_state['passos'] = []
-        st.session_state['col_pivo'] = None
-        st.session_state['row_pivo'] = None
+    if 'passos_simplex' not in st.session_state:
+        iniciar_estado_simplex(st.session_state['simplex'])
     
     # Container para exibir a tabela atual
     tabela_container = st.container()
@@ -122,6 +117,13 @@ def executar_simplex_interativo():
     
     with col2:
         if st.button("Mostrar Solução Completa"):
+            entrada = obter_cache().obter(st.session_state['chave_cache']) if 'chave_cache' in st.session_state else None
+            if entrada is not None and 'passos' in entrada:
+                # Passos guardados numa resolução anterior: restaurar sem resolver de novo
+                st.session_state['simplex'] = restaurar(entrada, st.session_state['c'],
+                                                        st.session_state['A'], st.session_state['b'])
+                st.session_state['passos'] = list(entrada['passos'])
+                st.session_state['finalizado'] = True
             # Executar todos os passos até encontrar a solução
             while not st.session_state['finalizado']:
                 avancar_simplex(force_no_rerun=True)
@@ -133,104 +135,88 @@ def executar_simplex_interativo():
             # Limpar o estado e reiniciar o simplex
             if 'c' in st.session_state and 'A' in st.session_state and 'b' in st.session_state:
                 simplex = SimplexTabulado(st.session_state['c'], st.session_state['A'], st.session_state['b'])
-                st.session_state['simplex'] = simplex
-                st.session_state['iteracao'] = 0
-                st.session_state['finalizado'] = False
-                st.session_state['passos'] = []
-                st.session_state['col_pivo'] = None
-                st.session_state['row_pivo'] = None
-                
-                # Adicionar a tabela inicial
-                st.session_state['passos'].append({
-                    'tipo': 'inicial',
-                    'titulo': "Tabela Inicial",
-                    'tabela': simplex.tabela.copy(),
-                    'col_pivo': None,
-                    'row_pivo': None
-                })
+                iniciar_estado_simplex(simplex)
                 
                 # Forçar a atualização da interface
                 st.rerun()
     
+    # Estatísticas e limpeza do cache de soluções
+    estatisticas = obter_cache().estatisticas()
+    col_cache, col_limpar = st.columns([3, 1])
+    with col_cache:
+        st.caption(f"Cache de soluções: {estatisticas['acertos_memoria'] + estatisticas['acertos_disco']} acertos, "
+                   f"{estatisticas['falhas']} falhas, {estatisticas['entradas_memoria']} entradas em memória")
+    with col_limpar:
+        if st.button("Limpar Cache"):
+            obter_cache().invalidar()
+            st.rerun()
+    
     # Exibir os passos registrados
     exibir_passos_atuais(tabela_container)
 
+def iniciar_estado_simplex(simplex):
+    """Guarda o simplex e o gerador de passos no estado da sessão, com a tabela inicial"""
+    st.session_state['simplex'] = simplex
+    st.session_state['passos_simplex'] = simplex.passos()
+    st.session_state['finalizado'] = False
+    st.session_state['passos'] = [{
+        'tipo': 'inicial',
+        'titulo': "Tabela Inicial",
+        'tabela': simplex.tabela.copy(),
+        'col_pivo': None,
+        'row_pivo': None
+    }]
+
+# Títulos exibidos para cada tipo de passo gerado por SimplexTabulado.passos()
+TITULOS_PASSOS = {
+    'pivotamento_pendente': "Iteração {iteracao} - Seleção do Pivô",
+    'pivotamento': "Tabela após pivotamento (Iteração {iteracao})",
+    'final': "Solução Ótima Encontrada",
+    'ilimitado': "Problema Ilimitado",
+    'inviavel': "Problema Inviável",
+    'fase1': "Fim da Fase I - Base Viável Encontrada (Iteração {iteracao})",
+}
+
 def avancar_simplex(force_no_rerun=False):
     """Avança um passo no algoritmo simplex"""
     if st.session_state['finalizado']:
         return
-        
-    simplex = st.session_state['simplex']
-    iteracao = st.session_state['iteracao']
     
-    # Se não for a primeira iteração e temos um pivô, realizar o pivotamento
-    if iteracao > 0 and st.session_state['col_pivo'] is not None and st.session_state['row_pivo'] is not None:
-        col_pivo = st.session_state['col_pivo']
-        row_pivo = st.session_state['row_pivo']
-        
-        # Realizar o pivotamento
-        simplex.pivotar(row_pivo, col_pivo)
-        
-        # Registrar o passo de pivotamento
-        st.session_state['passos'].append({
-            'tipo': 'pivotamento',
-            'titulo': f"Tabela após pivotamento (Iteração {iteracao})",
-            'tabela': simplex.tabela.copy(),
-            'base': simplex.base.copy(),
-            'col_pivo': None,
-            'row_pivo': None
-        })
-        
-        # Limpar o pivô atual
-        st.session_state['col_pivo'] = None
-        st.session_state['row_pivo'] = None
-    
-    # Encontrar o próximo pivô
-    col_pivo = simplex.encontrar_coluna_pivo()
+    simplex = st.session_state['simplex']
     
-    # Verificar se chegamos à solução ótima
-    if col_pivo == -1:
-        st.session_state['finalizado'] = True
+    # Consumir passos do gerador até a próxima seleção de pivô ou o fim.
+    # O gerador só faz o trabalho de cada passo quando ele é pedido.
+    for passo in st.session_state['passos_simplex']:
         st.session_state['passos'].append({
-            'tipo': 'final',
-            'titulo': "Solução Ótima Encontrada",
+            'tipo': passo['tipo'],
+            'titulo': TITULOS_PASSOS[passo['tipo']].format(iteracao=passo['iteracao']),
             'tabela': simplex.tabela.copy(),
             'base': simplex.base.copy(),
-            'col_pivo': None,
-            'row_pivo': None
+            'algoritmo': simplex.algoritmo_atual,
+            # A tabela após o pivotamento é exibida sem destaque
+            'col_pivo': None if passo['tipo'] == 'pivotamento' else passo['col_pivo'],
+            'row_pivo': None if passo['tipo'] == 'pivotamento' else passo['row_pivo']
         })
-    else:
-        row_pivo = simplex.encontrar_linha_pivo(col_pivo)
         
-        # Verificar se o problema é ilimitado
-        if row_pivo == -1:
+        if passo['tipo'] in ('final', 'ilimitado', 'inviavel'):
             st.session_state['finalizado'] = True
-            st.session_state['passos'].append({
-                'tipo': 'ilimitado',
-                'titulo': "Problema Ilimitado",
-                'tabela': simplex.tabela.copy(),
-                'base': simplex.base.copy(),
-                'col_pivo': col_pivo,
-                'row_pivo': None
-            })
-        else:
-            # Registrar o pivô para o próximo passo
-            st.session_state['col_pivo'] = col_pivo
-            st.session_state['row_pivo'] = row_pivo
-            st.session_state['passos'].append({
-                'tipo': 'pivotamento_pendente',
-                'titulo': f"Iteração {iteracao+1} - Seleção do Pivô",
-                'tabela': simplex.tabela.copy(),
-                'base': simplex.base.copy(),
-                'col_pivo': col_pivo,
-                'row_pivo': row_pivo
-            })
-            st.session_state['iteracao'] += 1
+            guardar_no_cache(simplex)
+            break
+        if passo['tipo'] == 'pivotamento_pendente':
+            break
     
     # Forçar a atualização da interface, apenas se não estiver no modo "sem rerun"
     if not force_no_rerun:
         st.rerun()
 
+def guardar_no_cache(simplex):
+    """Guarda a solução e os passos exibidos no cache, para as próximas resoluções do mesmo problema"""
+    if 'chave_cache' not in st.session_state:
+        return
+    entrada = entrada_de(simplex)
+    entrada['passos'] = list(st.session_state['passos'])
+    obter_cache().guardar(st.session_state['chave_cache'], entrada)
+
 def exibir_passos_atuais(container):
     """Exibe os passos atuais do algoritmo simplex"""
     if 'passos' not in st.session_state or not st.session_state['passos']:
@@ -245,15 +231,17 @@ def exibir_passos_atuais(container):
             
             # Definir a tabela para este passo
             simplex.tabela = passo['tabela'].copy()
+            simplex.num_total_vars = simplex.tabela.shape[1] - 1
             
             # Se for a tabela inicial, usar a base original (todas as folgas)
             # Se não, usar a base salva para este passo específico
             if passo['tipo'] == 'inicial' or idx == 0:
                 # Base inicial: todas as folgas F1, F2, F3...
-                simplex.base = [simplex.num_vars + i for i in range(simplex.num_restricoes)]
+                simplex.definir_base(np.arange(simplex.num_vars, simplex.num_vars + simplex.num_restricoes))
             elif 'base' in passo:
                 # Base salva com este passo
-                simplex.base = passo['base'].copy()
+                simplex.definir_base(passo['base'])
+            simplex.algoritmo_atual = passo.get('algoritmo')
             
             # Criar e exibir a tabela estilizada
             styled_df = criar_tabela_estilizada(
@@ -285,16 +273,8 @@ def exibir_passos_atuais(container):
                 row_idx = passo['row_pivo']
                 elemento_pivo = simplex.tabela[row_idx, col_idx]
                 
-                if col_idx < simplex.num_vars:
-                    var_entrada = f"X{col_idx+1}"
-                else:
-                    var_entrada = f"F{col_idx-simplex.num_vars+1}"
-                    
-                vb_idx = simplex.base[row_idx]
-                if vb_idx < simplex.num_vars:
-                    var_saida = f"X{vb_idx+1}"
-                else:
-                    var_saida = f"F{vb_idx-simplex.num_vars+1}"
+                var_entrada = simplex.nome_variavel(col_idx)
+                var_saida = simplex.nome_variavel(simplex.base[row_idx])
                 
                 with col2:
                     st.info(f"""
@@ -305,20 +285,10 @@ def exibir_passos_atuais(container):
             
             # Exibir resultados finais
             elif passo['tipo'] == 'final':
-                z_otimo = -simplex.tabela[-1, -1]
-                
-                # Valores das variáveis de decisão
-                valores_x = [0] * simplex.num_vars
-                for i, var_base in enumerate(simplex.base):
-                    if var_base < simplex.num_vars:
-                        valores_x[var_base] = simplex.tabela[i, -1]
-                
-                # Valores das variáveis de folga
-                valores_folga = [0] * simplex.num_restricoes
-                for i, var_base in enumerate(simplex.base):
-                    if var_base >= simplex.num_vars:
-                        idx = var_base - simplex.num_vars
-                        valores_folga[idx] = simplex.tabela[i, -1]
+                solucao = simplex.obter_solucao()
+                z_otimo = solucao['z']
+                valores_x = solucao['x']
+                valores_folga = solucao['folgas']
                 
                 with col2:
                     st.success(f"""
@@ -336,12 +306,72 @@ def exibir_passos_atuais(container):
                 with col2:
                     st.error("O problema é ilimitado! Não há solução ótima finita.")
             
+            # Exibir mensagem para problema inviável (simplex dual)
+            elif passo['tipo'] == 'inviavel':
+                with col2:
+                    st.error(f"O problema é inviável! A restrição da linha {passo['row_pivo']+2} não pode ser satisfeita.")
+            
             st.markdown("---")
 
+# Problemas maiores que isto são resumidos em vez de exibidos termo a termo
+MAX_TERMOS_EXIBIDOS = 400
+
+def matriz_para_problema(matriz):
+    """
+    Separa a matriz de entrada em massa em c, A e b (sem laços por coeficiente).
+    
+    A primeira linha traz os coeficientes da função objetivo (maximização) e um
+    valor ignorado na última coluna; as demais linhas trazem os coeficientes de
+    cada restrição e o lado direito na última coluna.
+    """
+    matriz = np.asarray(matriz, dtype=float)
+    if matriz.ndim != 2 or matriz.shape[0] < 2 or matriz.shape[1] < 2:
+        raise ValueError("A matriz deve ter pelo menos 2 linhas (objetivo e uma restrição) e 2 colunas.")
+    if not np.all(np.isfinite(matriz[:, :-1])) or not np.all(np.isfinite(matriz[1:, -1])):
+        raise ValueError("A matriz contém valores vazios ou não numéricos.")
+    c = -matriz[0, :-1] + 0.0  # Negativo para maximização (+ 0.0 evita exibir -0.00)
+    A = matriz[1:, :-1]
+    b = matriz[1:, -1]
+    return c, A, b
+
+def ler_arquivo_problema(arquivo):
+    """Lê a matriz de entrada em massa de um arquivo CSV ou NPY enviado."""
+    dados = arquivo.getvalue()
+    if arquivo.name.lower().endswith('.npy'):
+        return np.load(io.BytesIO(dados), allow_pickle=False)
+    # Leitor em C do pandas, sem cabeçalho; separador vírgula ou ponto e vírgula
+    separador = ';' if b';' in dados.split(b'\n', 1)[0] else ','
+    return pd.read_csv(io.BytesIO(dados), header=None, sep=separador).to_numpy(dtype=float)
+
+def editar_grade(num_vars, num_restricoes):
+    """Grade editável (st.data_editor) com uma única matriz para c, A e b."""
+    forma = (num_restricoes + 1, num_vars + 1)
+    valores = st.session_state.get('grade_valores')
+    if valores is None:
+        # Começar pelo exemplo predefinido
+        valores = np.array([[40, 30, 20, 0], [2, 5, 10, 900], [2, 5, 1, 400], [4, 2, 2, 600]], dtype=float)
+    if valores.shape != forma or 'grade_base' not in st.session_state:
+        # Redimensionar mantendo os valores que ainda cabem (o lado direito fica na última coluna)
+        novos = np.zeros(forma)
+        linhas = min(forma[0], valores.shape[0])
+        colunas = min(forma[1], valores.shape[1]) - 1
+        novos[:linhas, :colunas] = valores[:linhas, :colunas]
+        novos[:linhas, -1] = valores[:linhas, -1]
+        st.session_state['grade_base'] = pd.DataFrame(
+            novos,
+            index=["Z"] + [f"R{i+1}" for i in range(num_restricoes)],
+            columns=[f"x{j+1}" for j in range(num_vars)] + ["≤"])
+    
+    editada = st.data_editor(st.session_state['grade_base'], key=f"grade_{forma[0]}_{forma[1]}",
+                             use_container_width=True)
+    st.session_state['grade_valores'] = editada.to_numpy(dtype=float)
+    return st.session_state['grade_valores']
+
 def interface_entrada_dados():
     st.subheader("Configuração do Problema de Programação Linear")
     
-    opcao = st.radio("Escolha uma opção:", ["Usar exemplo predefinido", "Inserir dados manualmente"])
+    opcao = st.radio("Escolha uma opção:", ["Usar exemplo predefinido", "Inserir dados manualmente",
+                                            "Editar em grade", "Carregar arquivo (CSV/NPY)"])
     
     if opcao == "Usar exemplo predefinido":
         st.info("Usando o exemplo predefinido:")
@@ -361,6 +391,33 @@ def interface_entrada_dados():
         st.markdown("4x₁ + 2x₂ + 2x₃ ≤ 600")
         st.markdown("x₁, x₂, x₃ ≥ 0")
         
+    elif opcao in ("Editar em grade", "Carregar arquivo (CSV/NPY)"):
+        st.caption("Linha Z: coeficientes da função objetivo (maximização); a última coluna é ignorada. "
+                   "Linhas seguintes: coeficientes de cada restrição e o lado direito (≤) na última coluna.")
+        c = None
+        if opcao == "Editar em grade":
+            col_vars, col_restricoes = st.columns(2)
+            with col_vars:
+                num_vars = st.number_input("Número de variáveis de decisão:", min_value=1, max_value=500, value=3)
+            with col_restricoes:
+                num_restricoes = st.number_input("Número de restrições:", min_value=1, max_value=500, value=3)
+            matriz = editar_grade(int(num_vars), int(num_restricoes))
+        else:
+            arquivo = st.file_uploader("Arquivo com a matriz do problema", type=["csv", "npy"])
+            matriz = None
+            if arquivo is not None:
+                try:
+                    matriz = ler_arquivo_problema(arquivo)
+                except (ValueError, OSError) as erro:
+                    st.error(f"Não foi possível ler o arquivo: {erro}")
+        
+        if matriz is not None:
+            try:
+                c, A, b = matriz_para_problema(matriz)
+                st.info(f"{A.shape[0]} restrições e {A.shape[1]} variáveis de decisão")
+            except ValueError as erro:
+                st.error(str(erro))
+        
     else:  # Inserir dados manualmente
         st.subheader("Configuração Manual")
         
@@ -400,54 +457,41 @@ def interface_entrada_dados():
             A.append(row)
     
     # Exibir formulação completa
-    if st.button("Configurar Problema"):
+    if st.button("Configurar Problema", disabled=c is None):
         # Armazenar os dados no estado da sessão
         st.session_state['c'] = c
         st.session_state['A'] = A
         st.session_state['b'] = b
+        st.session_state['chave_cache'] = chave_problema(c, A, b, algoritmo='auto')
         
-        # Inicializar o simplex
-        simplex = SimplexTabulado(c, A, b)
-        st.session_state['simplex'] = simplex
-        
-        # Inicializar as variáveis de controle
-        st.session_state['iteracao'] = 0
-        st.session_state['finalizado'] = False
-        st.session_state['passos'] = []
-        st.session_state['col_pivo'] = None
-        st.session_state['row_pivo'] = None
-        
-        # Adicionar a tabela inicial
-        st.session_state['passos'].append({
-            'tipo': 'inicial',
-            'titulo': "Tabela Inicial",
-            'tabela': simplex.tabela.copy(),
-            'col_pivo': None,
-            'row_pivo': None
-        })
+        # Inicializar o simplex e as variáveis de controle
+        iniciar_estado_simplex(SimplexTabulado(c, A, b))
         
-        # Exibir o problema completo
+        # Exibir o problema completo (resumido para problemas grandes)
         st.subheader("Problema de Programação Linear")
-        coefs_positivos = [-coef for coef in c]
-        termos_z = []
-        for i, coef in enumerate(coefs_positivos):
-            if coef != 0:
-                termos_z.append(f"{coef:.0f}x{i+1}")
-        funcao_z = " + ".join(termos_z)
-        st.markdown(f"**Z = {funcao_z}**")
-        
-        st.markdown("**Restrições:**")
-        for i, (restricao, rhs) in enumerate(zip(A, b)):
-            termos = []
-            for j, coef in enumerate(restricao):
+        if np.size(A) > MAX_TERMOS_EXIBIDOS:
+            st.markdown(f"**{len(b)} restrições e {len(c)} variáveis de decisão**")
+        else:
+            coefs_positivos = [-coef for coef in c]
+            termos_z = []
+            for i, coef in enumerate(coefs_positivos):
                 if coef != 0:
-                    termos.append(f"{coef:.0f}x{j+1}")
-            eq_restricao = " + ".join(termos)
-            st.markdown(f"R{i+1}: {eq_restricao} ≤ {rhs:.0f}")
-        
-        st.markdown("**Não-negatividade:**")
-        vars_x = [f"x{i+1}" for i in range(len(c))]
-        st.markdown(", ".join(vars_x) + " ≥ 0")
+                    termos_z.append(f"{coef:.0f}x{i+1}")
+            funcao_z = " + ".join(termos_z)
+            st.markdown(f"**Z = {funcao_z}**")
+            
+            st.markdown("**Restrições:**")
+            for i, (restricao, rhs) in enumerate(zip(A, b)):
+                termos = []
+                for j, coef in enumerate(restricao):
+                    if coef != 0:
+                        termos.append(f"{coef:.0f}x{j+1}")
+                eq_restricao = " + ".join(termos)
+                st.markdown(f"R{i+1}: {eq_restricao} ≤ {rhs:.0f}")
+            
+            st.markdown("**Não-negatividade:**")
+            vars_x = [f"x{i+1}" for i in range(len(c))]
+            st.markdown(", ".join(vars_x) + " ≥ 0")
         
         # Forçar a atualização da interface
         st.rerun()
@@ -0,0 +1,157 @@
+"""
+Instrumentação opcional do Simplex Tabulado.
+
+Mede o tempo gasto em cada fase do método (precificação, teste da razão,
+pivotamento e exibição), conta pivôs e pivôs degenerados e registra o pico de
+memória via tracemalloc. A instrumentação substitui os métodos apenas na
+instância instrumentada; um SimplexTabulado sem instrumentação não executa
+nenhum código extra.
+
+Uso:
+    instrumentacao = Instrumentacao()
+    instrumentacao.adicionar_observador(lambda evento, dados: print(evento, dados))
+    simplex = SimplexTabulado(c, A, b, instrumentacao=instrumentacao)
+    simplex.resolver()
+    instrumentacao.finalizar()
+    print(instrumentacao.relatorio())
+"""
+import time
+import tracemalloc
+
+from tabulate import tabulate
+
+# Fases medidas
+FASES = ['precificacao', 'razao', 'pivotamento', 'exibicao']
+
+# Método do SimplexTabulado -> fase em que seu tempo é contabilizado.
+# No simplex dual a precificação escolhe a linha e a razão escolhe a coluna.
+METODOS = {
+    'encontrar_coluna_pivo': 'precificacao',
+    'encontrar_linha_pivo_dual': 'precificacao',
+    'encontrar_linha_pivo': 'razao',
+    'encontrar_coluna_pivo_dual': 'razao',
+    'pivotar': 'pivotamento',
+    'exibir_tabela': 'exibicao',
+}
+
+
+class Instrumentacao:
+    def __init__(self, medir_memoria=True, tolerancia_degenerado=1e-9):
+        """
+        Cria um coletor de métricas para um ou mais SimplexTabulado.
+
+        Args:
+            medir_memoria: se True, usa o tracemalloc para medir o pico de memória
+            tolerancia_degenerado: valor abaixo do qual o lado direito da linha
+                do pivô caracteriza um pivô degenerado
+        """
+        self.medir_memoria = medir_memoria
+        self.tolerancia_degenerado = tolerancia_degenerado
+        self.observadores = []
+        self.tempos = dict.fromkeys(FASES, 0.0)
+        self.chamadas = dict.fromkeys(FASES, 0)
+        self.pivos = 0
+        self.pivos_degenerados = 0
+        self.memoria_pico = None
+        self._iniciou_tracemalloc = False
+
+    def adicionar_observador(self, observador):
+        """
+        Registra um observador chamado como observador(evento, dados).
+
+        Eventos:
+            'fase': dados = {'fase', 'duracao'} ao final de cada método medido
+            'pivo': dados = {'linha', 'coluna', 'degenerado', 'pivos'} antes de cada pivotamento
+            'fim': dados = resumo() quando finalizar() é chamado
+        """
+        self.observadores.append(observador)
+
+    def _notificar(self, evento, dados):
+        for observador in self.observadores:
+            observador(evento, dados)
+
+    def anexar(self, simplex):
+        """Substitui os métodos medidos de `simplex` por versões cronometradas."""
+        if self.medir_memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+
+        for nome_metodo, fase in METODOS.items():
+            setattr(simplex, nome_metodo, self._cronometrar(fase, getattr(simplex, nome_metodo)))
+
+        pivotar = simplex.pivotar
+
+        def pivotar_contando(row_pivo, col_pivo, *args, **kwargs):
+            # Pivô degenerado: passo nulo no primal (lado direito zero) ou no
+            # dual (custo reduzido zero na coluna de entrada)
+            if simplex.algoritmo_atual == 'dual':
+                passo = simplex.tabela[-1, col_pivo]
+            else:
+                passo = simplex.tabela[row_pivo, -1]
+            degenerado = abs(passo) <= self.tolerancia_degenerado
+            self.pivos += 1
+            self.pivos_degenerados += degenerado
+            if self.observadores:
+                self._notificar('pivo', {'linha': row_pivo, 'coluna': col_pivo,
+                                         'degenerado': degenerado, 'pivos': self.pivos})
+            return pivotar(row_pivo, col_pivo, *args, **kwargs)
+
+        simplex.pivotar = pivotar_contando
+        return simplex
+
+    def _cronometrar(self, fase, metodo):
+        def metodo_cronometrado(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return metodo(*args, **kwargs)
+            finally:
+                duracao = time.perf_counter() - inicio
+                self.tempos[fase] += duracao
+                self.chamadas[fase] += 1
+                if self._iniciou_tracemalloc:
+                    self.memoria_pico = tracemalloc.get_traced_memory()[1]
+                if self.observadores:
+                    self._notificar('fase', {'fase': fase, 'duracao': duracao})
+        return metodo_cronometrado
+
+    def finalizar(self):
+        """Encerra a medição de memória e notifica os observadores com o resumo."""
+        if self._iniciou_tracemalloc:
+            self.memoria_pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self._iniciou_tracemalloc = False
+        self._notificar('fim', self.resumo())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.finalizar()
+        return False
+
+    def resumo(self):
+        """Retorna as métricas coletadas em um dicionário."""
+        return {
+            'tempos': dict(self.tempos),
+            'chamadas': dict(self.chamadas),
+            'pivos': self.pivos,
+            'pivos_degenerados': self.pivos_degenerados,
+            'memoria_pico_bytes': self.memoria_pico,
+        }
+
+    def relatorio(self):
+        """Retorna um relatório em texto com o tempo de cada fase e os contadores."""
+        total = sum(self.tempos.values())
+        linhas = []
+        for fase in FASES:
+            tempo = self.tempos[fase]
+            percentual = 100 * tempo / total if total > 0 else 0.0
+            linhas.append([fase, self.chamadas[fase], f"{tempo * 1e3:.3f}", f"{percentual:.1f}%"])
+        linhas.append(["total", sum(self.chamadas.values()), f"{total * 1e3:.3f}", "100.0%"])
+
+        texto = tabulate(linhas, headers=["Fase", "Chamadas", "Tempo (ms)", "%"],
+                         tablefmt="grid", stralign="center")
+        texto += f"\n\nPivôs: {self.pivos} (degenerados: {self.pivos_degenerados})"
+        if self.memoria_pico is not None:
+            texto += f"\nPico de memória: {self.memoria_pico / 1024:.1f} KiB"
+        return texto
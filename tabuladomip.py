@@ -0,0 +1,249 @@
+"""
+Branch-and-bound para variáveis inteiras sobre o Simplex Tabulado.
+
+Cada nó é ramificado adicionando uma restrição de limite (x_j ≤ piso ou
+x_j ≥ teto) à tabela ótima do nó pai, que é então reotimizada pelo simplex
+dual em vez de resolver o problema do zero. Os nós abertos são resolvidos em
+paralelo num pool de processos, escolhidos pelo melhor limite ou em
+profundidade.
+
+Uso:
+    bb = BranchAndBound(c, A, b, inteiras=[0, 1, 2], processos=4)
+    resultado = bb.resolver()
+    print(bb.relatorio())
+"""
+import heapq
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+from tabulate import tabulate
+
+from tabuladocore import SimplexTabulado
+
+
+def resolver_no(simplex, variavel, sentido, valor):
+    """
+    Resolve um nó filho a partir da tabela ótima do pai (executado nos processos do pool).
+
+    Args:
+        simplex: SimplexTabulado ótimo do nó pai
+        variavel: índice da variável ramificada
+        sentido: '<=' para x_j ≤ piso(valor) ou '>=' para x_j ≥ teto(valor)
+        valor: valor fracionário de x_j no nó pai
+
+    Returns:
+        o SimplexTabulado do filho, reotimizado pelo simplex dual
+    """
+    coeficientes = np.zeros(simplex.num_vars)
+    if sentido == '<=':
+        coeficientes[variavel] = 1.0
+        simplex.adicionar_restricao(coeficientes, math.floor(valor))
+    else:
+        coeficientes[variavel] = -1.0
+        simplex.adicionar_restricao(coeficientes, -math.ceil(valor))
+    simplex.resolver_silencioso()
+    return simplex
+
+
+class BranchAndBound:
+    def __init__(self, c, A, b, inteiras=None, selecao='melhor_limite', processos=None,
+                 tolerancia=1e-6, max_nos=None):
+        """
+        Prepara o problema inteiro misto.
+
+        Args:
+            c, A, b: problema no formato do SimplexTabulado (maximização, c negativo)
+            inteiras: índices das variáveis inteiras (padrão: todas)
+            selecao: 'melhor_limite' ou 'profundidade'
+            processos: número de processos do pool (1 resolve no próprio processo;
+                padrão: número de CPUs)
+            tolerancia: tolerância de integralidade e de poda
+            max_nos: limite opcional de nós resolvidos
+        """
+        if selecao not in ('melhor_limite', 'profundidade'):
+            raise ValueError("selecao deve ser 'melhor_limite' ou 'profundidade'")
+        self.c, self.A, self.b = c, A, b
+        self.inteiras = np.arange(len(c)) if inteiras is None else np.asarray(inteiras)
+        self.selecao = selecao
+        self.processos = processos or os.cpu_count() or 1
+        self.tolerancia = tolerancia
+        self.max_nos = max_nos
+
+        # Estatísticas
+        self.nos_resolvidos = 0
+        self.nos_podados = 0
+        self.nos_inviaveis = 0
+        self.tempo = 0.0
+        self.melhor_z = -math.inf
+        self.melhor_x = None
+
+    def _variavel_fracionaria(self, x):
+        """Retorna o índice da variável inteira mais fracionária, ou None."""
+        fracao = np.abs(x[self.inteiras] - np.round(x[self.inteiras]))
+        k = int(np.argmax(fracao))
+        if fracao[k] <= self.tolerancia:
+            return None
+        return int(self.inteiras[k])
+
+    def _prioridade(self, limite, profundidade, contador):
+        # heapq é de mínimo: maior limite (ou maior profundidade) sai primeiro
+        if self.selecao == 'melhor_limite':
+            return (-limite, contador)
+        return (-profundidade, -limite, contador)
+
+    def _processar(self, simplex, profundidade, abertos, contador):
+        """Atualiza a incumbente ou ramifica um nó resolvido."""
+        self.nos_resolvidos += 1
+        if simplex.status != 'otimo':
+            self.nos_inviaveis += 1
+            return
+        solucao = simplex.obter_solucao()
+        z = solucao['z']
+        if z <= self.melhor_z + self.tolerancia:
+            self.nos_podados += 1
+            return
+
+        variavel = self._variavel_fracionaria(solucao['x'])
+        if variavel is None:
+            self.melhor_z = z
+            self.melhor_x = np.round(solucao['x'], 9)
+            return
+
+        valor = solucao['x'][variavel]
+        for sentido in ('<=', '>='):
+            heapq.heappush(abertos, (self._prioridade(z, profundidade + 1, next(contador)),
+                                     z, profundidade + 1, simplex, variavel, sentido, valor))
+
+    def resolver(self):
+        """
+        Executa o branch-and-bound.
+
+        Returns:
+            dicionário com 'status' ('otimo', 'inviavel', 'ilimitado' ou
+            'limite_nos'), 'z', 'x' e as estatísticas de estatisticas()
+        """
+        inicio = time.perf_counter()
+        raiz = SimplexTabulado(self.c, self.A, self.b)
+        raiz.resolver_silencioso()
+        if raiz.status == 'ilimitado':
+            self.tempo = time.perf_counter() - inicio
+            return self._resultado('ilimitado')
+
+        abertos = []
+        contador = itertools.count()
+        self._processar(raiz, 0, abertos, contador)
+
+        executor = ProcessPoolExecutor(self.processos) if self.processos > 1 else None
+        pendentes = {}
+        try:
+            while abertos or pendentes:
+                # Enviar nós abertos até ocupar todos os processos
+                while abertos and len(pendentes) < self.processos and not self._limite_atingido(len(pendentes)):
+                    _, limite, profundidade, pai, variavel, sentido, valor = heapq.heappop(abertos)
+                    if limite <= self.melhor_z + self.tolerancia:
+                        self.nos_podados += 1
+                        continue
+                    if executor is None:
+                        filho = resolver_no(_copiar(pai), variavel, sentido, valor)
+                        self._processar(filho, profundidade, abertos, contador)
+                    else:
+                        futuro = executor.submit(resolver_no, pai, variavel, sentido, valor)
+                        pendentes[futuro] = profundidade
+
+                if not pendentes:
+                    if self._limite_atingido(0):
+                        break
+                    continue
+
+                prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    self._processar(futuro.result(), pendentes.pop(futuro), abertos, contador)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        self.tempo = time.perf_counter() - inicio
+        if abertos:
+            return self._resultado('limite_nos')
+        return self._resultado('otimo' if self.melhor_x is not None else 'inviavel')
+
+    def _limite_atingido(self, pendentes):
+        return self.max_nos is not None and self.nos_resolvidos + pendentes >= self.max_nos
+
+    def _resultado(self, status):
+        return {
+            'status': status,
+            'z': None if self.melhor_x is None else self.melhor_z,
+            'x': self.melhor_x,
+            **self.estatisticas()
+        }
+
+    def estatisticas(self):
+        """Retorna o número de nós e a vazão de nós por segundo."""
+        return {
+            'nos_resolvidos': self.nos_resolvidos,
+            'nos_podados': self.nos_podados,
+            'nos_inviaveis': self.nos_inviaveis,
+            'tempo_s': self.tempo,
+            'nos_por_segundo': self.nos_resolvidos / self.tempo if self.tempo > 0 else None,
+            'processos': self.processos,
+            'selecao': self.selecao,
+        }
+
+    def relatorio(self):
+        """Retorna o relatório de vazão de nós em texto."""
+        estatisticas = self.estatisticas()
+        vazao = estatisticas['nos_por_segundo']
+        linhas = [
+            ["Seleção de nós", self.selecao],
+            ["Processos", self.processos],
+            ["Nós resolvidos", self.nos_resolvidos],
+            ["Nós podados", self.nos_podados],
+            ["Nós inviáveis", self.nos_inviaveis],
+            ["Tempo (s)", f"{self.tempo:.3f}"],
+            ["Nós por segundo", "--" if vazao is None else f"{vazao:.1f}"],
+        ]
+        return tabulate(linhas, tablefmt="grid")
+
+
+def _copiar(simplex):
+    """Cópia independente do SimplexTabulado (o pai pode gerar dois filhos)."""
+    copia = SimplexTabulado.__new__(SimplexTabulado)
+    copia.__dict__.update(simplex.__dict__)
+    copia.tabela = simplex.tabela.copy()
+    copia.base = simplex.base.copy()
+    copia.posicao_base = simplex.posicao_base.copy()
+    copia.fixas = simplex.fixas.copy()
+    return copia
+
+
+def main():
+    print("\n==== BRANCH-AND-BOUND - SIMPLEX TABULADO ====\n")
+
+    # Exemplo do tabuladocore com quantidades inteiras
+    c = [-40, -30, -20]  # Negativo para maximização
+    A = [
+        [2, 5, 10],
+        [2, 5, 1],
+        [4, 2, 2]
+    ]
+    b = [900, 400, 600]
+
+    bb = BranchAndBound(c, A, b)
+    resultado = bb.resolver()
+
+    print(f"Status: {resultado['status']}")
+    if resultado['x'] is not None:
+        print(f"Z = {resultado['z']:.2f}")
+        for i, val in enumerate(resultado['x']):
+            print(f"x{i+1} = {val:.0f}")
+    print()
+    print(bb.relatorio())
+
+
+if __name__ == "__main__":
+    main()
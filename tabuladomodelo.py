@@ -0,0 +1,579 @@
+"""
+Camada de modelagem algébrica para o Simplex Tabulado.
+
+Em vez de montar c, A e b à mão (e trocar o sinal da função objetivo para
+maximizar), o modelo é escrito com variáveis nomeadas, expressões lineares,
+restrições ≤, ≥ e = e objetivo de maximização ou minimização:
+
+    modelo = Modelo()
+    x = modelo.variaveis('x', 3)
+    modelo.maximizar(np.array([40, 30, 20]) @ x)
+    modelo.adicionar(np.array([[2, 5, 10], [2, 5, 1], [4, 2, 2]]) @ x <= [900, 400, 600], 'capacidade')
+    solucao = modelo.resolver()
+    print(solucao.objetivo, solucao.valor(x), solucao.por_nome())
+
+Expressões e blocos de restrições guardam seus termos em vetores NumPy
+(índices de variáveis, coeficientes e, nos blocos, linhas no formato COO);
+`matriz @ x` com uma matriz densa ou esparsa (scipy.sparse) gera um bloco
+inteiro de uma vez. compilar() concatena os blocos e monta A numa única
+chamada coo_matrix, sem acrescentar termos um a um em listas Python.
+
+resolver() passa cada restrição ao SimplexTabulado com o seu sentido (as de
+≥ e = são tratadas pela Fase I) e mapeia a solução e os preços sombra de
+volta para as variáveis e restrições do modelo. compilar() também gera a
+forma só com ≤ (A x ≤ b), para resolvedores que só a aceitam.
+"""
+import numbers
+
+import numpy as np
+from scipy import sparse
+
+from tabuladocore import SimplexTabulado
+
+SENTIDOS = ('<=', '>=', '==')
+
+
+def _vetor(valor, tamanho):
+    """Converte um escalar ou sequência num vetor float de `tamanho` elementos."""
+    vetor = np.asarray(valor, dtype=float)
+    if vetor.ndim == 0:
+        return np.full(tamanho, float(vetor))
+    vetor = vetor.reshape(-1)
+    if vetor.size != tamanho:
+        raise ValueError(f"Esperados {tamanho} valores, recebidos {vetor.size}.")
+    return vetor
+
+
+class Expressao:
+    """Expressão linear Σ coeficientes·x[indices] + constante."""
+
+    # Impede o NumPy de tratar a expressão como array em 2 * x[0] ou np.float64(2) * x[0]
+    __array_ufunc__ = None
+
+    def __init__(self, indices=(), coeficientes=(), constante=0.0):
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.coeficientes = np.asarray(coeficientes, dtype=float)
+        self.constante = float(constante)
+
+    @staticmethod
+    def de(valor):
+        """Converte número, Expressao ou VetorVariaveis de um elemento em Expressao."""
+        if isinstance(valor, Expressao):
+            return valor
+        if isinstance(valor, numbers.Real):
+            return Expressao(constante=valor)
+        if isinstance(valor, VetorVariaveis) and len(valor) == 1:
+            return valor[0]
+        return NotImplemented
+
+    def __add__(self, outro):
+        outro = Expressao.de(outro)
+        if outro is NotImplemented:
+            return NotImplemented
+        return Expressao(np.concatenate([self.indices, outro.indices]),
+                         np.concatenate([self.coeficientes, outro.coeficientes]),
+                         self.constante + outro.constante)
+
+    __radd__ = __add__
+
+    def __mul__(self, escalar):
+        if not isinstance(escalar, numbers.Real):
+            return NotImplemented
+        return Expressao(self.indices, self.coeficientes * escalar, self.constante * escalar)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, escalar):
+        if not isinstance(escalar, numbers.Real):
+            return NotImplemented
+        return self * (1.0 / escalar)
+
+    def __neg__(self):
+        return self * -1.0
+
+    def __sub__(self, outro):
+        outro = Expressao.de(outro)
+        if outro is NotImplemented:
+            return NotImplemented
+        return self + (-outro)
+
+    def __rsub__(self, outro):
+        return (-self) + outro
+
+    def _restricao(self, outro, sentido):
+        outro = Expressao.de(outro)
+        if outro is NotImplemented:
+            return NotImplemented
+        diferenca = self - outro
+        return BlocoRestricoes(np.zeros(diferenca.indices.size, dtype=np.intp), diferenca.indices,
+                               diferenca.coeficientes, sentido, np.array([-diferenca.constante]))
+
+    def __le__(self, outro):
+        return self._restricao(outro, '<=')
+
+    def __ge__(self, outro):
+        return self._restricao(outro, '>=')
+
+    def __eq__(self, outro):
+        return self._restricao(outro, '==')
+
+    __hash__ = None
+
+    def __repr__(self):
+        termos = ' + '.join(f"{coeficiente:g}·v{indice}" for indice, coeficiente
+                            in zip(self.indices[:6], self.coeficientes[:6]))
+        if self.indices.size > 6:
+            termos += f" + ... ({self.indices.size} termos)"
+        return f"Expressao({termos or '0'} + {self.constante:g})"
+
+
+class ExpressoesLineares:
+    """Bloco de expressões lineares (uma por linha) guardado no formato COO."""
+
+    __array_ufunc__ = None
+
+    def __init__(self, linhas, indices, coeficientes, constantes):
+        self.linhas = np.asarray(linhas, dtype=np.intp)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.coeficientes = np.asarray(coeficientes, dtype=float)
+        self.constantes = np.asarray(constantes, dtype=float)
+
+    def __len__(self):
+        return self.constantes.size
+
+    @staticmethod
+    def de(valor, tamanho):
+        """Converte bloco, VetorVariaveis, Expressao (repetida) ou constantes num bloco de `tamanho` linhas."""
+        if isinstance(valor, ExpressoesLineares):
+            if len(valor) != tamanho:
+                raise ValueError(f"Blocos com {len(valor)} e {tamanho} linhas não podem ser combinados.")
+            return valor
+        if isinstance(valor, VetorVariaveis):
+            return ExpressoesLineares.de(valor.bloco(), tamanho)
+        if isinstance(valor, Expressao):
+            termos = valor.indices.size
+            return ExpressoesLineares(np.repeat(np.arange(tamanho), termos), np.tile(valor.indices, tamanho),
+                                      np.tile(valor.coeficientes, tamanho), np.full(tamanho, valor.constante))
+        try:
+            constantes = _vetor(valor, tamanho)
+        except (TypeError, ValueError):
+            return NotImplemented
+        vazio = np.empty(0, dtype=np.intp)
+        return ExpressoesLineares(vazio, vazio, np.empty(0), constantes)
+
+    def __add__(self, outro):
+        outro = ExpressoesLineares.de(outro, len(self))
+        if outro is NotImplemented:
+            return NotImplemented
+        return ExpressoesLineares(np.concatenate([self.linhas, outro.linhas]),
+                                  np.concatenate([self.indices, outro.indices]),
+                                  np.concatenate([self.coeficientes, outro.coeficientes]),
+                                  self.constantes + outro.constantes)
+
+    __radd__ = __add__
+
+    def __mul__(self, escalares):
+        """Multiplica cada linha por um escalar (ou por um escalar por linha)."""
+        try:
+            fatores = _vetor(escalares, len(self))
+        except (TypeError, ValueError):
+            return NotImplemented
+        return ExpressoesLineares(self.linhas, self.indices, self.coeficientes * fatores[self.linhas],
+                                  self.constantes * fatores)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self * -1.0
+
+    def __sub__(self, outro):
+        outro = ExpressoesLineares.de(outro, len(self))
+        if outro is NotImplemented:
+            return NotImplemented
+        return self + (-outro)
+
+    def __rsub__(self, outro):
+        return (-self) + outro
+
+    def soma(self):
+        """Soma das linhas do bloco, como uma Expressao."""
+        return Expressao(self.indices, self.coeficientes, self.constantes.sum())
+
+    def _restricoes(self, outro, sentido):
+        outro = ExpressoesLineares.de(outro, len(self))
+        if outro is NotImplemented:
+            return NotImplemented
+        diferenca = self - outro
+        return BlocoRestricoes(diferenca.linhas, diferenca.indices, diferenca.coeficientes,
+                               sentido, -diferenca.constantes)
+
+    def __le__(self, outro):
+        return self._restricoes(outro, '<=')
+
+    def __ge__(self, outro):
+        return self._restricoes(outro, '>=')
+
+    def __eq__(self, outro):
+        return self._restricoes(outro, '==')
+
+    __hash__ = None
+
+
+class VetorVariaveis:
+    """Vetor de variáveis de um modelo (índices consecutivos ou selecionados)."""
+
+    __array_ufunc__ = None
+
+    def __array__(self, dtype=None, copy=None):
+        # Escalar objeto: as matrizes do scipy.sparse devolvem NotImplemented em
+        # matriz @ x, e o Python chama x.__rmatmul__(matriz)
+        escalar = np.empty((), dtype=object)
+        escalar[()] = self
+        return escalar
+
+    def __init__(self, nome, indices):
+        self.nome = nome
+        self.indices = np.asarray(indices, dtype=np.intp)
+
+    def __len__(self):
+        return self.indices.size
+
+    def __getitem__(self, chave):
+        if isinstance(chave, (numbers.Integral, np.integer)):
+            return Expressao([self.indices[chave]], [1.0])
+        return VetorVariaveis(self.nome, self.indices[chave])
+
+    def bloco(self):
+        """Uma linha por variável (útil para limites: x <= u)."""
+        return ExpressoesLineares(np.arange(len(self)), self.indices, np.ones(len(self)), np.zeros(len(self)))
+
+    def soma(self):
+        return Expressao(self.indices, np.ones(len(self)))
+
+    def __rmatmul__(self, matriz):
+        """coeficientes @ x (Expressao) ou matriz @ x (ExpressoesLineares), densa ou esparsa."""
+        if sparse.issparse(matriz):
+            coo = sparse.coo_matrix(matriz)
+            if coo.shape[1] != len(self):
+                raise ValueError(f"Matriz com {coo.shape[1]} colunas e vetor com {len(self)} variáveis.")
+            return ExpressoesLineares(coo.row, self.indices[coo.col], coo.data, np.zeros(coo.shape[0]))
+        matriz = np.asarray(matriz, dtype=float)
+        if matriz.shape[-1] != len(self):
+            raise ValueError(f"Matriz com {matriz.shape[-1]} colunas e vetor com {len(self)} variáveis.")
+        if matriz.ndim == 1:
+            return Expressao(self.indices, matriz)
+        linhas, colunas = np.nonzero(matriz)
+        return ExpressoesLineares(linhas, self.indices[colunas], matriz[linhas, colunas],
+                                  np.zeros(matriz.shape[0]))
+
+    def __matmul__(self, coeficientes):
+        """x @ coeficientes (vetor), o mesmo que coeficientes @ x."""
+        coeficientes = np.asarray(coeficientes, dtype=float)
+        if coeficientes.ndim != 1:
+            return NotImplemented
+        return self.__rmatmul__(coeficientes)
+
+    def __mul__(self, escalares):
+        return self.bloco() * escalares
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return -self.bloco()
+
+    def __add__(self, outro):
+        return self.bloco() + outro
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        return self.bloco() - outro
+
+    def __rsub__(self, outro):
+        return outro - self.bloco()
+
+    def __le__(self, outro):
+        return self.bloco() <= outro
+
+    def __ge__(self, outro):
+        return self.bloco() >= outro
+
+    def __eq__(self, outro):
+        return self.bloco() == outro
+
+    __hash__ = None
+
+
+class BlocoRestricoes:
+    """Restrições linhas·x (sentido) limites, com os termos no formato COO."""
+
+    def __init__(self, linhas, indices, coeficientes, sentido, limites):
+        if sentido not in SENTIDOS:
+            raise ValueError(f"Sentido desconhecido: {sentido!r} (use um de {', '.join(SENTIDOS)}).")
+        self.linhas = linhas
+        self.indices = indices
+        self.coeficientes = coeficientes
+        self.sentido = sentido
+        self.limites = limites
+
+    def __len__(self):
+        return self.limites.size
+
+    def __bool__(self):
+        # Evita que `a <= b <= c` (que chama bool) descarte a primeira restrição em silêncio
+        raise TypeError("Restrições não têm valor lógico; use modelo.adicionar(restricao).")
+
+
+class Solucao:
+    """Solução de um Modelo, com os valores acessíveis pelas variáveis e restrições."""
+
+    def __init__(self, modelo, status, objetivo, valores, duais, iteracoes):
+        self.modelo = modelo
+        self.status = status
+        self.objetivo = objetivo
+        self.valores = valores
+        self.duais = duais
+        self.iteracoes = iteracoes
+
+    def valor(self, item):
+        """Valor de uma Expressao (float), de um VetorVariaveis ou de um bloco (vetores)."""
+        if isinstance(item, VetorVariaveis):
+            return self.valores[item.indices]
+        if isinstance(item, ExpressoesLineares):
+            return np.bincount(item.linhas, weights=item.coeficientes * self.valores[item.indices],
+                               minlength=len(item)) + item.constantes
+        item = Expressao.de(item)
+        return float(item.coeficientes @ self.valores[item.indices] + item.constante)
+
+    def dual(self, nome):
+        """
+        Preços sombra da restrição (ou bloco) `nome`: variação do objetivo por unidade do limite.
+
+        Levanta ValueError se a solução não tem preços sombra (status diferente de 'otimo').
+        """
+        if self.duais is None:
+            raise ValueError(f"Solução com status {self.status!r} não tem preços sombra.")
+        inicio, fim = self.modelo.linhas_da_restricao(nome)
+        duais = self.duais[inicio:fim]
+        return float(duais[0]) if fim - inicio == 1 else duais
+
+    def por_nome(self, incluir_zeros=False):
+        """Dicionário nome -> valor das variáveis (por padrão, apenas as não nulas)."""
+        indices = np.arange(self.valores.size) if incluir_zeros else np.flatnonzero(self.valores)
+        return {self.modelo.nome_variavel(indice): float(self.valores[indice]) for indice in indices}
+
+
+class Modelo:
+    def __init__(self):
+        """Cria um modelo vazio (maximização de 0)."""
+        self.num_vars = 0
+        self.num_restricoes = 0
+        # Vetores de variáveis e blocos de restrições: uma entrada por chamada, não por termo
+        self._vetores = []
+        self._blocos = []
+        self._nomes_restricoes = {}
+        self.objetivo = Expressao()
+        self.maximizacao = True
+        self._compilacao = None
+
+    # -----------------------------------------------------------------------
+    # Construção
+    # -----------------------------------------------------------------------
+
+    def variaveis(self, nome, tamanho):
+        """Cria `tamanho` variáveis não negativas nome[0], ..., nome[tamanho - 1]."""
+        vetor = VetorVariaveis(nome, np.arange(self.num_vars, self.num_vars + tamanho))
+        self._vetores.append((self.num_vars, nome, tamanho))
+        self.num_vars += tamanho
+        return vetor
+
+    def variavel(self, nome):
+        """Cria uma variável não negativa e a retorna como Expressao."""
+        indice = self.num_vars
+        self._vetores.append((indice, nome, None))
+        self.num_vars += 1
+        return Expressao([indice], [1.0])
+
+    def nome_variavel(self, indice):
+        inicios = [inicio for inicio, _, _ in self._vetores]
+        inicio, nome, tamanho = self._vetores[int(np.searchsorted(inicios, indice, side='right')) - 1]
+        return nome if tamanho is None else f"{nome}[{indice - inicio}]"
+
+    def adicionar(self, restricao, nome=None):
+        """
+        Adiciona uma restrição ou um bloco de restrições.
+
+        Args:
+            restricao: resultado de uma comparação (expr <= 5, A @ x >= b, ...)
+            nome: nome da restrição ou do bloco (padrão: R1, R2, ...)
+
+        Returns:
+            nome usado
+        """
+        if not isinstance(restricao, BlocoRestricoes):
+            raise TypeError("Esperada uma restrição (comparação entre expressões), "
+                            f"recebido {type(restricao).__name__}.")
+        nome = nome or f"R{len(self._blocos) + 1}"
+        if nome in self._nomes_restricoes:
+            raise ValueError(f"Já existe uma restrição chamada {nome!r}.")
+        self._nomes_restricoes[nome] = (self.num_restricoes, self.num_restricoes + len(restricao))
+        self._blocos.append(restricao)
+        self.num_restricoes += len(restricao)
+        self._compilacao = None
+        return nome
+
+    def linhas_da_restricao(self, nome):
+        """Intervalo [início, fim) das linhas da restrição `nome` no modelo."""
+        return self._nomes_restricoes[nome]
+
+    def maximizar(self, expressao):
+        self.objetivo = Expressao.de(expressao)
+        self.maximizacao = True
+        self._compilacao = None
+
+    def minimizar(self, expressao):
+        self.objetivo = Expressao.de(expressao)
+        self.maximizacao = False
+        self._compilacao = None
+
+    # -----------------------------------------------------------------------
+    # Compilação
+    # -----------------------------------------------------------------------
+
+    def compilar(self, esparso=False, sentidos=False):
+        """
+        Monta c, A, b na forma do SimplexTabulado (maximizar -c·x).
+
+        Sem sentidos, tudo vai para a forma A x ≤ b: restrições ≥ entram com o
+        sinal trocado e restrições = como o par ≤ / ≥. Com sentidos, cada
+        restrição é uma linha com o seu sentido. Termos repetidos da mesma
+        variável numa linha são somados.
+
+        Args:
+            esparso: se True, A é uma scipy.sparse.csr_matrix; senão, um array denso
+            sentidos: se True, também retorna o sentido de cada linha
+
+        Returns:
+            (c, A, b) ou, com sentidos, (c, A, b, sentidos)
+        """
+        # Linhas de cada bloco no modelo e sinal de cada cópia na forma compilada
+        quantidades = np.array([len(bloco) for bloco in self._blocos], dtype=np.intp)
+        inicios = np.concatenate([[0], np.cumsum(quantidades)])[:-1]
+        if sentidos:
+            sinais = {sentido: (1.0,) for sentido in SENTIDOS}
+        else:
+            sinais = {'<=': (1.0,), '>=': (-1.0,), '==': (1.0, -1.0)}
+
+        linhas, indices, coeficientes, limites, origem, sinal_linhas = [], [], [], [], [], []
+        sentido_linhas = []
+        deslocamento = 0
+        for bloco, inicio in zip(self._blocos, inicios):
+            for sinal in sinais[bloco.sentido]:
+                linhas.append(bloco.linhas + deslocamento)
+                indices.append(bloco.indices)
+                coeficientes.append(bloco.coeficientes * sinal)
+                limites.append(bloco.limites * sinal)
+                origem.append(np.arange(inicio, inicio + len(bloco)))
+                sinal_linhas.append(np.full(len(bloco), sinal))
+                sentido_linhas.extend([bloco.sentido] * len(bloco))
+                deslocamento += len(bloco)
+
+        vazio_inteiro, vazio = np.empty(0, dtype=np.intp), np.empty(0)
+        linhas = np.concatenate(linhas) if linhas else vazio_inteiro
+        indices = np.concatenate(indices) if indices else vazio_inteiro
+        coeficientes = np.concatenate(coeficientes) if coeficientes else vazio
+        b = np.concatenate(limites) if limites else vazio
+
+        A = sparse.coo_matrix((coeficientes, (linhas, indices)), shape=(deslocamento, self.num_vars)).tocsr()
+        A.eliminate_zeros()
+        if not esparso:
+            A = A.toarray()
+
+        custos = np.bincount(self.objetivo.indices, weights=self.objetivo.coeficientes, minlength=self.num_vars)
+        c = -custos if self.maximizacao else custos
+
+        self._compilacao = (np.concatenate(origem) if origem else vazio_inteiro,
+                            np.concatenate(sinal_linhas) if sinal_linhas else vazio)
+        if sentidos:
+            return c, A, b, sentido_linhas
+        return c, A, b
+
+    def resolver(self, **opcoes):
+        """
+        Compila, resolve com o SimplexTabulado e mapeia o resultado para o modelo.
+
+        Args:
+            opcoes: argumentos do SimplexTabulado (algoritmo, tempo_limite, ...)
+
+        Returns:
+            Solucao com 'status', 'objetivo' (no sentido do modelo, com a
+            constante), valores das variáveis e preços sombra por restrição;
+            objetivo e preços sombra são None se o status não é 'otimo'
+        """
+        c, A, b, sentidos = self.compilar(sentidos=True)
+        simplex = SimplexTabulado(c, A, b, sentidos=sentidos, **opcoes)
+        solucao = simplex.resolver_silencioso()
+        return self.solucao_de(solucao, simplex.precos_sombra())
+
+    def solucao_de(self, solucao, precos_sombra=None):
+        """
+        Converte a saída do resolvedor (obter_solucao() e preços sombra da forma compilada) numa Solucao.
+
+        Sem o status 'otimo' a última tabela não dá um objetivo nem preços
+        sombra com significado, e ambos ficam None.
+        """
+        if self._compilacao is None:
+            raise ValueError("O modelo mudou depois da compilação; compile e resolva de novo.")
+        origem, sinais = self._compilacao
+        sentido = 1.0 if self.maximizacao else -1.0
+        otimo = solucao['status'] == 'otimo'
+        objetivo = sentido * solucao['z'] + self.objetivo.constante if otimo else None
+
+        duais = None
+        if precos_sombra is not None and otimo:
+            # d objetivo / d limite: soma das cópias de cada restrição, com o sinal de cada uma
+            duais = sentido * np.bincount(origem, weights=sinais * precos_sombra, minlength=self.num_restricoes)
+        return Solucao(self, solucao['status'], objetivo, np.asarray(solucao['x'], dtype=float),
+                       duais, solucao['iteracoes'])
+
+
+def main():
+    print("\n==== MODELAGEM ALGÉBRICA - SIMPLEX TABULADO ====\n")
+
+    # O exemplo do tabuladocore escrito como modelo: Maximizar Z = 40x1 + 30x2 + 20x3
+    modelo = Modelo()
+    x = modelo.variaveis('x', 3)
+    modelo.maximizar(np.array([40, 30, 20]) @ x)
+    modelo.adicionar(np.array([[2, 5, 10], [2, 5, 1], [4, 2, 2]]) @ x <= [900, 400, 600], 'capacidade')
+
+    c, A, b = modelo.compilar()
+    print(f"Compilado: c = {c}, b = {b}")
+    solucao = modelo.resolver()
+    print(f"Status: {solucao.status}; Z = {solucao.objetivo:.2f}")
+    for nome, valor in solucao.por_nome(incluir_zeros=True).items():
+        print(f"{nome} = {valor:.2f}")
+    print(f"Preços sombra de capacidade: {solucao.dual('capacidade')}")
+
+    # Minimização com variáveis avulsas: custos positivos, simplex dual a partir da base das folgas
+    dieta = Modelo()
+    arroz, feijao = dieta.variavel('arroz'), dieta.variavel('feijao')
+    dieta.minimizar(2 * arroz + 3 * feijao)
+    dieta.adicionar(arroz + feijao >= 10, 'volume')
+    dieta.adicionar(6 >= arroz, 'arroz_max')
+    solucao = dieta.resolver()
+    print(f"\nDieta: status {solucao.status}, custo {solucao.objetivo:.2f}, {solucao.por_nome(incluir_zeros=True)}")
+
+    # Igualdade e ≥ com base das folgas nem primal nem dual viável: o simplex começa pela Fase I
+    mistura = Modelo()
+    y = mistura.variaveis('y', 3)
+    mistura.maximizar(np.array([3, 2, -1]) @ y)
+    mistura.adicionar(np.ones(3) @ y == 10, 'total')
+    mistura.adicionar(np.array([1, -1, 0]) @ y >= 2, 'diferenca')
+    mistura.adicionar(np.array([2, 1, 0]) @ y <= 16, 'capacidade')
+    solucao = mistura.resolver()
+    print(f"\nMistura: status {solucao.status}, Z {solucao.objetivo:.2f}, {solucao.por_nome(incluir_zeros=True)}")
+    print(f"Preço sombra de total: {solucao.dual('total'):.2f}")
+
+
+if __name__ == "__main__":
+    main()
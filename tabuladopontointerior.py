@@ -0,0 +1,316 @@
+"""
+Método de pontos interiores (primal-dual, preditor-corretor de Mehrotra).
+
+Recebe os mesmos c, A, b do SimplexTabulado (maximização com c negativo,
+restrições ≤) e trabalha na forma padrão com as folgas: min c·x com
+[A I] [x; f] = b e x, f ≥ 0, no modelo homogêneo auto-dual (que também
+detecta problemas inviáveis e ilimitados). Cada iteração forma as equações
+normais A D Aᵀ + D_f (D = x/z) e resolve os passos preditor e corretor com
+uma única fatoração de Cholesky. O número de iterações quase não cresce com
+o tamanho do problema, o que favorece modelos densos grandes.
+
+O cruzamento (opcional) escolhe uma base a partir do ponto interior,
+reconstrói a tabela do SimplexTabulado nessa base e termina com alguns
+pivôs do simplex. Assim a exibição da tabela, a extração da solução e a
+análise de sensibilidade continuam disponíveis em `self.simplex`.
+
+Uso:
+    pontos = PontoInterior(c, A, b)
+    resultado = pontos.resolver()
+    print(pontos.relatorio())
+    pontos.simplex.exibir_tabela()
+"""
+import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, qr
+from tabulate import tabulate
+
+from tabuladocore import SimplexTabulado
+
+
+class PontoInterior:
+    def __init__(self, c, A, b, tolerancia=1e-8, max_iteracoes=100, cruzamento=True):
+        """
+        Prepara o problema.
+
+        Args:
+            c, A, b: problema no formato do SimplexTabulado (maximização, c negativo)
+            tolerancia: tolerância relativa dos resíduos primal e dual e do gap
+            max_iteracoes: número máximo de iterações de pontos interiores
+            cruzamento: se True, obtém uma base ótima e a tabela final do simplex
+        """
+        self.c = np.asarray(c, dtype=float)
+        self.A = np.asarray(A, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.num_restricoes, self.num_vars = self.A.shape
+        self.tolerancia = tolerancia
+        self.max_iteracoes = max_iteracoes
+        self.cruzamento = cruzamento
+
+        self.historico = []
+        self.simplex = None
+        self.status = None
+
+    # Produtos com [A I] sem montar a matriz
+    def _produto(self, v):
+        n = self.num_vars
+        return self.A @ v[:n] + v[n:]
+
+    def _produto_transposto(self, y):
+        return np.concatenate([self.A.T @ y, y])
+
+    def _fatorar(self, d):
+        """Fatoração de Cholesky de [A I] D [A I]ᵀ = A D_x Aᵀ + D_f."""
+        n = self.num_vars
+        M = (self.A * d[:n]) @ self.A.T
+        M[np.diag_indices_from(M)] += d[n:]
+        try:
+            return cho_factor(M, check_finite=False)
+        except LinAlgError:
+            # Perto da solução D fica mal condicionada: regularizar a diagonal
+            M[np.diag_indices_from(M)] += 1e-10 * np.max(np.abs(np.diag(M)))
+            return cho_factor(M, check_finite=False)
+
+    def _resolver_normais(self, fator, d, r1, r2):
+        """Resolve [[-D^-1, Aᵀ], [A, 0]] [u; v] = [r1; r2] pelas equações normais."""
+        v = cho_solve(fator, r2 + self._produto(d * r1), check_finite=False)
+        u = d * (self._produto_transposto(v) - r1)
+        return u, v
+
+    def _direcao(self, fator, ponto, d, residuos, gama, correcao=None):
+        """
+        Direção de Newton do modelo homogêneo auto-dual.
+
+        Args:
+            fator: fatoração de Cholesky das equações normais
+            ponto: (x, y, z, tau, kappa)
+            d: x / z
+            residuos: resíduos (primal, dual, gap) do ponto atual
+            gama: parâmetro de centralização (0 no passo preditor)
+            correcao: direção do preditor, para o termo de segunda ordem de Mehrotra
+        """
+        x, y, z, tau, kappa = ponto
+        rp, rd, rg = residuos
+        mu = (x @ z + tau * kappa) / (x.size + 1)
+        rxz = gama * mu - x * z
+        rtk = gama * mu - tau * kappa
+        if correcao is not None:
+            dx, _, dz, dtau, dkappa = correcao
+            rxz = rxz - dx * dz
+            rtk = rtk - dtau * dkappa
+
+        # Dois sistemas com a mesma fatoração: um para os custos, outro para os resíduos
+        p, q = self._resolver_normais(fator, d, self._custos, self.b)
+        u, v = self._resolver_normais(fator, d, (1 - gama) * rd - rxz / x, (1 - gama) * rp)
+        dtau = (((1 - gama) * rg + rtk / tau - (-self._custos @ u + self.b @ v))
+                / (kappa / tau + (-self._custos @ p + self.b @ q)))
+        dx = u + p * dtau
+        dy = v + q * dtau
+        dz = (rxz - z * dx) / x
+        dkappa = (rtk - kappa * dtau) / tau
+        return dx, dy, dz, dtau, dkappa
+
+    @staticmethod
+    def _passo_maximo(ponto, direcao):
+        """Maior passo em [0, 1] que mantém x, z, tau e kappa não negativos."""
+        x, _, z, tau, kappa = ponto
+        dx, _, dz, dtau, dkappa = direcao
+        v = np.concatenate([x, z, [tau, kappa]])
+        dv = np.concatenate([dx, dz, [dtau, dkappa]])
+        negativos = dv < 0
+        if not np.any(negativos):
+            return 1.0
+        return min(1.0, float(np.min(-v[negativos] / dv[negativos])))
+
+    def _residuos(self, x, y, z, tau, kappa):
+        rp = self.b * tau - self._produto(x)
+        rd = self._custos * tau - self._produto_transposto(y) - z
+        rg = self._custos @ x - self.b @ y + kappa
+        return rp, rd, rg
+
+    def _pontos_interiores(self):
+        """
+        Iterações preditor-corretor no modelo homogêneo auto-dual.
+
+        O modelo acrescenta as variáveis tau e kappa: tau → 0 com kappa > 0
+        certifica que o problema é inviável ou ilimitado, sem depender de
+        limites arbitrários para a divergência das iterações.
+
+        Returns:
+            (status, x, y, z) com o ponto final já dividido por tau
+        """
+        n, m = self.num_vars, self.num_restricoes
+        self._custos = np.concatenate([self.c, np.zeros(m)])
+        x, y, z = np.ones(n + m), np.zeros(m), np.ones(n + m)
+        tau, kappa = 1.0, 1.0
+        residuos_iniciais = self._residuos(x, y, z, tau, kappa)
+        escala_p = max(1.0, np.linalg.norm(residuos_iniciais[0]))
+        escala_d = max(1.0, np.linalg.norm(residuos_iniciais[1]))
+        escala_g = max(1.0, abs(residuos_iniciais[2]))
+        mu_inicial = (x @ z + tau * kappa) / (x.size + 1)
+        self.historico = []
+
+        status = 'limite_iteracoes'
+        for iteracao in range(1, self.max_iteracoes + 1):
+            residuos = self._residuos(x, y, z, tau, kappa)
+            rp, rd, rg = residuos
+            mu = (x @ z + tau * kappa) / (x.size + 1)
+            residuo_primal = np.linalg.norm(rp) / escala_p
+            residuo_dual = np.linalg.norm(rd) / escala_d
+            gap = abs(self._custos @ x - self.b @ y) / (tau + abs(self.b @ y))
+
+            if residuo_primal < self.tolerancia and residuo_dual < self.tolerancia:
+                if gap < self.tolerancia:
+                    status = 'otimo'
+                    break
+                if abs(rg) / escala_g < self.tolerancia and tau < self.tolerancia * max(1.0, kappa):
+                    status = self._classificar_certificado(x)
+                    break
+            if mu / mu_inicial < self.tolerancia and tau < self.tolerancia * min(1.0, kappa):
+                status = self._classificar_certificado(x)
+                break
+
+            d = x / z
+            fator = self._fatorar(d)
+            ponto = (x, y, z, tau, kappa)
+
+            # Preditor (direção afim) e centralização de Mehrotra
+            afim = self._direcao(fator, ponto, d, residuos, 0.0)
+            passo = self._passo_maximo(ponto, afim)
+            gama = (1 - passo) ** 2 * min(0.1, 1 - passo)
+
+            # Corretor com o termo de segunda ordem, reaproveitando a fatoração
+            direcao = self._direcao(fator, ponto, d, residuos, gama, correcao=afim)
+            passo = min(1.0, 0.99995 * self._passo_maximo(ponto, direcao))
+            dx, dy, dz, dtau, dkappa = direcao
+            x = x + passo * dx
+            y = y + passo * dy
+            z = z + passo * dz
+            tau = tau + passo * dtau
+            kappa = kappa + passo * dkappa
+
+            self.historico.append({
+                'iteracao': iteracao,
+                'z': -self._custos @ x / tau,
+                'mu': mu,
+                'residuo_primal': residuo_primal,
+                'residuo_dual': residuo_dual,
+                'passo': passo,
+            })
+
+        return status, x / tau, y / tau, z / tau
+
+    def _classificar_certificado(self, x):
+        """
+        Classifica o término com tau → 0.
+
+        Um raio x com c·x < 0 mostra que o objetivo melhora sem limite, mas só
+        se o problema for viável: nesse caso um problema de viabilidade (c = 0)
+        desempata entre ilimitado e inviável. Sem esse raio, y certifica a
+        inviabilidade.
+        """
+        if self._custos @ x >= 0:
+            return 'inviavel'
+        viabilidade = PontoInterior(np.zeros(self.num_vars), self.A, self.b, self.tolerancia,
+                                    self.max_iteracoes, cruzamento=False)
+        return 'ilimitado' if viabilidade.resolver()['status'] == 'otimo' else 'inviavel'
+
+    def escolher_base(self, x, z):
+        """
+        Escolhe uma base para o cruzamento a partir do ponto interior.
+
+        As colunas de [A I], normalizadas e ponderadas por x_j / z_j (grande
+        para as variáveis básicas na solução ótima), passam por uma fatoração
+        QR com pivotamento de colunas; as m primeiras colunas pivô formam uma
+        base não singular que prefere as variáveis com x_j > z_j.
+        """
+        m = self.num_restricoes
+        completa = np.hstack([self.A, np.eye(m)])
+        normas = np.linalg.norm(completa, axis=0)
+        normas[normas == 0] = 1.0
+        pesos = x / np.maximum(z, 1e-300)
+        _, _, pivos = qr(completa * (pesos / normas), mode='economic', pivoting=True)
+        return np.sort(pivos[:m])
+
+    def _cruzar(self, x, z):
+        """Reconstrói a tabela na base escolhida e termina com o simplex."""
+        simplex = SimplexTabulado(self.c, self.A, self.b)
+        simplex.reconstruir_tabela(self.escolher_base(x, z))
+
+        # Ruído numérico do ponto interior: zerar valores desprezíveis
+        escala = 1.0 + np.max(np.abs(simplex.tabela))
+        simplex.tabela[np.abs(simplex.tabela) < 1e-9 * escala] = 0.0
+        # Base nem primal nem dual viável: o primal parte dela pela Fase I
+        simplex.resolver_silencioso()
+        return simplex
+
+    def resolver(self):
+        """
+        Executa o método de pontos interiores (e o cruzamento, se pedido).
+
+        Returns:
+            dicionário com 'status' ('otimo', 'ilimitado', 'inviavel' ou
+            'limite_iteracoes'), 'z', 'x', 'folgas', 'iteracoes' (de pontos
+            interiores) e 'pivos_cruzamento'
+        """
+        self.status, x, y, z = self._pontos_interiores()
+        self.y = y
+        n = self.num_vars
+        resultado = {
+            'status': self.status,
+            'z': -self.c @ x[:n],
+            'x': x[:n],
+            'folgas': x[n:],
+            'iteracoes': len(self.historico),
+            'pivos_cruzamento': 0,
+        }
+        if self.status != 'otimo' or not self.cruzamento:
+            return resultado
+
+        self.simplex = self._cruzar(x, z)
+        solucao = self.simplex.obter_solucao()
+        resultado.update({
+            'status': solucao['status'],
+            'z': solucao['z'],
+            'x': solucao['x'],
+            'folgas': solucao['folgas'],
+            'pivos_cruzamento': solucao['iteracoes'],
+        })
+        return resultado
+
+    def relatorio(self):
+        """Retorna a convergência por iteração em texto."""
+        linhas = [[h['iteracao'], f"{h['z']:.6g}", f"{h['mu']:.2e}", f"{h['residuo_primal']:.2e}",
+                   f"{h['residuo_dual']:.2e}", f"{h['passo']:.3f}"]
+                  for h in self.historico]
+        texto = tabulate(linhas, headers=["Iteração", "Z", "μ", "Resíduo primal", "Resíduo dual", "Passo"],
+                         tablefmt="grid", stralign="center")
+        texto += f"\n\nStatus: {self.status} em {len(self.historico)} iterações"
+        if self.simplex is not None:
+            texto += f"\nCruzamento: {self.simplex.iteracao} pivôs do simplex"
+        return texto
+
+
+def main():
+    print("\n==== PONTOS INTERIORES - PREDITOR-CORRETOR ====\n")
+
+    # Exemplo do tabuladocore
+    c = [-40, -30, -20]  # Negativo para maximização
+    A = [
+        [2, 5, 10],
+        [2, 5, 1],
+        [4, 2, 2]
+    ]
+    b = [900, 400, 600]
+
+    pontos = PontoInterior(c, A, b)
+    pontos.resolver()
+    print(pontos.relatorio())
+
+    # A tabela final do cruzamento é a mesma do simplex
+    print("\nTabela ótima após o cruzamento:")
+    pontos.simplex.exibir_tabela()
+    pontos.simplex.mostrar_solucao()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+"""
+Portfólio de configurações do Simplex Tabulado.
+
+A regra de preço, o escalonamento ou o método mais rápido dependem muito do
+modelo e não dá para prever qual será. O Portfolio dispara várias
+configurações sobre o mesmo problema, cada uma num processo; a primeira que
+prova a otimalidade, a ilimitação ou a inviabilidade vence e os demais
+processos são encerrados. Cada corrida é registrada numa linha JSON
+(configuração vencedora, tempo, tamanho do problema), e resumir_registro()
+agrega o registro para ajustar os padrões a partir de cargas reais.
+
+Configurações são dicionários com 'nome' e, opcionalmente:
+    'regra': regra de preço do simplex primal (ver REGRAS)
+    'escalonamento': True para escalonar linhas e colunas de A (média geométrica)
+    'algoritmo', 'threads', 'base_inicial': repassados ao SimplexTabulado
+    'metodo': 'simplex' (padrão) ou 'pontointerior' (tabuladopontointerior)
+
+Uso:
+    portfolio = Portfolio()
+    resultado = portfolio.resolver(c, A, b)
+    print(resultado['configuracao'], resultado['tempo'], resultado['z'])
+
+    python tabuladoportfolio.py --tamanho 300
+    python tabuladoportfolio.py --resumo
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import time
+from collections import defaultdict
+
+import numpy as np
+from tabulate import tabulate
+
+from tabuladocache import chave_problema
+from tabuladocore import SimplexTabulado
+from tabuladopontointerior import PontoInterior
+
+# Status que encerram a corrida (resultado provado)
+STATUS_CONCLUSIVOS = ('otimo', 'ilimitado', 'inviavel')
+
+# Segundos entre verificações de processos que morreram sem responder
+INTERVALO_VIGIA = 0.2
+
+REGRAS = ('dantzig', 'maior_melhoria', 'aresta_normalizada', 'bland')
+
+CONFIGURACOES_PADRAO = [
+    {'nome': 'dantzig', 'regra': 'dantzig'},
+    {'nome': 'aresta_normalizada', 'regra': 'aresta_normalizada'},
+    {'nome': 'maior_melhoria', 'regra': 'maior_melhoria'},
+    {'nome': 'dantzig_escalonado', 'regra': 'dantzig', 'escalonamento': True},
+    {'nome': 'dantzig_crash', 'regra': 'dantzig', 'base_inicial': 'crash'},
+    {'nome': 'pontos_interiores', 'metodo': 'pontointerior'},
+]
+
+# Registro das corridas, uma linha JSON por problema
+REGISTRO_PADRAO = os.path.join(os.path.expanduser('~'), '.cache', 'simplex_portfolio.jsonl')
+
+
+class SimplexPortfolio(SimplexTabulado):
+    """SimplexTabulado com a regra de preço do simplex primal configurável."""
+
+    def __init__(self, c, A, b, regra='dantzig', **opcoes):
+        if regra not in REGRAS:
+            raise ValueError(f"Regra de preço desconhecida: {regra!r} (use uma de {', '.join(REGRAS)}).")
+        self.regra = regra
+        super().__init__(c, A, b, **opcoes)
+
+    def encontrar_coluna_pivo(self):
+        """Encontra a coluna do pivô pela regra configurada (-1 se a linha Z não tem negativos)."""
+        if self.regra == 'dantzig':
+            return super().encontrar_coluna_pivo()
+
+        custos = self.tabela[-1, :-1]
+        candidatas = np.flatnonzero((custos < -self.tolerancia) & ~self.fixas)
+        if candidatas.size == 0:
+            return -1
+        if self.regra == 'bland':
+            # Menor índice (com o desempate de encontrar_linha_pivo, evita ciclagem)
+            return int(candidatas[0])
+
+        colunas = self.tabela[:-1, candidatas]
+        if self.regra == 'aresta_normalizada':
+            # Custo reduzido dividido pelo comprimento da aresta na tabela atual
+            pesos = np.sqrt(1.0 + np.einsum('ij,ij->j', colunas, colunas))
+            return int(candidatas[np.argmin(custos[candidatas] / pesos)])
+
+        # Maior melhoria: custo reduzido vezes o passo da razão mínima
+        positivos = colunas > self.tolerancia
+        razoes = np.full(colunas.shape, np.inf)
+        np.divide(self.tabela[:-1, -1, np.newaxis], colunas, out=razoes, where=positivos)
+        passos = razoes.min(axis=0)
+        if np.isinf(passos).any():
+            # Coluna sem razão: o simplex detecta a ilimitação nela
+            return int(candidatas[np.argmax(np.isinf(passos))])
+        melhorias = -custos[candidatas] * passos
+        if melhorias.max() <= 0:
+            # Todos os passos degenerados: cair no custo mais negativo
+            return int(candidatas[np.argmin(custos[candidatas])])
+        return int(candidatas[np.argmax(melhorias)])
+
+    def encontrar_linha_pivo(self, col_pivo):
+        """Encontra a linha do pivô; na regra 'bland', empates na razão saem pelo menor índice básico."""
+        if self.regra != 'bland':
+            return super().encontrar_linha_pivo(col_pivo)
+
+        coluna = self.tabela[:-1, col_pivo]
+        positivos = coluna > self.tolerancia
+        if not positivos.any():
+            return -1
+        razoes = np.full(coluna.size, np.inf)
+        np.divide(self.tabela[:-1, -1], coluna, out=razoes, where=positivos)
+        empatadas = np.flatnonzero(razoes <= razoes.min() + self.tolerancia)
+        return int(empatadas[np.argmin(self.base[empatadas])])
+
+
+def escalonar(c, A, b, passagens=4):
+    """
+    Escalona linhas e colunas de A pela média geométrica dos valores não nulos.
+
+    Os fatores são potências de 2, de modo que o escalonamento não introduz
+    erros de arredondamento.
+
+    Args:
+        c, A, b: problema no formato do SimplexTabulado
+        passagens: alternâncias linhas/colunas
+
+    Returns:
+        (c, A, b escalonados, fatores das linhas, fatores das colunas); a
+        solução original é x = fatores_colunas · x' e folgas = folgas' / fatores_linhas
+    """
+    A = np.asarray(A, dtype=float)
+    fatores_linhas = np.ones(A.shape[0])
+    fatores_colunas = np.ones(A.shape[1])
+    absoluto = np.abs(A)
+    nao_nulos = absoluto > 0
+    for _ in range(passagens):
+        for eixo, fatores in ((1, fatores_linhas), (0, fatores_colunas)):
+            escalonada = absoluto * fatores_linhas[:, np.newaxis] * fatores_colunas
+            maiores = escalonada.max(axis=eixo)
+            menores = np.where(nao_nulos, escalonada, np.inf).min(axis=eixo)
+            validos = maiores > 0
+            fatores[validos] /= np.exp2(np.round(np.log2(np.sqrt(maiores[validos] * menores[validos]))))
+
+    A_escalonada = A * fatores_linhas[:, np.newaxis] * fatores_colunas
+    c_escalonado = np.asarray(c, dtype=float) * fatores_colunas
+    b_escalonado = np.asarray(b, dtype=float) * fatores_linhas
+    return c_escalonado, A_escalonada, b_escalonado, fatores_linhas, fatores_colunas
+
+
+def resolver_configuracao(c, A, b, configuracao):
+    """
+    Resolve o problema com uma configuração do portfólio.
+
+    Returns:
+        dicionário com 'status', 'z', 'x', 'folgas' e 'iteracoes' no problema original
+    """
+    if configuracao.get('escalonamento'):
+        c, A, b, fatores_linhas, fatores_colunas = escalonar(c, A, b)
+
+    if configuracao.get('metodo', 'simplex') == 'pontointerior':
+        resultado = PontoInterior(c, A, b).resolver()
+    else:
+        simplex = SimplexPortfolio(c, A, b, regra=configuracao.get('regra', 'dantzig'),
+                                   algoritmo=configuracao.get('algoritmo', 'auto'),
+                                   threads=configuracao.get('threads', 1),
+                                   base_inicial=configuracao.get('base_inicial', 'folgas'))
+        resultado = simplex.resolver_silencioso()
+
+    resultado = {nome: resultado[nome] for nome in ('status', 'z', 'x', 'folgas', 'iteracoes')}
+    if configuracao.get('escalonamento'):
+        resultado['x'] = resultado['x'] * fatores_colunas
+        resultado['folgas'] = resultado['folgas'] / fatores_linhas
+    return resultado
+
+
+def _competir(indice, c, A, b, configuracao, fila):
+    """Processo do portfólio: resolve e envia (índice, resultado, erro, segundos) pela fila."""
+    inicio = time.perf_counter()
+    try:
+        resultado = resolver_configuracao(c, A, b, configuracao)
+    except Exception as erro:
+        fila.put((indice, None, f"{type(erro).__name__}: {erro}", time.perf_counter() - inicio))
+    else:
+        fila.put((indice, resultado, None, time.perf_counter() - inicio))
+
+
+class Portfolio:
+    def __init__(self, configuracoes=None, tempo_limite=None, registro=REGISTRO_PADRAO):
+        """
+        Configura o portfólio.
+
+        Args:
+            configuracoes: lista de configurações (padrão: CONFIGURACOES_PADRAO)
+            tempo_limite: segundos até encerrar todas as configurações sem vencedor
+                (status 'limite_tempo'); None: sem limite
+            registro: arquivo .jsonl das corridas (None: não registra)
+        """
+        self.configuracoes = CONFIGURACOES_PADRAO if configuracoes is None else configuracoes
+        nomes = [configuracao['nome'] for configuracao in self.configuracoes]
+        if not nomes or len(set(nomes)) != len(nomes):
+            raise ValueError("O portfólio precisa de configurações com nomes distintos.")
+        self.tempo_limite = tempo_limite
+        self.registro = registro
+
+        # fork cria os processos em milissegundos e sem copiar c, A, b; com
+        # forkserver/spawn cada corrida pagaria segundos de importações
+        metodos = multiprocessing.get_all_start_methods()
+        self.contexto = multiprocessing.get_context('fork' if 'fork' in metodos else 'spawn')
+
+    def resolver(self, c, A, b):
+        """
+        Corre todas as configurações e retorna o resultado da vencedora.
+
+        Configurações que levantam erro (por exemplo, algoritmo 'dual' sem base
+        dual viável) ou cujo processo morre sem responder (falta de memória,
+        sinal) ficam fora da corrida; se todas falham, levanta ValueError com
+        os erros.
+
+        Returns:
+            dicionário com 'status', 'z', 'x', 'folgas', 'iteracoes',
+            'configuracao' (nome da vencedora ou None), 'tempo' (segundos até o
+            resultado, incluindo a criação dos processos), 'tempo_resolucao'
+            (segundos de resolução da vencedora) e 'falhas' (erro por configuração)
+        """
+        c = np.asarray(c, dtype=float)
+        b = np.asarray(b, dtype=float)
+        A = np.asarray(A, dtype=float).reshape(b.size, c.size)
+
+        inicio = time.perf_counter()
+        fila = self.contexto.Queue()
+        processos = [self.contexto.Process(target=_competir, args=(indice, c, A, b, configuracao, fila),
+                                           daemon=True)
+                     for indice, configuracao in enumerate(self.configuracoes)]
+        for processo in processos:
+            processo.start()
+
+        vencedor = None
+        inconclusivo = None
+        falhas = {}
+        respondidos = set()
+        try:
+            while len(respondidos) < len(processos):
+                espera = INTERVALO_VIGIA
+                if self.tempo_limite is not None:
+                    restante = self.tempo_limite - (time.perf_counter() - inicio)
+                    if restante <= 0:
+                        break
+                    espera = min(espera, restante)
+                # Um processo já morto teve sua resposta, se houve, escrita na fila antes
+                # de morrer: se a espera terminar vazia, ele morreu sem responder
+                mortos = [indice for indice, processo in enumerate(processos)
+                          if indice not in respondidos and not processo.is_alive()]
+                try:
+                    indice, resultado, erro, segundos = fila.get(timeout=espera)
+                except queue.Empty:
+                    for indice in mortos:
+                        falhas[self.configuracoes[indice]['nome']] = f"exitcode {processos[indice].exitcode}"
+                        respondidos.add(indice)
+                    continue
+                respondidos.add(indice)
+                nome = self.configuracoes[indice]['nome']
+                if erro is not None:
+                    falhas[nome] = erro
+                elif resultado['status'] in STATUS_CONCLUSIVOS:
+                    vencedor = (nome, resultado, segundos)
+                    break
+                elif inconclusivo is None:
+                    inconclusivo = (nome, resultado, segundos)
+        finally:
+            # Encerrar as configurações que ainda estão resolvendo
+            for processo in processos:
+                if processo.is_alive():
+                    processo.terminate()
+            for processo in processos:
+                processo.join()
+            fila.close()
+        tempo = time.perf_counter() - inicio
+
+        if vencedor is None and inconclusivo is None and len(falhas) == len(processos):
+            raise ValueError("Nenhuma configuração do portfólio resolveu o problema: "
+                             + "; ".join(f"{nome}: {erro}" for nome, erro in falhas.items()))
+
+        if vencedor is not None:
+            nome, resultado, segundos = vencedor
+        elif inconclusivo is not None and len(falhas) + 1 == len(processos):
+            # A única configuração que terminou parou sem provar o resultado
+            nome, resultado, segundos = inconclusivo
+        else:
+            nome, segundos = None, None
+            resultado = {'status': 'limite_tempo', 'z': None, 'x': None, 'folgas': None, 'iteracoes': None}
+
+        resultado = {**resultado, 'configuracao': nome, 'tempo': tempo,
+                     'tempo_resolucao': segundos, 'falhas': falhas}
+        if self.registro is not None:
+            self._registrar(c, A, b, resultado)
+        return resultado
+
+    def _registrar(self, c, A, b, resultado):
+        """Acrescenta a corrida ao registro (uma linha JSON)."""
+        linha = {
+            'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'chave': chave_problema(c, A, b),
+            'restricoes': int(b.size),
+            'variaveis': int(c.size),
+            'densidade': float(np.count_nonzero(A) / A.size) if A.size else 0.0,
+            'configuracoes': [configuracao['nome'] for configuracao in self.configuracoes],
+            'vencedor': resultado['configuracao'],
+            'status': resultado['status'],
+            'tempo': resultado['tempo'],
+            'tempo_resolucao': resultado['tempo_resolucao'],
+            'iteracoes': resultado['iteracoes'],
+            'falhas': resultado['falhas'],
+        }
+        diretorio = os.path.dirname(os.path.abspath(self.registro))
+        os.makedirs(diretorio, exist_ok=True)
+        # Uma única escrita em modo append: linhas de processos diferentes não se misturam
+        with open(self.registro, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(json.dumps(linha, ensure_ascii=False) + '\n')
+
+
+def resumir_registro(caminho=REGISTRO_PADRAO):
+    """
+    Agrega o registro do portfólio por configuração vencedora.
+
+    Returns:
+        lista de dicionários com 'configuracao', 'vitorias', 'fracao' e
+        'tempo_medio' (segundos de resolução), da mais vitoriosa para a menos
+    """
+    vitorias = defaultdict(list)
+    total = 0
+    with open(caminho, encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            if not linha.strip():
+                continue
+            corrida = json.loads(linha)
+            total += 1
+            if corrida['vencedor'] is not None:
+                vitorias[corrida['vencedor']].append(corrida['tempo_resolucao'])
+
+    resumo = [{'configuracao': nome, 'vitorias': len(tempos), 'fracao': len(tempos) / total,
+               'tempo_medio': float(np.mean(tempos))}
+              for nome, tempos in vitorias.items()]
+    return sorted(resumo, key=lambda item: -item['vitorias'])
+
+
+def gerar_problema(restricoes, variaveis, semente=0):
+    """Problema esparso aleatório de maximização com coeficientes em escalas variadas."""
+    rng = np.random.default_rng(semente)
+    A = rng.uniform(1.0, 10.0, size=(restricoes, variaveis)) * (rng.random((restricoes, variaveis)) < 0.3)
+    A *= 10.0 ** rng.integers(-2, 3, size=restricoes)[:, np.newaxis]
+    b = A.sum(axis=1) * rng.uniform(0.2, 0.8, size=restricoes) + 1.0
+    c = -rng.uniform(1.0, 20.0, size=variaveis)
+    return c, A, b
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Portfólio de configurações do Simplex Tabulado")
+    parser.add_argument('--tamanho', type=int, default=200, help="restrições do problema aleatório")
+    parser.add_argument('--variaveis', type=int, default=None, help="variáveis (padrão: 2 x tamanho)")
+    parser.add_argument('--semente', type=int, default=0, help="semente do problema aleatório")
+    parser.add_argument('--tempo-limite', type=float, default=None, help="segundos até desistir")
+    parser.add_argument('--registro', default=REGISTRO_PADRAO, help="arquivo .jsonl das corridas")
+    parser.add_argument('--resumo', action='store_true', help="apenas resume o registro")
+    args = parser.parse_args()
+
+    if args.resumo:
+        if not os.path.exists(args.registro):
+            print(f"Registro vazio ({args.registro} não existe).")
+            return
+        linhas = [[item['configuracao'], item['vitorias'], f"{100 * item['fracao']:.1f}%",
+                   f"{1000 * item['tempo_medio']:.1f}"]
+                  for item in resumir_registro(args.registro)]
+        print(tabulate(linhas, headers=["Configuração", "Vitórias", "Fração", "Tempo médio (ms)"],
+                       tablefmt="grid", stralign="center"))
+        return
+
+    print("\n==== PORTFÓLIO DO SIMPLEX TABULADO ====\n")
+    variaveis = args.variaveis or 2 * args.tamanho
+    c, A, b = gerar_problema(args.tamanho, variaveis, args.semente)
+    portfolio = Portfolio(tempo_limite=args.tempo_limite, registro=args.registro)
+    print(f"Problema {args.tamanho} x {variaveis}; configurações: "
+          + ", ".join(configuracao['nome'] for configuracao in portfolio.configuracoes))
+
+    resultado = portfolio.resolver(c, A, b)
+    print(f"\nVencedora: {resultado['configuracao']} ({resultado['status']})")
+    if resultado['z'] is not None:
+        print(f"Z = {resultado['z']:.4f} em {resultado['iteracoes']} iterações")
+    if resultado['tempo_resolucao'] is not None:
+        print(f"Tempo: {resultado['tempo']:.3f} s ({resultado['tempo_resolucao']:.3f} s de resolução)")
+    for nome, erro in resultado['falhas'].items():
+        print(f"Falha em {nome}: {erro}")
+    print(f"Registro: {args.registro}")
+
+
+if __name__ == "__main__":
+    main()
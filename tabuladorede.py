@@ -0,0 +1,372 @@
+"""
+Simplex de redes para problemas de transporte e de fluxo de custo mínimo.
+
+Quando cada coluna de A tem no máximo dois elementos não nulos, todos ±1, e
+as linhas podem ser multiplicadas por ±1 de modo que cada coluna fique com
+no máximo um +1 e um -1, A é a matriz de incidência nó-arco de um grafo
+dirigido. É o caso do transporte escrito só com restrições ≤ (ofertas e
+demandas como limites superiores): basta trocar o sinal das linhas dos
+destinos.
+
+Cada restrição vira um nó, cada variável um arco e cada folga um arco entre
+o nó e uma raiz, que fecha o balanço. A base é uma árvore geradora guardada
+em vetores (pai, arco do pai, profundidade e potenciais); cada pivô percorre
+apenas o ciclo formado pelo arco que entra e a subárvore que muda de lugar,
+em vez de atualizar uma tabela densa de (m + 1) x (n + m + 1). A regra de
+saída de Cunningham (último arco bloqueante a partir do ápice, numa árvore
+fortemente viável) evita ciclagem em pivôs degenerados.
+
+O resultado tem o mesmo formato de SimplexTabulado.obter_solucao().
+
+Uso:
+    sinais = detectar_rede(A)
+    if sinais is not None:
+        rede = SimplexRede(c, A, b, sinais)
+        solucao = rede.resolver()
+        print(rede.relatorio())
+"""
+import time
+from collections import deque
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from tabulate import tabulate
+
+from tabuladocore import SimplexTabulado
+
+
+def detectar_rede(A):
+    """
+    Verifica se A é (a menos do sinal das linhas) uma matriz de incidência nó-arco.
+
+    Procura sinais s_i = ±1 tais que, em diag(s) A, cada coluna tenha no
+    máximo um +1 e um -1 e nenhum outro elemento não nulo. As exigências
+    entre pares de linhas (mesmo sinal ou sinais opostos) formam um grafo
+    com dois nós por linha (s_i = +1 e s_i = -1); há solução se nenhuma
+    linha tem os dois nós na mesma componente.
+
+    Args:
+        A: matriz de restrições
+
+    Returns:
+        vetor de sinais (+1/-1 por linha) ou None se A não tem estrutura de rede
+    """
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    linhas, colunas = np.nonzero(A)
+    if np.any(np.abs(A[linhas, colunas]) != 1.0) or np.any(np.bincount(colunas, minlength=n) > 2):
+        return None
+
+    # Pares de linhas que dividem uma coluna (nonzero percorre A por linhas)
+    ordem = np.argsort(colunas, kind='stable')
+    linhas, colunas = linhas[ordem], colunas[ordem]
+    par = np.flatnonzero(colunas[1:] == colunas[:-1])
+    i, k = linhas[par], linhas[par + 1]
+    mesmo_sinal = A[i, colunas[par]] == A[k, colunas[par]]
+
+    # Nó i: "s_i = +1"; nó m + i: "s_i = -1". Elementos iguais exigem sinais opostos
+    destino = np.where(mesmo_sinal, m + k, k)
+    origens = np.concatenate([i, m + i])
+    destinos = np.concatenate([destino, (destino + m) % (2 * m)])
+    grafo = coo_matrix((np.ones(origens.size), (origens, destinos)), shape=(2 * m, 2 * m))
+    _, rotulos = connected_components(grafo, directed=False)
+    if np.any(rotulos[:m] == rotulos[m:]):
+        return None
+    return np.where(rotulos[:m] < rotulos[m:], 1.0, -1.0)
+
+
+class SimplexRede:
+    def __init__(self, c, A, b, sinais=None, tolerancia=1e-9):
+        """
+        Monta a rede do problema.
+
+        Args:
+            c, A, b: problema no formato do SimplexTabulado (maximização, c negativo)
+            sinais: sinais das linhas dados por detectar_rede (padrão: detectar)
+            tolerancia: tolerância dos custos reduzidos e dos fluxos
+
+        Levanta ValueError se A não tem estrutura de rede.
+        """
+        self.c = np.asarray(c, dtype=float)
+        self.A = np.asarray(A, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.num_restricoes, self.num_vars = self.A.shape
+        if sinais is None:
+            sinais = detectar_rede(self.A)
+            if sinais is None:
+                raise ValueError("A matriz A não é uma matriz de incidência de rede.")
+        self.sinais = np.asarray(sinais, dtype=float)
+        self.tolerancia = tolerancia
+
+        self.status = None
+        self.pivos = 0
+        self.pivos_degenerados = 0
+        self.tempo = 0.0
+        self._montar_rede()
+
+    def _montar_rede(self):
+        """Cria nós, arcos (variáveis, folgas e artificiais) e a árvore inicial."""
+        n, m = self.num_vars, self.num_restricoes
+        raiz = m
+        self.num_nos = m + 1
+
+        # Arcos das variáveis: sai do nó com +1 e entra no nó com -1 (ou na raiz)
+        T = self.sinais[:, np.newaxis] * self.A
+        tem_saida = np.any(T > 0, axis=0)
+        tem_entrada = np.any(T < 0, axis=0)
+        caudas = [np.where(tem_saida, np.argmax(T > 0, axis=0), raiz)]
+        cabecas = [np.where(tem_entrada, np.argmax(T < 0, axis=0), raiz)]
+        custos = [self.c]
+
+        # Folga f_i: nó -> raiz se s_i = +1, raiz -> nó se s_i = -1
+        nos = np.arange(m)
+        positivo = self.sinais > 0
+        caudas.append(np.where(positivo, nos, raiz))
+        cabecas.append(np.where(positivo, raiz, nos))
+        custos.append(np.zeros(m))
+
+        # Oferta de cada nó (a raiz fecha o balanço)
+        self.oferta = np.append(self.sinais * self.b, 0.0)
+        self.oferta[raiz] = -self.oferta[:m].sum()
+
+        # Árvore inicial fortemente viável: a folga, se tem fluxo positivo ou
+        # aponta para a raiz; senão um arco artificial de custo alto
+        folga_na_arvore = np.where(positivo, self.b >= 0, self.b > 0)
+        artificiais = np.flatnonzero(~folga_na_arvore)
+        para_raiz = self.oferta[artificiais] >= 0
+        caudas.append(np.where(para_raiz, artificiais, raiz))
+        cabecas.append(np.where(para_raiz, raiz, artificiais))
+        self.custo_artificial = 1.0 + 2.0 * np.abs(self.c).sum()
+        custos.append(np.full(artificiais.size, self.custo_artificial))
+
+        self.cauda = np.concatenate(caudas).astype(np.intp)
+        self.cabeca = np.concatenate(cabecas).astype(np.intp)
+        self.custo = np.concatenate(custos)
+        self.primeiro_artificial = n + m
+        num_arcos = self.cauda.size
+
+        arco_no = np.empty(m, dtype=np.intp)
+        arco_no[folga_na_arvore] = n + np.flatnonzero(folga_na_arvore)
+        arco_no[artificiais] = n + m + np.arange(artificiais.size)
+
+        self.fluxo = np.zeros(num_arcos)
+        self.fluxo[arco_no] = np.abs(self.oferta[:m])
+        self.pai = np.append(np.full(m, raiz), -1).astype(np.intp)
+        self.arco_pai = np.append(arco_no, -1).astype(np.intp)
+        self.profundidade = np.append(np.ones(m, dtype=np.intp), 0)
+        self.adjacentes = [{int(arco)} for arco in arco_no] + [set(int(arco) for arco in arco_no)]
+
+        # Potenciais: custo reduzido c - pi_cauda + pi_cabeca nulo nos arcos da árvore
+        self.potencial = np.zeros(self.num_nos)
+        self.potencial[:m] = np.where(self.cauda[arco_no] == raiz, -1.0, 1.0) * self.custo[arco_no]
+
+    def _ciclo(self, entrada):
+        """
+        Ciclo do arco que entra, orientado no sentido do arco e começando no ápice.
+
+        Returns:
+            lista de (arco, para_frente, lado) na ordem do percurso; lado é o
+            extremo do arco que entra (0: cauda, 1: cabeça) cujo caminho contém o arco
+        """
+        u, v = self.cauda[entrada], self.cabeca[entrada]
+        caminho_u, caminho_v = [], []
+        while u != v:
+            if self.profundidade[u] >= self.profundidade[v]:
+                caminho_u.append(u)
+                u = self.pai[u]
+            else:
+                caminho_v.append(v)
+                v = self.pai[v]
+
+        # Do ápice até a cauda (descendo), o arco que entra, da cabeça até o ápice (subindo)
+        ciclo = [(self.arco_pai[no], self.cauda[self.arco_pai[no]] == self.pai[no], 0)
+                 for no in reversed(caminho_u)]
+        ciclo.append((entrada, True, None))
+        ciclo.extend((self.arco_pai[no], self.cauda[self.arco_pai[no]] == no, 1) for no in caminho_v)
+        return ciclo
+
+    def _pendurar(self, no, pai, arco):
+        """Refaz pai, profundidade e potenciais da subárvore de `no`, agora ligada a `pai` por `arco`."""
+        fila = deque([(no, pai, arco)])
+        while fila:
+            no, pai, arco = fila.popleft()
+            self.pai[no] = pai
+            self.arco_pai[no] = arco
+            self.profundidade[no] = self.profundidade[pai] + 1
+            if self.cauda[arco] == pai:
+                self.potencial[no] = self.potencial[pai] - self.custo[arco]
+            else:
+                self.potencial[no] = self.potencial[pai] + self.custo[arco]
+            for vizinho in self.adjacentes[no]:
+                if vizinho != arco:
+                    outro = self.cabeca[vizinho] if self.cauda[vizinho] == no else self.cauda[vizinho]
+                    fila.append((outro, no, vizinho))
+
+    def _pivotar(self, entrada):
+        """Faz o pivô do arco que entra. Retorna False se o ciclo não tem arco bloqueante (ilimitado)."""
+        ciclo = self._ciclo(entrada)
+        contrarios = [arco for arco, para_frente, _ in ciclo if not para_frente]
+        if not contrarios:
+            return False
+        delta = self.fluxo[contrarios].min()
+
+        # Cunningham: o último arco bloqueante no percurso a partir do ápice
+        limite = delta + self.tolerancia * max(1.0, delta)
+        saida, lado = next((arco, lado) for arco, para_frente, lado in reversed(ciclo)
+                           if not para_frente and self.fluxo[arco] <= limite)
+
+        for arco, para_frente, _ in ciclo:
+            self.fluxo[arco] += delta if para_frente else -delta
+        self.fluxo[saida] = 0.0
+        self.pivos += 1
+        if delta == 0.0:
+            self.pivos_degenerados += 1
+
+        # Trocar os arcos da árvore e pendurar a subárvore separada no outro extremo
+        for extremo in (self.cauda[saida], self.cabeca[saida]):
+            self.adjacentes[extremo].discard(saida)
+        u, v = self.cauda[entrada], self.cabeca[entrada]
+        self.adjacentes[u].add(entrada)
+        self.adjacentes[v].add(entrada)
+        if lado == 0:
+            self._pendurar(u, v, entrada)
+        else:
+            self._pendurar(v, u, entrada)
+        return True
+
+    def _artificiais_vazios(self):
+        """True se nenhum arco artificial tem fluxo (a solução atual é viável)."""
+        artificial = self.fluxo[self.primeiro_artificial:].max(initial=0.0)
+        return artificial <= self.tolerancia * max(1.0, np.abs(self.b).max(initial=0.0))
+
+    def _classificar_ilimitado(self):
+        """
+        Classifica um ciclo sem arco bloqueante.
+
+        Com arcos artificiais ainda com fluxo, o ciclo de custo negativo não
+        prova que o problema é ilimitado: ele pode ser inviável. Nesse caso a
+        viabilidade é decidida resolvendo a mesma rede com custo zero.
+        """
+        if self._artificiais_vazios():
+            return 'ilimitado'
+        viabilidade = SimplexRede(np.zeros(self.num_vars), self.A, self.b, self.sinais, self.tolerancia)
+        return 'ilimitado' if viabilidade.resolver()['status'] == 'otimo' else 'inviavel'
+
+    def resolver(self):
+        """
+        Executa o simplex de redes (custo reduzido mais negativo entra).
+
+        Returns:
+            dicionário no formato de SimplexTabulado.obter_solucao()
+        """
+        inicio = time.perf_counter()
+        escala = max(1.0, np.abs(self.c).max(initial=0.0))
+        while True:
+            custos_reduzidos = self.custo - self.potencial[self.cauda] + self.potencial[self.cabeca]
+            entrada = int(np.argmin(custos_reduzidos))
+            if custos_reduzidos[entrada] >= -self.tolerancia * escala:
+                self.status = 'otimo' if self._artificiais_vazios() else 'inviavel'
+                break
+            if not self._pivotar(entrada):
+                self.status = self._classificar_ilimitado()
+                break
+        self.tempo = time.perf_counter() - inicio
+        return self.obter_solucao()
+
+    def obter_solucao(self):
+        """
+        Retorna a solução no formato de SimplexTabulado.obter_solucao().
+
+        Returns:
+            dicionário com 'status', 'z', 'x', 'folgas' e 'iteracoes' (pivôs)
+        """
+        n, m = self.num_vars, self.num_restricoes
+        x = self.fluxo[:n].copy()
+        return {
+            'status': self.status,
+            'z': -self.c @ x,
+            'x': x,
+            'folgas': self.fluxo[n:n + m].copy(),
+            'iteracoes': self.pivos,
+        }
+
+    def precos_sombra(self):
+        """Variação de Z por unidade de cada b_i, lida dos potenciais dos nós."""
+        return -self.sinais * self.potencial[:self.num_restricoes]
+
+    def mostrar_solucao(self):
+        """Exibe a solução final."""
+        solucao = self.obter_solucao()
+
+        print("\n===== Resultado Final =====")
+        print("Função Objetivo (Z) =", solucao['z'])
+        print("\nVariáveis de Decisão:")
+        for i, val in enumerate(solucao['x']):
+            print(f"x{i+1} = {val:.2f}")
+
+        print("\nVariáveis de Folga:")
+        for i, val in enumerate(solucao['folgas']):
+            print(f"f{i+1} = {val:.2f}")
+
+    def relatorio(self):
+        """Retorna o tamanho da rede e as estatísticas da resolução em texto."""
+        linhas = [
+            ["Nós (restrições + raiz)", self.num_nos],
+            ["Arcos (variáveis + folgas)", self.num_vars + self.num_restricoes],
+            ["Arcos artificiais", self.cauda.size - self.primeiro_artificial],
+            ["Pivôs", self.pivos],
+            ["Pivôs degenerados", self.pivos_degenerados],
+            ["Tempo (s)", f"{self.tempo:.4f}"],
+        ]
+        return tabulate(linhas, tablefmt="grid") + f"\n\nStatus: {self.status}"
+
+
+def resolver_automatico(c, A, b):
+    """
+    Resolve pelo simplex de redes se A tem estrutura de rede, senão pelo SimplexTabulado.
+
+    Returns:
+        (solucao, motor): solucao no formato de obter_solucao() e motor
+        'rede' ou 'tabulado'
+    """
+    sinais = detectar_rede(A)
+    if sinais is not None:
+        return SimplexRede(c, A, b, sinais).resolver(), 'rede'
+    return SimplexTabulado(c, A, b).resolver_silencioso(), 'tabulado'
+
+
+def main():
+    print("\n==== SIMPLEX DE REDES - TRANSPORTE ====\n")
+
+    # 3 fábricas e 4 lojas: lucro por unidade enviada, ofertas e demandas como limites
+    lucros = np.array([
+        [12, 9, 7, 14],
+        [8, 11, 13, 6],
+        [10, 7, 9, 12]
+    ], dtype=float)
+    ofertas = np.array([120, 80, 100], dtype=float)
+    demandas = np.array([70, 90, 60, 110], dtype=float)
+
+    # Variável x_ij na coluna 4*i + j
+    origens, destinos = lucros.shape
+    A = np.vstack([np.kron(np.eye(origens), np.ones(destinos)),
+                   np.kron(np.ones(origens), np.eye(destinos))])
+    b = np.concatenate([ofertas, demandas])
+    c = -lucros.ravel()  # Negativo para maximização
+
+    sinais = detectar_rede(A)
+    print("Sinais das linhas (fábricas, lojas):", sinais)
+
+    rede = SimplexRede(c, A, b, sinais)
+    rede.resolver()
+    print(rede.relatorio())
+    rede.mostrar_solucao()
+
+    # Conferência com o simplex tabulado
+    tabulado = SimplexTabulado(c, A, b).resolver_silencioso()
+    print(f"\nSimplex tabulado: Z = {tabulado['z']:.2f} em {tabulado['iteracoes']} pivôs")
+
+
+if __name__ == "__main__":
+    main()
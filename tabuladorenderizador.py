@@ -0,0 +1,136 @@
+"""
+Renderizador rápido da tabela do simplex para o terminal.
+
+Formata a tabela inteira de uma vez com np.char (em vez de uma f-string por
+célula), marca a linha e a coluna do pivô com máscaras e centraliza cada
+coluna com larguras calculadas previamente. O resultado tem o mesmo visual
+"grid" do tabulate.
+
+Tabelas largas podem ser exibidas numa janela: apenas a coluna do pivô,
+algumas vizinhas e a coluna Constante (as colunas omitidas aparecem como
+"..."), o que mantém a tabela legível e o tempo de exibição proporcional à
+janela, não ao número de variáveis.
+
+Uso:
+    print(renderizar_tabela(simplex, col_pivo=2, row_pivo=0, janela=3))
+"""
+import numpy as np
+
+# Com janela='auto', tabelas com mais colunas de variáveis que isso usam janela
+COLUNAS_SEM_JANELA = 16
+
+# Vizinhas de cada lado da coluna do pivô na janela automática
+VIZINHAS_PADRAO = 3
+
+OMITIDAS = '...'
+
+
+def colunas_da_janela(num_colunas, col_pivo, vizinhas):
+    """
+    Índices das colunas de variáveis exibidas na janela (a Constante é sempre exibida).
+
+    Args:
+        num_colunas: número de colunas de variáveis (decisão + folgas)
+        col_pivo: coluna central da janela (None: começo da tabela)
+        vizinhas: colunas exibidas de cada lado da central
+
+    Returns:
+        vetor crescente de índices
+    """
+    centro = 0 if col_pivo is None else col_pivo
+    inicio = max(0, min(centro - vizinhas, num_colunas - 2 * vizinhas - 1))
+    return np.arange(inicio, min(num_colunas, inicio + 2 * vizinhas + 1))
+
+
+def renderizar_tabela(simplex, col_pivo=None, row_pivo=None, janela='auto', marcar=True,
+                      mostrar_divisao=None, casas=2):
+    """
+    Formata a tabela do simplex em texto no formato grid.
+
+    Args:
+        simplex: SimplexTabulado (usa tabela, base e nome_variavel)
+        col_pivo, row_pivo: pivô a destacar (None: sem destaque)
+        janela: vizinhas de cada lado da coluna do pivô, None para todas as
+            colunas ou 'auto' (janela só se houver mais de COLUNAS_SEM_JANELA)
+        marcar: marca com * a linha e a coluna do pivô e com ★ o elemento pivô
+        mostrar_divisao: inclui a coluna Divisão (teste da razão); None: apenas
+            com pivô do simplex primal
+        casas: casas decimais
+
+    Returns:
+        texto da tabela
+    """
+    tabela = simplex.tabela
+    num_linhas = tabela.shape[0] - 1
+    num_colunas = tabela.shape[1] - 1
+    if mostrar_divisao is None:
+        mostrar_divisao = col_pivo is not None and simplex.algoritmo_atual != 'dual'
+    if janela == 'auto':
+        janela = VIZINHAS_PADRAO if num_colunas > COLUNAS_SEM_JANELA else None
+
+    # Colunas exibidas: variáveis (todas ou a janela) e a Constante
+    if janela is None:
+        visiveis = np.arange(num_colunas)
+    else:
+        visiveis = colunas_da_janela(num_colunas, col_pivo, janela)
+    indices = np.append(visiveis, num_colunas)
+
+    # Valores com a linha Z primeiro, formatados de uma vez
+    ordem_linhas = np.append(num_linhas, np.arange(num_linhas))
+    celulas = np.char.mod(f'%.{casas}f', tabela[np.ix_(ordem_linhas, indices)])
+
+    nomes = np.array([simplex.nome_variavel(j) for j in visiveis] + ['Constante'], dtype=object)
+    nomes_base = np.array(['Z'] + [simplex.nome_variavel(j) for j in simplex.base], dtype=object)
+    numeros = np.char.mod('%d', np.arange(1, num_linhas + 2))
+
+    # Marcas do pivô (linha da tabela i aparece na posição i + 1, depois da linha Z)
+    if marcar and (col_pivo is not None or row_pivo is not None):
+        sufixos = np.full(celulas.shape, '', dtype='<U1')
+        posicao_coluna = np.flatnonzero(indices == col_pivo) if col_pivo is not None else []
+        if row_pivo is not None:
+            sufixos[row_pivo + 1] = '*'
+            nomes_base[row_pivo + 1] += '*'
+            numeros = numeros.astype(object)
+            numeros[row_pivo + 1] += '*'
+        if len(posicao_coluna):
+            sufixos[:, posicao_coluna[0]] = '*'
+            nomes[posicao_coluna[0]] += '*'
+            if row_pivo is not None:
+                sufixos[row_pivo + 1, posicao_coluna[0]] = '★'
+        celulas = np.char.add(celulas, sufixos)
+
+    colunas = [nomes_base.astype(str), np.asarray(numeros, dtype=str),
+               np.array(['1'] + ['0'] * num_linhas)]
+    cabecalho = ['Variaveis', 'N de linha', 'Z']
+
+    # Colunas omitidas antes de cada trecho não contíguo da janela
+    lacunas = np.flatnonzero(np.diff(np.concatenate([[-1], visiveis, [num_colunas]])) > 1)
+    for posicao in range(indices.size):
+        if posicao in lacunas:
+            colunas.append(np.full(num_linhas + 1, OMITIDAS))
+            cabecalho.append(OMITIDAS)
+        colunas.append(celulas[:, posicao])
+        cabecalho.append(str(nomes[posicao]))
+
+    if mostrar_divisao and col_pivo is not None:
+        coluna_pivo = tabela[:-1, col_pivo]
+        positivos = coluna_pivo > 0
+        razoes = np.divide(tabela[:-1, -1], coluna_pivo, out=np.zeros(num_linhas), where=positivos)
+        divisao = np.where(positivos, np.char.mod(f'%.{casas}f', razoes), '--').astype(object)
+        if marcar and row_pivo is not None and positivos[row_pivo]:
+            divisao[row_pivo] += '★'
+        colunas.append(np.concatenate([[''], divisao.astype(str)]))
+        cabecalho.append('Divisão')
+
+    # Larguras calculadas uma vez por coluna; centralização vetorizada
+    grade = np.vstack([np.array(cabecalho)[np.newaxis, :], np.column_stack(colunas)])
+    larguras = np.char.str_len(grade).max(axis=0)
+    grade = np.char.center(grade, larguras)
+
+    separador = '+' + '+'.join('-' * (largura + 2) for largura in larguras) + '+'
+    separador_cabecalho = separador.replace('-', '=')
+    linhas = ['| ' + ' | '.join(linha) + ' |' for linha in grade.tolist()]
+    texto = [separador, linhas[0], separador_cabecalho]
+    for linha in linhas[1:]:
+        texto.extend([linha, separador])
+    return '\n'.join(texto)
@@ -0,0 +1,411 @@
+"""
+Serviço HTTP/JSON local para o Simplex Tabulado.
+
+Servidor asyncio sem dependências externas. As requisições que chegam dentro
+de uma janela curta são agrupadas em lotes, e cada lote é resolvido num pool
+de processos, de modo que o laço de eventos nunca fica bloqueado pelo
+cálculo. A fila de espera é limitada: quando está cheia o servidor responde
+503 em vez de acumular trabalho. Problemas repetidos são respondidos pelo
+cache de soluções (tabuladocache), sem passar pelo pool.
+
+Rotas:
+    POST /resolver   corpo {"c": [...], "A": [[...]], "b": [...], "algoritmo": "auto"}
+                     e, opcionalmente, "tempo_limite" (s), "max_iteracoes" e "objetivo_alvo"
+                     resposta {"status", "z", "x", "folgas", "iteracoes", "viavel", "limitante"}
+    GET  /metricas   contadores, tamanho da fila, lotes e percentis de latência
+
+Uso:
+    python tabuladoservidor.py --porta 8080 --processos 4
+    curl -X POST localhost:8080/resolver -d '{"c": [-40, -30, -20], "A": [[2, 5, 10], [2, 5, 1], [4, 2, 2]], "b": [900, 400, 600]}'
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from tabuladocache import cache_compartilhado, chave_problema, entrada_de
+from tabuladocore import SimplexTabulado
+
+# Limites opcionais da resolução aceitos no corpo de /resolver
+LIMITES = ('tempo_limite', 'max_iteracoes', 'objetivo_alvo')
+
+# Segundos máximos de cada resolução: um problema patológico não prende um processo do pool
+TEMPO_LIMITE_PADRAO = 60.0
+
+# Status de resoluções completas (as paradas por limite não vão para o cache)
+STATUS_COMPLETOS = ('otimo', 'ilimitado', 'inviavel')
+
+MOTIVOS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class ErroHTTP(Exception):
+    """Requisição que deve ser respondida com o código HTTP `codigo`."""
+    def __init__(self, codigo, mensagem):
+        super().__init__(mensagem)
+        self.codigo = codigo
+
+
+def resolver_problema(problema):
+    """Resolve um problema {'c', 'A', 'b', 'algoritmo', limites} e retorna a entrada de cache do resultado."""
+    c = np.asarray(problema['c'], dtype=float)
+    A = np.asarray(problema['A'], dtype=float).reshape(len(problema['b']), c.size)
+    b = np.asarray(problema['b'], dtype=float)
+    limites = {nome: problema[nome] for nome in LIMITES if problema.get(nome) is not None}
+    simplex = SimplexTabulado(c, A, b, algoritmo=problema.get('algoritmo', 'auto'), **limites)
+    simplex.resolver_silencioso()
+    return entrada_de(simplex)
+
+
+def resposta_json(solucao):
+    """Converte o resultado de obter_solucao() para tipos JSON."""
+    return {
+        'status': solucao['status'],
+        'z': float(solucao['z']),
+        'x': solucao['x'].tolist(),
+        'folgas': solucao['folgas'].tolist(),
+        'iteracoes': solucao['iteracoes'],
+        'viavel': solucao.get('viavel', solucao['status'] == 'otimo'),
+        'limitante': solucao.get('limitante'),
+    }
+
+
+def resolver_lote(problemas):
+    """Resolve um lote de problemas (executado nos processos do pool)."""
+    respostas = []
+    for problema in problemas:
+        try:
+            respostas.append(resolver_problema(problema))
+        except (ValueError, KeyError, TypeError) as erro:
+            respostas.append({'erro': str(erro)})
+        except Exception as erro:
+            # Falha interna: fica só na resposta deste problema (500); os demais do lote seguem
+            respostas.append({'erro': f"{type(erro).__name__}: {erro}", 'codigo': 500})
+    return respostas
+
+
+def validar_problema(dados):
+    """Verifica a forma do corpo de /resolver. Levanta ValueError com a mensagem de erro."""
+    if not isinstance(dados, dict) or not all(chave in dados for chave in ('c', 'A', 'b')):
+        raise ValueError("O corpo deve ser um objeto com 'c', 'A' e 'b'.")
+    try:
+        c = np.asarray(dados['c'], dtype=float)
+        A = np.asarray(dados['A'], dtype=float)
+        b = np.asarray(dados['b'], dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError("'c', 'A' e 'b' devem conter apenas números.")
+    if c.ndim != 1 or b.ndim != 1 or A.shape != (b.size, c.size):
+        raise ValueError(f"Dimensões incompatíveis: c {c.shape}, A {A.shape}, b {b.shape}.")
+    # json.loads aceita NaN e Infinity, com os quais o simplex pivota sem fim
+    if not (np.isfinite(c).all() and np.isfinite(A).all() and np.isfinite(b).all()):
+        raise ValueError("'c', 'A' e 'b' devem conter apenas números finitos.")
+    if dados.get('algoritmo', 'auto') not in ('auto', 'primal', 'dual'):
+        raise ValueError("'algoritmo' deve ser 'auto', 'primal' ou 'dual'.")
+    for nome in LIMITES:
+        valor = dados.get(nome)
+        if valor is not None and (isinstance(valor, bool) or not isinstance(valor, (int, float))
+                                  or not np.isfinite(valor)):
+            raise ValueError(f"'{nome}' deve ser um número finito.")
+    max_iteracoes = dados.get('max_iteracoes')
+    if max_iteracoes is not None and (max_iteracoes < 0 or max_iteracoes != int(max_iteracoes)):
+        raise ValueError("'max_iteracoes' deve ser um inteiro não negativo.")
+
+
+class ServidorSimplex:
+    def __init__(self, host='127.0.0.1', porta=8080, processos=None, janela=0.005,
+                 tamanho_lote=32, max_fila=256, max_corpo=10 * 1024 * 1024, amostras_latencia=10000,
+                 cache=None, tempo_limite=TEMPO_LIMITE_PADRAO):
+        """
+        Configura o servidor.
+
+        Args:
+            host, porta: endereço de escuta (padrão: apenas localhost)
+            processos: processos do pool de resolução (padrão: número de CPUs)
+            janela: tempo (s) de espera por mais requisições antes de enviar um lote
+            tamanho_lote: número máximo de problemas por lote
+            max_fila: requisições aguardando lote; acima disso responde 503
+            max_corpo: tamanho máximo do corpo em bytes; acima disso responde 413
+            amostras_latencia: latências recentes usadas nos percentis
+            cache: CacheSolucoes consultado antes de enfileirar (None: sem cache)
+            tempo_limite: segundos máximos de cada resolução; o 'tempo_limite' da
+                requisição só pode reduzi-lo (None: sem limite)
+        """
+        self.host = host
+        self.porta = porta
+        self.processos = processos or os.cpu_count() or 1
+        self.janela = janela
+        self.tamanho_lote = tamanho_lote
+        self.max_fila = max_fila
+        self.max_corpo = max_corpo
+        self.cache = cache
+        self.tempo_limite = tempo_limite
+
+        self.fila = None
+        self.executor = None
+        self.servidor = None
+        self._tarefa_lotes = None
+        self._vagas_lotes = None
+        self.lotes_em_execucao = 0
+        self.problemas_em_lotes = 0
+
+        # Métricas
+        self.latencias = deque(maxlen=amostras_latencia)
+        self.contadores = {'requisicoes': 0, 'resolvidas': 0, 'rejeitadas': 0, 'erros': 0, 'lotes': 0}
+        self.inicio = None
+
+    async def iniciar(self):
+        """Abre o socket, o pool de processos e a tarefa que forma os lotes."""
+        self.fila = asyncio.Queue(self.max_fila)
+        self._vagas_lotes = asyncio.Semaphore(self.processos)
+        # Processos criados por fork herdariam os sockets das conexões abertas
+        # (e a conexão não fecharia); o forkserver parte de um processo limpo
+        metodos = multiprocessing.get_all_start_methods()
+        contexto = multiprocessing.get_context('forkserver' if 'forkserver' in metodos else 'spawn')
+        self.executor = ProcessPoolExecutor(self.processos, mp_context=contexto)
+        self._tarefa_lotes = asyncio.create_task(self._formar_lotes())
+        self.servidor = await asyncio.start_server(self._atender_conexao, self.host, self.porta)
+        self.porta = self.servidor.sockets[0].getsockname()[1]
+        self.inicio = time.perf_counter()
+
+    async def encerrar(self):
+        """Para de aceitar conexões e libera o pool."""
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        if self._tarefa_lotes is not None:
+            self._tarefa_lotes.cancel()
+        if self.executor is not None:
+            # A espera pelos lotes em execução fica numa thread, fora do laço de eventos
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(self.executor.shutdown, cancel_futures=True))
+
+    async def executar(self):
+        """Inicia o servidor e atende até ser interrompido."""
+        await self.iniciar()
+        print(f"Servidor do Simplex Tabulado em http://{self.host}:{self.porta} "
+              f"({self.processos} processos, janela de {self.janela * 1e3:.1f} ms)")
+        try:
+            await self.servidor.serve_forever()
+        finally:
+            await self.encerrar()
+
+    # -----------------------------------------------------------------------
+    # Lotes
+    # -----------------------------------------------------------------------
+
+    async def _formar_lotes(self):
+        """Agrupa as requisições que chegam dentro da janela e envia cada lote ao pool."""
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self.fila.get()]
+            prazo = loop.time() + self.janela
+            while len(lote) < self.tamanho_lote:
+                restante = prazo - loop.time()
+                if restante <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self.fila.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+
+            # No máximo um lote por processo; os demais esperam na fila (contrapressão)
+            await self._vagas_lotes.acquire()
+            self.lotes_em_execucao += 1
+            asyncio.create_task(self._executar_lote(lote))
+
+    async def _executar_lote(self, lote):
+        loop = asyncio.get_running_loop()
+        try:
+            respostas = await loop.run_in_executor(self.executor, resolver_lote,
+                                                   [problema for problema, _ in lote])
+            self.contadores['lotes'] += 1
+            self.problemas_em_lotes += len(lote)
+            for (_, futuro), resposta in zip(lote, respostas):
+                if not futuro.done():
+                    futuro.set_result(resposta)
+        except Exception as erro:
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(erro)
+        finally:
+            self.lotes_em_execucao -= 1
+            self._vagas_lotes.release()
+
+    # -----------------------------------------------------------------------
+    # HTTP
+    # -----------------------------------------------------------------------
+
+    async def _atender_conexao(self, leitor, escritor):
+        """Atende as requisições de uma conexão (HTTP/1.1 com keep-alive)."""
+        try:
+            while True:
+                requisicao = await self._ler_requisicao(leitor)
+                if requisicao is None:
+                    break
+                metodo, caminho, cabecalhos, corpo = requisicao
+                codigo, resposta = await self._rotear(metodo, caminho, corpo)
+                manter = cabecalhos.get('connection', '').lower() != 'close'
+                self._escrever_resposta(escritor, codigo, resposta, manter)
+                await escritor.drain()
+                if not manter:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ErroHTTP as erro:
+            # Requisição malformada ou corpo grande demais: responder e fechar
+            self._escrever_resposta(escritor, erro.codigo, {'erro': str(erro)}, False)
+        finally:
+            escritor.close()
+
+    async def _ler_requisicao(self, leitor):
+        """Lê linha de requisição, cabeçalhos e corpo. Retorna None no fim da conexão."""
+        linha = await leitor.readline()
+        if not linha:
+            return None
+        partes = linha.decode('latin-1').split()
+        if len(partes) != 3:
+            raise ErroHTTP(400, "Linha de requisição malformada.")
+        metodo, caminho, _ = partes
+
+        cabecalhos = {}
+        while True:
+            linha = await leitor.readline()
+            if linha in (b'\r\n', b'\n', b''):
+                break
+            nome, _, valor = linha.decode('latin-1').partition(':')
+            cabecalhos[nome.strip().lower()] = valor.strip()
+
+        try:
+            tamanho = int(cabecalhos.get('content-length', 0))
+        except ValueError:
+            raise ErroHTTP(400, "Content-Length inválido.")
+        if tamanho > self.max_corpo:
+            raise ErroHTTP(413, f"Corpo grande demais ({tamanho} bytes; máximo {self.max_corpo}).")
+        corpo = await leitor.readexactly(tamanho) if tamanho else b''
+        return metodo, caminho, cabecalhos, corpo
+
+    def _escrever_resposta(self, escritor, codigo, dados, manter):
+        corpo = json.dumps(dados).encode()
+        cabecalhos = [f"HTTP/1.1 {codigo} {MOTIVOS[codigo]}",
+                      "Content-Type: application/json",
+                      f"Content-Length: {len(corpo)}",
+                      f"Connection: {'keep-alive' if manter else 'close'}"]
+        if codigo == 503:
+            cabecalhos.append("Retry-After: 1")
+        escritor.write(("\r\n".join(cabecalhos) + "\r\n\r\n").encode() + corpo)
+
+    async def _rotear(self, metodo, caminho, corpo):
+        if caminho == '/metricas':
+            if metodo != 'GET':
+                return 405, {'erro': 'Use GET em /metricas.'}
+            return 200, self.metricas()
+        if caminho == '/resolver':
+            if metodo != 'POST':
+                return 405, {'erro': 'Use POST em /resolver.'}
+            return await self._resolver(corpo)
+        return 404, {'erro': f'Rota desconhecida: {caminho}'}
+
+    async def _resolver(self, corpo):
+        inicio = time.perf_counter()
+        self.contadores['requisicoes'] += 1
+        try:
+            problema = json.loads(corpo)
+            validar_problema(problema)
+        except ValueError as erro:
+            self.contadores['erros'] += 1
+            return 400, {'erro': str(erro)}
+
+        # Problemas repetidos são respondidos do cache, sem passar pelo pool; com
+        # limites a resposta depende deles, e o cache (sem limites na chave) fica de fora
+        chave = None
+        if self.cache is not None and all(problema.get(nome) is None for nome in LIMITES):
+            chave = chave_problema(problema['c'], problema['A'], problema['b'],
+                                   algoritmo=problema.get('algoritmo', 'auto'))
+            entrada = self.cache.obter(chave)
+            if entrada is not None:
+                self.latencias.append(time.perf_counter() - inicio)
+                self.contadores['resolvidas'] += 1
+                return 200, resposta_json(entrada['solucao'])
+
+        if self.tempo_limite is not None:
+            pedido = problema.get('tempo_limite')
+            problema['tempo_limite'] = self.tempo_limite if pedido is None else min(pedido, self.tempo_limite)
+
+        futuro = asyncio.get_running_loop().create_future()
+        try:
+            self.fila.put_nowait((problema, futuro))
+        except asyncio.QueueFull:
+            self.contadores['rejeitadas'] += 1
+            return 503, {'erro': 'Fila cheia; tente novamente.'}
+
+        try:
+            entrada = await futuro
+        except Exception as erro:
+            self.contadores['erros'] += 1
+            return 500, {'erro': str(erro)}
+        self.latencias.append(time.perf_counter() - inicio)
+        if 'erro' in entrada:
+            self.contadores['erros'] += 1
+            return entrada.get('codigo', 400), {'erro': entrada['erro']}
+        if chave is not None and entrada['solucao']['status'] in STATUS_COMPLETOS:
+            self.cache.guardar(chave, entrada)
+        self.contadores['resolvidas'] += 1
+        return 200, resposta_json(entrada['solucao'])
+
+    # -----------------------------------------------------------------------
+    # Métricas
+    # -----------------------------------------------------------------------
+
+    def metricas(self):
+        """Retorna contadores, profundidade da fila e percentis de latência (ms)."""
+        latencias = np.asarray(self.latencias) * 1e3
+        percentis = {}
+        if latencias.size:
+            p50, p90, p99 = np.percentile(latencias, [50, 90, 99])
+            percentis = {'p50': p50, 'p90': p90, 'p99': p99, 'max': latencias.max()}
+        tempo = time.perf_counter() - self.inicio if self.inicio is not None else 0.0
+        return {
+            **self.contadores,
+            'fila': self.fila.qsize() if self.fila is not None else 0,
+            'max_fila': self.max_fila,
+            'lotes_em_execucao': self.lotes_em_execucao,
+            'tamanho_medio_lote': self.problemas_em_lotes / self.contadores['lotes'] if self.contadores['lotes'] else None,
+            'latencia_ms': {nome: float(valor) for nome, valor in percentis.items()},
+            'vazao_por_segundo': self.contadores['resolvidas'] / tempo if tempo > 0 else None,
+            'processos': self.processos,
+            'cache': self.cache.estatisticas() if self.cache is not None else None,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço HTTP/JSON do Simplex Tabulado")
+    parser.add_argument('--host', default='127.0.0.1', help="endereço de escuta")
+    parser.add_argument('--porta', type=int, default=8080, help="porta de escuta")
+    parser.add_argument('--processos', type=int, help="processos do pool (padrão: número de CPUs)")
+    parser.add_argument('--janela-ms', type=float, default=5.0, help="janela de formação dos lotes em ms")
+    parser.add_argument('--tamanho-lote', type=int, default=32, help="problemas por lote")
+    parser.add_argument('--max-fila', type=int, default=256, help="requisições em espera antes de responder 503")
+    parser.add_argument('--sem-cache', action='store_true', help="não usar o cache de soluções compartilhado")
+    parser.add_argument('--tempo-limite', type=float, default=TEMPO_LIMITE_PADRAO,
+                        help="segundos máximos de cada resolução (0: sem limite)")
+    args = parser.parse_args()
+
+    servidor = ServidorSimplex(args.host, args.porta, args.processos, args.janela_ms / 1e3,
+                               args.tamanho_lote, args.max_fila,
+                               cache=None if args.sem_cache else cache_compartilhado(),
+                               tempo_limite=args.tempo_limite or None)
+    try:
+        asyncio.run(servidor.executar())
+    except KeyboardInterrupt:
+        print("\nServidor encerrado.")
+
+
+if __name__ == "__main__":
+    main()